@@ -11,30 +11,46 @@ This script compresses all HTML files in your PixelProdigyAI directory:
 • AI-optimized compression (typically 90-97%)
 • NFT-ready with hash signatures
 • Preserves full decompression capability
+• Minified HTML + pre-compressed .gz copies and a manifest for the web server
 """
 
 import os
+import sys
 import glob
+import time
 from pathlib import Path
-from eug_compression_system import EugCompressionSystem
+from eug_cache import CompressionCache
+from eug_compression_system import EugCompressionSystem, verification_summary
+from eug_static import build_static, STATIC_DIR, MANIFEST_NAME
+from eug_log import get_logger, progress, configure, cli_config, stdout_closed
+
+log = get_logger("batch")
 
 def main():
-    print("╔═══════════════════════════════════════════════════════════════════╗")
-    print("║          EUG BATCH COMPRESSION - HTML → PY Converter              ║")
-    print("║            AI Personality-Driven Crypto Compression               ║")
-    print("╚═══════════════════════════════════════════════════════════════════╝\n")
+    # --verbose / --quiet / --progress pick the output (see eug_log)
+    configure(*cli_config(sys.argv))
+    
+    log.info("╔═══════════════════════════════════════════════════════════════════╗")
+    log.info("║          EUG BATCH COMPRESSION - HTML → PY Converter              ║")
+    log.info("║            AI Personality-Driven Crypto Compression               ║")
+    log.info("╚═══════════════════════════════════════════════════════════════════╝\n")
+    
+    # --blocks[=KB] splits each .eug into independently decodable blocks
+    # (head, big scripts/styles, body text) with an index, for previews
+    blocks = next((int(arg.partition('=')[2] or 64) for arg in sys.argv[1:]
+                   if arg == '--blocks' or arg.startswith('--blocks=')), None)
     
     # Initialize compressor
-    compressor = EugCompressionSystem()
+    compressor = EugCompressionSystem(block_size=blocks * 1024 if blocks else None)
     
     # Find all HTML files
     html_files = glob.glob("*.html")
     
     if not html_files:
-        print("❌ No HTML files found in current directory")
+        log.warning("❌ No HTML files found in current directory")
         return
     
-    print(f"📁 Found {len(html_files)} HTML files to compress\n")
+    log.info(f"📁 Found {len(html_files)} HTML files to compress\n")
     
     # Priority files (compress these first)
     priority_files = [
@@ -47,38 +63,79 @@ def main():
     
     # Separate priority and regular files
     priority_html = [f for f in html_files if f in priority_files]
-    regular_html = [f for f in html_files if f not in priority_files]
+    regular_html = sorted(f for f in html_files if f not in priority_files)
     
     # Sort priority files by priority order
     priority_html.sort(key=lambda x: priority_files.index(x) if x in priority_files else 999)
     
-    # Compress priority files first
-    results = []
-    
-    if priority_html:
-        print("🎯 PRIORITY FILES (Core System):")
-        print("─" * 70)
-        for i, html_file in enumerate(priority_html, 1):
-            print(f"\n[{i}/{len(priority_html)}] Processing: {html_file}")
-            result = compressor.html_to_py(html_file)
-            if result:
-                results.append(result)
-    
-    # Then compress regular files
-    if regular_html:
-        print(f"\n\n📄 REGULAR FILES ({len(regular_html)} files):")
-        print("─" * 70)
-        
-        for i, html_file in enumerate(regular_html, 1):
-            print(f"\n[{i}/{len(regular_html)}] Processing: {html_file}")
-            result = compressor.html_to_py(html_file)
-            if result:
-                results.append(result)
+    # --workers=N sets the process count (default: one per CPU, 1 = serial)
+    workers = next((int(arg.split('=', 1)[1]) for arg in sys.argv[1:]
+                    if arg.startswith('--workers=')), None)
+    
+    # Unchanged files reuse their cached artifact; --force recompresses
+    # everything, --no-cache bypasses the cache entirely
+    cache = None if '--no-cache' in sys.argv else CompressionCache()
+    
+    # --format=eug writes binary .eug containers instead of .py wrappers
+    output_format = next((arg.split('=', 1)[1] for arg in sys.argv[1:]
+                          if arg.startswith('--format=')), "eug" if blocks else "py")
+    output_dir = "compressed_eug" if output_format == "eug" else "compressed_py"
+    
+    # --archive[=PATH] packs every page into one seekable .euga bundle
+    archive = next((arg.partition('=')[2] or "compressed_pages.euga" for arg in sys.argv[1:]
+                    if arg == '--archive' or arg.startswith('--archive=')), None)
+    
+    # --verify[=PERCENT] decodes that share of the new outputs (default
+    # all) and checks each against its content hash
+    verify = next((float(arg.partition('=')[2] or 100) / 100 for arg in sys.argv[1:]
+                   if arg == '--verify' or arg.startswith('--verify=')), 0.0)
+    
+    # Minified HTML + pre-compressed .gz (etc.) copies for the web server;
+    # --static=DIR picks the folder, --no-static skips them
+    static_dir = None if '--no-static' in sys.argv else next(
+        (arg.split('=', 1)[1] for arg in sys.argv[1:] if arg.startswith('--static=')), STATIC_DIR)
+    
+    def report(index, html_file, result, text):
+        # Called in this order regardless of which worker finishes first
+        if index == 0 and priority_html:
+            log.info("🎯 PRIORITY FILES (Core System):")
+            log.info("─" * 70)
+        if index == len(priority_html) and regular_html:
+            log.info(f"\n\n📄 REGULAR FILES ({len(regular_html)} files):")
+            log.info("─" * 70)
+        if index < len(priority_html):
+            log.info(f"\n[{index + 1}/{len(priority_html)}] Processing: {html_file}")
+        else:
+            log.info(f"\n[{index - len(priority_html) + 1}/{len(regular_html)}] Processing: {html_file}")
+        sys.stdout.write(text)
+    
+    # Priority files start first; the rest are scheduled largest-first
+    start = time.perf_counter()
+    if archive:
+        results = compressor.build_archive(priority_html + regular_html, archive,
+                                           workers=workers, priority=priority_html,
+                                           report=report, cache=cache,
+                                           force='--force' in sys.argv, verify=verify)
+    else:
+        results = compressor.compress_many(priority_html + regular_html, output_dir,
+                                           workers=workers, priority=priority_html,
+                                           report=report, cache=cache,
+                                           force='--force' in sys.argv, format=output_format,
+                                           verify=verify)
+    results = [r for r in results if r]
+    elapsed = time.perf_counter() - start
+    
+    if static_dir:
+        static_start = time.perf_counter()
+        manifest, rebuilt = build_static(priority_html + regular_html, static_dir,
+                                         workers=workers, cache=cache,
+                                         force='--force' in sys.argv)
+        static_elapsed = time.perf_counter() - static_start
     
     # Final summary
-    print(f"\n\n{'═'*70}")
-    print(f"🏆 FINAL BATCH COMPRESSION REPORT")
-    print(f"{'═'*70}")
+    log.info(f"\n\n{'═'*70}")
+    log.info(f"🏆 FINAL BATCH COMPRESSION REPORT")
+    log.info(f"{'═'*70}")
     
     if results:
         total_original = sum(r['original_size'] for r in results)
@@ -86,45 +143,73 @@ def main():
         total_saved = total_original - total_compressed
         avg_compression = (1 - total_compressed / total_original) * 100
         
-        print(f"\n📊 Statistics:")
-        print(f"   Files processed: {len(results)}")
-        print(f"   Total original size: {total_original:,} bytes ({total_original / 1024 / 1024:.2f} MB)")
-        print(f"   Total compressed size: {total_compressed:,} bytes ({total_compressed / 1024 / 1024:.2f} MB)")
-        print(f"   Total savings: {total_saved:,} bytes ({total_saved / 1024 / 1024:.2f} MB)")
-        print(f"   Average compression: {avg_compression:.1f}%")
+        log.info(f"\n📊 Statistics:")
+        log.info(f"   Files processed: {len(results)}")
+        log.info(f"   Total original size: {total_original:,} bytes ({total_original / 1024 / 1024:.2f} MB)")
+        log.info(f"   Total compressed size: {total_compressed:,} bytes ({total_compressed / 1024 / 1024:.2f} MB)")
+        log.info(f"   Total savings: {total_saved:,} bytes ({total_saved / 1024 / 1024:.2f} MB)")
+        log.info(f"   Average compression: {avg_compression:.1f}%")
+        log.info(f"   Wall time: {elapsed:.2f}s ({len(results) / max(elapsed, 1e-9):.1f} files/s)")
+        if cache is not None:
+            log.info(f"   Cache: {cache.hits} reused, {len(results) - cache.hits} compressed, "
+                     f"{cache.manifest.reads} files hashed "
+                     f"({len(cache)} artifacts, {cache.size() / 1024 / 1024:.1f} MB)")
+        log.info(f"   {verification_summary(results)}")
         
-        print(f"\n🎯 Best Compressions:")
+        log.info(f"\n🎯 Best Compressions:")
         top_compressions = sorted(results, key=lambda x: x['compression_ratio'], reverse=True)[:5]
         for i, r in enumerate(top_compressions, 1):
             filename = Path(r['input']).name
-            print(f"   {i}. {filename}: {r['compression_ratio']:.1f}%")
+            log.info(f"   {i}. {filename}: {r['compression_ratio']:.1f}%")
+        
+        if archive:
+            log.info(f"\n💾 Archive: {archive} ({os.path.getsize(archive):,} bytes)")
+            log.info(f"   {len(results)} pages, each readable on its own via the central index")
+        else:
+            log.info(f"\n💾 Output Directory: {output_dir}/")
+            log.info(f"   All compressed .{output_format} files saved here")
         
-        print(f"\n💾 Output Directory: compressed_py/")
-        print(f"   All compressed .py files saved here")
+        if static_dir:
+            pages = manifest["files"].values()
+            minified = sum(page["size"] for page in pages)
+            log.info(f"\n🌐 Static variants: {static_dir}/ ({MANIFEST_NAME})")
+            log.info(f"   {len(pages)} minified pages, {rebuilt} rebuilt in {static_elapsed:.2f}s, "
+                     f"{minified:,} bytes")
+            for encoding in manifest["encodings"]:
+                encoded = sum(page["variants"][encoding]["size"] if encoding in page["variants"]
+                              else page["size"] for page in pages)
+                log.info(f"   {encoding}: {encoded:,} bytes ({encoded / max(minified, 1):.1%} of minified)")
         
-        print(f"\n🔐 NFT-Ready Features:")
-        print(f"   ✓ XOR crypto-signing with 'eug' key")
-        print(f"   ✓ SHA-256 hash for each file")
-        print(f"   ✓ Timestamp metadata")
-        print(f"   ✓ AI personality signatures")
+        log.info(f"\n🔐 NFT-Ready Features:")
+        log.info(f"   ✓ XOR crypto-signing with 'eug' key")
+        log.info(f"   ✓ SHA-256 hash for each file")
+        log.info(f"   ✓ Timestamp metadata")
+        log.info(f"   ✓ AI personality signatures")
         
-        print(f"\n🚀 Upload Speed Impact:")
-        print(f"   Before: {total_original / 1024:.2f} KB @ 500 KB/s = {total_original / 1024 / 500:.1f}s")
-        print(f"   After:  {total_compressed / 1024:.2f} KB @ 500 KB/s = {total_compressed / 1024 / 500:.1f}s")
-        print(f"   Time saved: {(total_original - total_compressed) / 1024 / 500:.1f}s per upload!")
+        log.info(f"\n🚀 Upload Speed Impact:")
+        log.info(f"   Before: {total_original / 1024:.2f} KB @ 500 KB/s = {total_original / 1024 / 500:.1f}s")
+        log.info(f"   After:  {total_compressed / 1024:.2f} KB @ 500 KB/s = {total_compressed / 1024 / 500:.1f}s")
+        log.info(f"   Time saved: {(total_original - total_compressed) / 1024 / 500:.1f}s per upload!")
         
-        print(f"\n✨ Your files are now:")
-        print(f"   • {avg_compression:.0f}% smaller")
-        print(f"   • Crypto-signed for NFT authenticity")
-        print(f"   • Compressed with AI personality optimization")
-        print(f"   • Using 3D symbolic language (EUG format)")
+        log.info(f"\n✨ Your files are now:")
+        log.info(f"   • {avg_compression:.0f}% smaller")
+        log.info(f"   • Crypto-signed for NFT authenticity")
+        log.info(f"   • Compressed with AI personality optimization")
+        log.info(f"   • Using 3D symbolic language (EUG format)")
+        progress(log, "batch_done", files=len(results), original_size=total_original,
+                 compressed_size=total_compressed, ratio=round(avg_compression, 2),
+                 seconds=round(elapsed, 6), cached=cache.hits if cache is not None else 0)
         
     else:
-        print("❌ No files were successfully compressed")
+        log.warning("❌ No files were successfully compressed")
     
-    print(f"\n{'═'*70}")
-    print(f"✅ BATCH COMPRESSION COMPLETE")
-    print(f"{'═'*70}\n")
+    log.info(f"\n{'═'*70}")
+    log.info(f"✅ BATCH COMPRESSION COMPLETE")
+    log.info(f"{'═'*70}\n")
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except BrokenPipeError:
+        # Each file's report is written to stdout directly
+        stdout_closed()
@@ -0,0 +1,1365 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════╗
+║  EUG COMPRESSION BENCHMARKS                                     ║
+║  Measures the hot stages of the EUG pipeline on real inputs     ║
+╚══════════════════════════════════════════════════════════════════╝
+
+Usage:
+    python benchmark_eug_compression.py xor [--size-mb N]
+    python benchmark_eug_compression.py symbols [--root DIR]
+    python benchmark_eug_compression.py roundtrip [--root DIR]
+    python benchmark_eug_compression.py stream [--size-mb N] [--in-memory]
+    python benchmark_eug_compression.py entropy [--root DIR]
+    python benchmark_eug_compression.py dictionary [--root DIR] [--size-kb N]
+    python benchmark_eug_compression.py batch [--root DIR] [--workers N]
+    python benchmark_eug_compression.py container [--root DIR]
+    python benchmark_eug_compression.py archive [--root DIR]
+    python benchmark_eug_compression.py minify [--root DIR]
+    python benchmark_eug_compression.py verify [--root DIR]
+    python benchmark_eug_compression.py blocks [--root DIR] [--size-mb N]
+    python benchmark_eug_compression.py static [--root DIR]
+    python benchmark_eug_compression.py multi-ai [--root DIR] [--size-mb N] [--workers N]
+    python benchmark_eug_compression.py scheduler [--root DIR] [--workers N]
+    python benchmark_eug_compression.py learning [--root DIR] [--passes N] [--explore P]
+    python benchmark_eug_compression.py features [--root DIR] [--top N]
+    python benchmark_eug_compression.py race [--root DIR] [--k N] [--budget S] [--size-mb N] [--workers N]
+    python benchmark_eug_compression.py validation [--root DIR] [--size-mb N] [--workers N]
+    python benchmark_eug_compression.py orchestrator [--calls N] [--threads N]
+    python benchmark_eug_compression.py trace [--root DIR] [--workers N] [--spans N]
+    python benchmark_eug_compression.py logging [--root DIR] [--repeat N]
+    python benchmark_eug_compression.py formats [--root DIR]
+"""
+
+import io
+import os
+import re
+import sys
+import json
+import shutil
+import time
+import resource
+import subprocess
+import hashlib
+import argparse
+import tempfile
+import threading
+import contextlib
+import tracemalloc
+import importlib.util
+from pathlib import Path
+from collections import Counter
+
+from eug_codec import (xor_bytes, entropy_compress, entropy_decompress,
+                       read_container, verify_container, EugArchive, EugContainer)
+from eug_minify import Minifier, minify
+from eug_static import build_static, choose_variant, ENCODINGS
+from eug_features import ContentFeatures
+from eug_formats import svg_precision
+from eug_trace import Trace, MemorySink, JsonlSink, stage_summary
+import eug_log
+from multi_ai_compression import MetaAIOrchestrator, CompressionAI, throughput_summary
+from eug_compression_system import (EugCompressionSystem, ENTROPY_LEVELS,
+                                    train_dictionary)
+
+
+def _xor_reference(data, key):
+    """The original byte-at-a-time XOR loop, kept as the baseline"""
+    key_repeated = (key * (len(data) // len(key) + 1))[:len(data)]
+    return bytes(a ^ b for a, b in zip(data, key_repeated))
+
+
+def _symbols_reference(text, symbol_map):
+    """The original one-str.replace-per-symbol loop, kept as the baseline"""
+    for original, symbol in symbol_map.items():
+        text = text.replace(original, symbol)
+    return text
+
+
+def _optimize_reference(text):
+    """The original five-regex optimize_compression, kept as the baseline"""
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'>\s+<', '><', text)
+    text = re.sub(r'<!--.*?-->', '', text, flags=re.DOTALL)
+    text = re.sub(r'//.*?$', '', text, flags=re.MULTILINE)
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+    return text.strip()
+
+
+def _routing_reference(text):
+    """The scans assign_ai and html_to_py used to make, kept as the baseline"""
+    # assign_ai
+    has_threejs = 'THREE.' in text or 'three.js' in text.lower()
+    has_webgl = 'gl_' in text or 'webgl' in text.lower()
+    styles = text.count('style')
+    functions = text.count('function')
+    # html_to_py's content scan
+    has_3d = 'THREE.' in text or '3D' in text or '3d' in text
+    style_tags = text.count('<style')
+    return has_threejs, has_webgl, styles, functions, has_3d, style_tags
+
+
+def _corpus(root, pattern="*.html"):
+    """Every matching file under root, skipping vendored trees"""
+    skip = {"node_modules", ".git", "compressed_py", "compressed_py_multi_ai"}
+    return sorted(p for p in Path(root).rglob(pattern)
+                  if p.is_file() and not skip.intersection(p.parts))
+
+
+def _load_generated(py_path):
+    """Import a generated *_compressed.py file by path"""
+    spec = importlib.util.spec_from_file_location(f"eug_bench_{py_path.stem}", py_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _throughput(func, payload, repeat=3):
+    """Best-of-N wall time for func(), reported as MB/s of payload"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return len(payload) / (1024 * 1024) / best, best
+
+
+def bench_xor(args):
+    """XOR engine: byte-at-a-time baseline vs whole-buffer xor_bytes"""
+    key = b"eug"
+    payload = (b"<div class=\"scene\">THREE.Mesh</div>\n" * 1024 *
+               max(1, int(args.size_mb * 1024 * 1024 / 36 / 1024)))
+
+    print(f"🔐 XOR benchmark on {len(payload) / 1024 / 1024:.1f} MB")
+
+    assert xor_bytes(payload[:4099], key) == _xor_reference(payload[:4099], key)
+    assert xor_bytes(xor_bytes(payload, key), key) == payload
+
+    before, before_s = _throughput(lambda: _xor_reference(payload, key), payload, repeat=1)
+    after, after_s = _throughput(lambda: xor_bytes(payload, key), payload)
+
+    print(f"   Before (generator loop): {before:8.1f} MB/s ({before_s:.3f}s)")
+    print(f"   After  (xor_bytes):      {after:8.1f} MB/s ({after_s:.3f}s)")
+    print(f"   Speedup: {after / before:.0f}x")
+
+
+def bench_symbols(args):
+    """Symbol substitution: per-key str.replace vs compiled SymbolCodec"""
+    compressor = EugCompressionSystem()
+    codec = compressor.symbol_codec
+    files = _corpus(args.root)
+    texts = [f.read_text(encoding='utf-8', errors='ignore') for f in files]
+    corpus = ''.join(texts)
+
+    print(f"🎨 Symbol benchmark on {len(files)} HTML files "
+          f"({len(corpus) / 1024 / 1024:.1f} MB)")
+
+    failures = [f.name for f, text in zip(files, texts)
+                if codec.decode(codec.encode(text)) != text]
+    print(f"   Round-trip: {len(files) - len(failures)}/{len(files)} exact")
+    for name in failures:
+        print(f"   ✗ {name}")
+
+    before, before_s = _throughput(
+        lambda: _symbols_reference(corpus, compressor.symbol_map), corpus)
+    encode, encode_s = _throughput(lambda: codec.encode(corpus), corpus)
+    encoded = codec.encode(corpus)
+    decode, decode_s = _throughput(lambda: codec.decode(encoded), corpus)
+
+    print(f"   Before (str.replace x{len(compressor.symbol_map)}): {before:6.1f} MB/s ({before_s:.3f}s)")
+    print(f"   Encode (SymbolCodec):         {encode:6.1f} MB/s ({encode_s:.3f}s)")
+    print(f"   Decode (SymbolCodec):         {decode:6.1f} MB/s ({decode_s:.3f}s)")
+    return 1 if failures else 0
+
+
+def bench_roundtrip(args):
+    """Compress every HTML file, then decode it through the generated file"""
+    compressor = EugCompressionSystem()
+    files = _corpus(args.root)
+    failures = []
+    decoded_bytes = 0
+    decode_time = 0.0
+
+    print(f"🔁 Round-trip over {len(files)} HTML files")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, html_file in enumerate(files):
+            out_dir = Path(tmp) / str(i)
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = compressor.html_to_py(html_file, output_dir=out_dir)
+                expected = compressor.optimize_compression(
+                    html_file.read_text(encoding='utf-8'))
+            module = _load_generated(Path(result['output']))
+
+            start = time.perf_counter()
+            decoded = module.EugDecompressor().get_original()
+            decode_time += time.perf_counter() - start
+            decoded_bytes += len(decoded.encode('utf-8'))
+
+            if decoded != expected or not module.EugDecompressor().verify():
+                failures.append(html_file)
+
+    print(f"   Exact: {len(files) - len(failures)}/{len(files)}")
+    for html_file in failures:
+        print(f"   ✗ {html_file}")
+    print(f"   Decode: {decoded_bytes / 1024 / 1024 / max(decode_time, 1e-9):.1f} MB/s "
+          f"({decoded_bytes:,} bytes in {decode_time:.3f}s)")
+    return 1 if failures else 0
+
+
+def _write_synthetic_html(path, size_mb):
+    """A large, comment-free page so every byte survives optimization"""
+    block = ''.join(
+        f'<div class="panel" id="p{i}">\n  <span>THREE.Mesh {i}</span>\n'
+        f'  <canvas width="640" height="480"></canvas>\n</div>\n'
+        for i in range(512))
+    target = int(size_mb * 1024 * 1024)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<!DOCTYPE html>\n<html><head><style>body { margin: 0; }</style></head><body>\n')
+        written = 0
+        while written < target:
+            f.write(block)
+            written += len(block)
+        f.write('<script>const scene = new THREE.Scene();</script></body></html>\n')
+
+
+def bench_stream_child(args):
+    """Runs in a subprocess so its peak RSS belongs to one mode only"""
+    compressor = EugCompressionSystem()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = compressor.html_to_py(args.path, output_dir=args.out,
+                                       stream=args.mode == "stream")
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{peak_kb} {elapsed:.3f} {result['content_hash']}")
+
+
+def bench_stream(args):
+    """Peak memory of the streaming pipeline on a synthetic large page"""
+    modes = ["stream", "memory"] if args.in_memory else ["stream"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        html_path = Path(tmp) / "synthetic.html"
+        _write_synthetic_html(html_path, args.size_mb)
+        size = html_path.stat().st_size
+        print(f"🌊 Streaming benchmark on {size / 1024 / 1024:.0f} MB synthetic HTML")
+
+        hashes = set()
+        for mode in modes:
+            out = subprocess.run(
+                [sys.executable, __file__, "stream-child", str(html_path),
+                 str(Path(tmp) / mode), "--mode", mode],
+                check=True, capture_output=True, text=True).stdout.split()
+            peak_mb = int(out[0]) / 1024
+            hashes.add(out[2])
+            print(f"   {mode:<7} peak RSS {peak_mb:8.1f} MB   "
+                  f"{size / 1024 / 1024 / float(out[1]):6.1f} MB/s ({out[1]}s)")
+
+        if len(hashes) > 1:
+            print("   ✗ Streaming and in-memory outputs differ")
+            return 1
+    return 0
+
+
+def bench_entropy(args):
+    """Byte ratios and throughput of every entropy backend and level"""
+    codec = EugCompressionSystem().symbol_codec
+    files = _corpus(args.root)
+    html = [f.read_text(encoding='utf-8', errors='ignore') for f in files]
+    original = sum(len(text.encode('utf-8')) for text in html)
+    # Per-file payloads, exactly what the entropy stage receives
+    payloads = [codec.encode(text).encode('utf-8') for text in html]
+    symbolic = sum(len(p) for p in payloads)
+
+    print(f"📦 Entropy benchmark on {len(files)} HTML files")
+    print(f"   HTML: {original:,} bytes   after symbols: {symbolic:,} bytes "
+          f"({symbolic / original:.2f}x)")
+    print(f"   {'backend':<6} {'strategy':<13} {'level':>5} {'bytes':>11} "
+          f"{'vs HTML':>8} {'+Base64':>8} {'enc MB/s':>9} {'dec MB/s':>9}")
+
+    for backend, levels in ENTROPY_LEVELS.items():
+        for strategy in ("conservative", "balanced", "aggressive"):
+            level = levels[strategy]
+            start = time.perf_counter()
+            packed = [entropy_compress(p, backend, level) for p in payloads]
+            encode_s = time.perf_counter() - start
+            start = time.perf_counter()
+            decoded = [entropy_decompress(p, backend) for p in packed]
+            decode_s = time.perf_counter() - start
+            if decoded != payloads:
+                print(f"   ✗ {backend} level {level} did not round-trip")
+                return 1
+
+            size = sum(len(p) for p in packed)
+            b64 = sum((len(p) + 2) // 3 * 4 for p in packed)
+            mb = symbolic / 1024 / 1024
+            print(f"   {backend:<6} {strategy:<13} {level:>5} {size:>11,} "
+                  f"{size / original:>7.1%} {b64 / original:>7.1%} "
+                  f"{mb / max(encode_s, 1e-9):>9.1f} {mb / max(decode_s, 1e-9):>9.1f}")
+    return 0
+
+
+def bench_dictionary(args):
+    """zlib with and without a trained shared dictionary, by page size"""
+    compressor = EugCompressionSystem()
+    files = _corpus(args.root)
+    samples = compressor.dictionary_samples(files)
+    # Train on every other file and measure on the rest, so the dictionary
+    # never sees the pages it is scored on
+    train, test = samples[0::2], samples[1::2]
+    level = ENTROPY_LEVELS["zlib"]["balanced"]
+
+    start = time.perf_counter()
+    zdict = train_dictionary(train, args.size_kb * 1024)
+    train_s = time.perf_counter() - start
+    print(f"📚 Dictionary benchmark: trained {len(zdict):,} bytes on "
+          f"{len(train)} files in {train_s:.1f}s, testing on {len(test)}")
+
+    buckets = [("< 4 KB", 4 << 10), ("< 16 KB", 16 << 10),
+               ("< 64 KB", 64 << 10), (">= 64 KB", float('inf'))]
+    print(f"   {'pages':<9} {'files':>5} {'input':>11} {'zlib':>11} "
+          f"{'+dict':>11} {'ratio':>7} {'+dict':>7}")
+    total = [0, 0, 0, 0]
+    lower = 0
+    for label, upper in buckets:
+        group = [p for p in test if lower <= len(p) < upper]
+        lower = upper
+        plain = sum(len(entropy_compress(p, "zlib", level)) for p in group)
+        packed = [entropy_compress(p, "zlib", level, zdict) for p in group]
+        if [entropy_decompress(p, "zlib", zdict) for p in packed] != group:
+            print(f"   ✗ {label} did not round-trip with the dictionary")
+            return 1
+        row = [len(group), sum(len(p) for p in group), plain, sum(len(p) for p in packed)]
+        total = [a + b for a, b in zip(total, row)]
+        if group:
+            print(f"   {label:<9} {row[0]:>5} {row[1]:>11,} {row[2]:>11,} {row[3]:>11,} "
+                  f"{row[2] / row[1]:>7.1%} {row[3] / row[1]:>7.1%}")
+    print(f"   {'all':<9} {total[0]:>5} {total[1]:>11,} {total[2]:>11,} {total[3]:>11,} "
+          f"{total[2] / total[1]:>7.1%} {total[3] / total[1]:>7.1%}")
+    return 0
+
+
+def bench_batch(args):
+    """Wall time of batch compression: serial vs the process pool"""
+    compressor = EugCompressionSystem()
+    files = _corpus(args.root)
+    workers = args.workers or os.cpu_count() or 1
+    size = sum(f.stat().st_size for f in files)
+    print(f"🗂  Batch benchmark on {len(files)} HTML files "
+          f"({size / 1024 / 1024:.1f} MB), {os.cpu_count()} CPUs")
+
+    hashes = {}
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in dict.fromkeys([1, workers]):
+            start = time.perf_counter()
+            results = compressor.compress_many(
+                files, output_dir=Path(tmp) / str(count), workers=count,
+                report=lambda *_: None)
+            timings[count] = time.perf_counter() - start
+            hashes[count] = [r['content_hash'] for r in results]
+            print(f"   workers={count:<3} {timings[count]:7.2f}s "
+                  f"{len(files) / timings[count]:7.1f} files/s")
+
+    if len(set(map(tuple, hashes.values()))) > 1:
+        print("   ✗ Parallel results differ from serial")
+        return 1
+    print(f"   Speedup: {timings[1] / timings[workers]:.2f}x")
+    return 0
+
+
+def bench_container(args):
+    """.py wrapper vs binary .eug container: size by page size, decode speed"""
+    compressor = EugCompressionSystem()
+    files = _corpus(args.root)
+    buckets = [("< 4 KB", 4 << 10), ("< 16 KB", 16 << 10),
+               ("< 64 KB", 64 << 10), (">= 64 KB", float('inf'))]
+    rows = {label: [0, 0, 0, 0] for label, _ in buckets}
+    failures = []
+    py_time = eug_time = 0.0
+
+    print(f"🧱 Container benchmark on {len(files)} HTML files")
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, html_file in enumerate(files):
+            out_dir = Path(tmp) / str(i)
+            with contextlib.redirect_stdout(io.StringIO()):
+                py = compressor.html_to_py(html_file, out_dir)
+                eug = compressor.html_to_eug(html_file, out_dir)
+                streamed = compressor.html_to_eug(html_file, Path(tmp) / f"s{i}", stream=True)
+
+            start = time.perf_counter()
+            expected = _load_generated(Path(py['output'])).EugDecompressor().get_original()
+            py_time += time.perf_counter() - start
+            start = time.perf_counter()
+            decoded = read_container(eug['output'])
+            eug_time += time.perf_counter() - start
+            if decoded != expected or \
+                    Path(streamed['output']).read_bytes() != Path(eug['output']).read_bytes():
+                failures.append(html_file)
+
+            size = py['original_size']
+            label = next(label for label, upper in buckets if size < upper)
+            row = rows[label]
+            for j, value in enumerate((1, size, py['compressed_size'], eug['compressed_size'])):
+                row[j] += value
+
+    print(f"   {'pages':<9} {'files':>5} {'HTML':>11} {'.py':>11} {'.eug':>11} "
+          f"{'.py':>7} {'.eug':>7}")
+    for label, (count, html, py_size, eug_size) in rows.items():
+        if count:
+            print(f"   {label:<9} {count:>5} {html:>11,} {py_size:>11,} {eug_size:>11,} "
+                  f"{py_size / html:>7.1%} {eug_size / html:>7.1%}")
+    print(f"   Decode: .py import+decode {py_time:.3f}s, .eug read_container {eug_time:.3f}s")
+    print(f"   Exact: {len(files) - len(failures)}/{len(files)}")
+    for html_file in failures:
+        print(f"   ✗ {html_file}")
+    return 1 if failures else 0
+
+
+def bench_archive(args):
+    """Per-file .py outputs vs one .euga archive: bytes, files, member reads"""
+    compressor = EugCompressionSystem()
+    files = _corpus(args.root)
+    quiet = lambda *_: None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        py_dir = Path(tmp) / "py"
+        compressor.compress_many(files, py_dir, workers=1, report=quiet)
+        py_files = list(py_dir.glob("*_compressed.py"))
+        py_bytes = sum(p.stat().st_size for p in py_files)
+
+        archive_path = Path(tmp) / "pages.euga"
+        results = compressor.build_archive(files, archive_path, workers=1, report=quiet)
+        print(f"🗄  Archive benchmark on {len(files)} HTML files")
+        print(f"   Per-file .py: {len(py_files)} files, {py_bytes:,} bytes")
+        print(f"   Archive:      1 file, {archive_path.stat().st_size:,} bytes")
+
+        failures = []
+        with EugArchive(archive_path) as archive:
+            start = time.perf_counter()
+            for result in results:
+                if hashlib.sha256(archive.read(result['member']).encode('utf-8')
+                                  ).hexdigest() != result['content_hash']:
+                    failures.append(result['member'])
+            elapsed = time.perf_counter() - start
+        print(f"   Member reads: {len(results) / elapsed:,.0f} pages/s "
+              f"({elapsed / len(results) * 1000:.2f} ms each, decode included)")
+        print(f"   Exact: {len(results) - len(failures)}/{len(results)}")
+        for name in failures:
+            print(f"   ✗ {name}")
+    return 1 if failures else 0
+
+
+def bench_verify(args):
+    """Cost of decode-side verification, per format and per batch sample rate"""
+    compressor = EugCompressionSystem()
+    files = _corpus(args.root)
+    print(f"🔎 Verification benchmark on {len(files)} HTML files")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for output_format in ("py", "eug"):
+            compress_seconds = verify_seconds = 0.0
+            decoded = passed = 0
+            for i, html_file in enumerate(files):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    result = compressor.html_to_py(html_file, Path(tmp) / f"{output_format}{i}",
+                                                   format=output_format, verify=True)
+                compress_seconds += result['compress_seconds']
+                verify_seconds += result['verify_seconds']
+                passed += result['verified']
+                decoded += result['original_size']
+            print(f"   .{output_format:<3} verify {verify_seconds:.3f}s for compress "
+                  f"{compress_seconds:.3f}s ({verify_seconds / compress_seconds:.0%} extra), "
+                  f"{decoded / verify_seconds / 1024 / 1024:.1f} MB/s, passed {passed}/{len(files)}")
+
+        # Corruption must be caught, not just clean files passed
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = compressor.html_to_eug(files[0], Path(tmp) / "corrupt")
+        data = bytearray(Path(result['output']).read_bytes())
+        data[-1] ^= 0x01
+        Path(result['output']).write_bytes(bytes(data))
+        caught = not verify_container(result['output'])
+        print(f"   Flipped payload bit detected: {'yes' if caught else 'NO'}")
+
+        print(f"   {'sample':>7} {'verified':>9} {'wall':>8}")
+        for percent in (0, 10, 50, 100):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                results = compressor.compress_many(files, Path(tmp) / f"batch{percent}",
+                                                   workers=1, verify=percent / 100)
+            elapsed = time.perf_counter() - start
+            checked = sum(r['verified'] is not None for r in results if r)
+            print(f"   {percent:>6}% {checked:>9} {elapsed:>7.2f}s")
+    return 0 if caught and passed == len(files) else 1
+
+
+def bench_blocks(args):
+    """Block-indexed .eug: size overhead, and preview reads vs a full decode"""
+    plain = EugCompressionSystem()
+    blocked = EugCompressionSystem(block_size=64 * 1024)
+    files = _corpus(args.root)
+    failures = []
+    sizes = [0, 0]
+    timings = {"full": 0.0, "head": 0.0, "prefix": 0.0}
+    big = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        synthetic = Path(tmp) / "synthetic_large.html"
+        _write_synthetic_html(synthetic, args.size_mb)
+        print(f"🧩 Block index benchmark on {len(files)} HTML files "
+              f"+ a {args.size_mb} MB synthetic page")
+        for i, html_file in enumerate(files + [synthetic]):
+            with contextlib.redirect_stdout(io.StringIO()):
+                whole = plain.html_to_eug(html_file, Path(tmp) / f"p{i}")
+                split = blocked.html_to_eug(html_file, Path(tmp) / f"b{i}")
+            sizes[0] += whole['compressed_size']
+            sizes[1] += split['compressed_size']
+
+            expected = read_container(whole['output'])
+            with EugContainer(split['output']) as container:
+                if container.read() != expected or read_container(split['output']) != expected:
+                    failures.append(html_file)
+            if whole['original_size'] < 256 * 1024:
+                continue
+
+            # Open → one read each way, as a preview tool would
+            big += 1
+            for name, read in (("full", lambda: read_container(whole['output'])),
+                               ("head", lambda: EugContainer(split['output']).read("head")),
+                               ("prefix", lambda: EugContainer(split['output']).read_prefix(4096))):
+                start = time.perf_counter()
+                for _ in range(5):
+                    read()
+                timings[name] += (time.perf_counter() - start) / 5
+            with EugContainer(split['output']) as container:
+                print(f"   {Path(html_file).name:<40} {len(container.blocks):>3} blocks")
+
+    print(f"   Size: {sizes[0]:,} → {sizes[1]:,} bytes with blocks "
+          f"({sizes[1] / sizes[0] - 1:+.1%})")
+    print(f"   Pages >= 256 KB ({big}): full decode {timings['full'] * 1000:.1f} ms, "
+          f"<head> {timings['head'] * 1000:.1f} ms, first 4 KB {timings['prefix'] * 1000:.1f} ms")
+    print(f"   Exact: {len(files) + 1 - len(failures)}/{len(files) + 1}")
+    for html_file in failures:
+        print(f"   ✗ {html_file}")
+    return 1 if failures else 0
+
+
+def bench_static(args):
+    """Pre-compressed static variants vs compressing at request time"""
+    import gzip
+    files = _corpus(args.root)
+    raw = [f.read_bytes() for f in files]
+    print(f"🌐 Static variant benchmark on {len(files)} HTML files "
+          f"(encodings: {', '.join(ENCODINGS)})")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        manifest, _ = build_static(files, tmp, workers=1)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        _, rebuilt = build_static(files, tmp, workers=1)
+        rebuild = time.perf_counter() - start
+
+        pages = [manifest["files"][p.as_posix()] for p in files]
+        minified = [(Path(tmp) / page["path"]).read_bytes() for page in pages]
+        served = [(Path(tmp) / choose_variant(page, "gzip, deflate, br")[0]).read_bytes()
+                  for page in pages]
+        exact = sum(gzip.decompress(body) == page if body != page else True
+                    for body, page in zip(served, minified))
+
+    on_the_fly = 0
+    start = time.perf_counter()
+    for data in raw:
+        on_the_fly += len(gzip.compress(data, 6))
+    per_request = (time.perf_counter() - start) / len(raw)
+    minified_gzip6 = sum(len(gzip.compress(data, 6)) for data in minified)
+
+    print(f"   HTML as-is:                 {sum(map(len, raw)):>11,} bytes")
+    print(f"   gzip -6 at request time:    {on_the_fly:>11,} bytes "
+          f"({per_request * 1000:.2f} ms CPU per request)")
+    print(f"   minified + gzip -6:         {minified_gzip6:>11,} bytes")
+    print(f"   minified + pre-built gzip:  {sum(map(len, served)):>11,} bytes "
+          f"(0 ms per request)")
+    print(f"   Build {build:.2f}s once; unchanged rebuild {rebuild:.2f}s ({rebuilt} rebuilt)")
+    print(f"   Decompresses to the minified page: {exact}/{len(files)}")
+    return 0 if exact == len(files) else 1
+
+
+def bench_multi_ai(args):
+    """Specialist AIs one after another vs fanned out over the orchestrator's pools"""
+    files = _corpus(args.root)
+    pages = [f.read_text(encoding='utf-8') for f in files]
+    big = "".join(pages)[:int(args.size_mb * 1024 * 1024)]
+    orchestrator = MetaAIOrchestrator(max_workers=args.workers)
+    print(f"🧠 Multi-AI fan-out benchmark on {len(files)} HTML files "
+          f"+ one {len(big) / 1024 / 1024:.1f} MB page ({orchestrator.max_workers} workers)")
+
+    def sequential(original, compressed):
+        optimized = {name: ai.optimize(compressed, len(original))
+                     for name, ai in orchestrator.optimization_ais.items()}
+        validated = {name: ai.validate(original, compressed)
+                     for name, ai in orchestrator.validation_ais.items()}
+        return optimized, validated
+
+    def fan_out(original, compressed):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return (orchestrator.run_optimizers(compressed, len(original)),
+                    orchestrator.run_validators(original, compressed))
+
+    def timed(func, cases, repeat=3):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            outputs = [func(original, compressed) for original, compressed in cases]
+            best = min(best, time.perf_counter() - start)
+        return best, outputs
+
+    corpus_cases = [(page, minify(page)) for page in pages]
+    big_cases = [(big, minify(big))]
+    # Output bigger than the input: the quality checks fail almost at once
+    failing_cases = [(big, big + " ")]
+    mismatches = 0
+    try:
+        fan_out(*big_cases[0])  # warm the pools
+        for label, cases in (("Corpus pages", corpus_cases), ("Large page", big_cases),
+                             ("Large page, failing", failing_cases)):
+            before, expected = timed(sequential, cases)
+            after, actual = timed(fan_out, cases)
+            for (opt_a, val_a), (opt_b, val_b) in zip(expected, actual):
+                mismatches += opt_a != opt_b
+                # Cancelled validators report None; everything that ran must agree
+                mismatches += any(val_b[name]['passed'] not in (None, val_a[name]['passed'])
+                                  for name in val_a)
+                mismatches += all(r['passed'] for r in val_a.values()) != \
+                              all(r['passed'] for r in val_b.values())
+            skipped = sum(r['passed'] is None for _, val in actual for r in val.values())
+            print(f"   {label:<20} sequential {before * 1000:8.1f} ms   "
+                  f"fan-out {after * 1000:8.1f} ms   ({before / after:4.1f}x, "
+                  f"{skipped} validators skipped)")
+    finally:
+        orchestrator.close()
+    print(f"   Verdicts matching the sequential run: {'yes' if not mismatches else f'{mismatches} mismatches'}")
+    return 1 if mismatches else 0
+
+
+def bench_scheduler(args):
+    """Multi-file scheduler: one worker vs a process pool, with and without a specialist cap"""
+    files = [f.resolve() for f in _corpus(args.root)]
+    workers = args.workers or os.cpu_count() or 1
+    print(f"📋 Scheduler benchmark on {len(files)} HTML files ({workers} workers)")
+    runs = [("Serial", 1, {}), ("Pool", workers, {}),
+            ("Pool, threejs<=1", workers, {"threejs_specialist": 1})]
+    outputs = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            for label, count, limits in runs:
+                orchestrator = MetaAIOrchestrator(max_workers=count, history_path=None)
+                with orchestrator:
+                    orchestrator.schedule(files)
+                    start = time.perf_counter()
+                    first = None
+                    for result in orchestrator.run_queue(limits=limits):
+                        first = first or time.perf_counter() - start
+                    elapsed = time.perf_counter() - start
+                outputs[label] = {r["input"]: r["nft_data"]["compressed_hash"]
+                                  for r in orchestrator.results}
+                print(f"   {label:<17} first result {first * 1000:6.0f} ms; "
+                      f"{throughput_summary(orchestrator.results, elapsed)}")
+        finally:
+            os.chdir(cwd)
+    same = all(output == outputs["Serial"] for output in outputs.values())
+    print(f"   Same outputs in every mode: {'yes' if same else 'NO'}")
+    return 0 if same else 1
+
+
+def bench_learning(args):
+    """Rule-based specialist choice vs learned (ε-greedy) choice over repeated passes"""
+    files = [f.resolve() for f in _corpus(args.root)]
+    print(f"📈 Specialist learning benchmark: {args.passes} passes over {len(files)} HTML files")
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            history = Path(tmp) / "ai_performance.json"
+            for label, explore, passes in (("Rule-based", 0.0, 1), ("Learned", args.explore, args.passes)):
+                history.unlink(missing_ok=True)
+                for n in range(passes):
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        orchestrator = MetaAIOrchestrator(max_workers=1, explore=explore,
+                                                          history_path=history if explore else None,
+                                                          seed=n)
+                        with orchestrator:
+                            orchestrator.schedule(files)
+                            results = list(orchestrator.run_queue())
+                    saved = sum(r["saved"] for r in results if r["validations_passed"])
+                    seconds = sum(r["specialist_seconds"] for r in results)
+                    picks = Counter(r["specialist"] for r in results)
+                    print(f"   {label:<10} pass {n + 1}: {saved:>10,} bytes saved in "
+                          f"{seconds:.2f} CPU-s = {saved / seconds / 1e6:.2f} MB/CPU-s "
+                          f"({len(picks)} specialists used)")
+            print(f"   History file: {history.stat().st_size:,} bytes")
+        finally:
+            os.chdir(cwd)
+    return 0
+
+
+def bench_features(args):
+    """Routing signals: the routers' separate scans vs one ContentFeatures pass"""
+    files = _corpus(args.root)
+    pages = {f: f.read_text(encoding='utf-8') for f in files}
+    largest = sorted(files, key=lambda f: -len(pages[f]))[:args.top]
+    text = "".join(pages[f] for f in largest)
+    print(f"🔎 Feature extraction benchmark on the {len(largest)} largest pages "
+          f"({len(text) / 1024 / 1024:.1f} MB)")
+
+    def extract(page):
+        features = ContentFeatures.of(page)
+        return (features.has_threejs, features.has_webgl, features.counts['style'],
+                features.counts['function'], features.has_3d, features.style_tags)
+
+    mismatches = [f for f, page in pages.items() if extract(page) != _routing_reference(page)]
+    before, before_s = _throughput(lambda: [_routing_reference(pages[f]) for f in largest], text)
+    after, after_s = _throughput(lambda: [extract(pages[f]) for f in largest], text)
+    print(f"   Separate scans + lower() copies: {before:8.1f} MB/s ({before_s * 1000:.1f} ms)")
+    print(f"   ContentFeatures, one pass:       {after:8.1f} MB/s ({after_s * 1000:.1f} ms, "
+          f"{before_s / after_s:.1f}x)")
+    for f in largest[:3]:
+        page = pages[f]
+        _, old = _throughput(lambda: _routing_reference(page), page, repeat=5)
+        _, new = _throughput(lambda: extract(page), page, repeat=5)
+        print(f"   {f.name:<40} {len(page) / 1024:7.0f} KB  {old * 1000:6.2f} → {new * 1000:6.2f} ms")
+    print(f"   Same signals on all {len(pages)} pages: "
+          f"{'yes' if not mismatches else f'NO ({len(mismatches)} differ)'}")
+    return 1 if mismatches else 0
+
+
+def bench_race(args):
+    """Single assigned specialist vs racing the top-K pairs, and the budget cut-off"""
+    files = [f.resolve() for f in _corpus(args.root)]
+    print(f"🏁 Race benchmark on {len(files)} HTML files (top {args.k} pairs)")
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            orchestrator = MetaAIOrchestrator(max_workers=args.workers, history_path=None)
+            with orchestrator:
+                totals = {}
+                for label, race in (("Assigned specialist", 0), (f"Race top {args.k}", args.k)):
+                    start = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        results = [orchestrator.compress_with_multi_ai(str(f), race=race,
+                                                                       budget=args.budget)
+                                   for f in files]
+                    elapsed = time.perf_counter() - start
+                    size = sum(r["compressed_size"] for r in results)
+                    verified = sum(r["validations_passed"] for r in results)
+                    totals[label] = size
+                    print(f"   {label:<20} {size:>11,} bytes  {elapsed:6.2f}s  "
+                          f"{verified}/{len(files)} verified")
+                first, second = totals.values()
+                print(f"   Race output: {second / first - 1:+.1%}")
+
+                # A budget shorter than one specialist run on a large page
+                big = Path(tmp) / "big.html"
+                big.write_text("".join(f.read_text(encoding='utf-8') for f in files)
+                               [:int(args.size_mb * 1024 * 1024)], encoding='utf-8')
+                for budget in (args.budget, 0.05):
+                    start = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        result = orchestrator.compress_with_multi_ai(str(big), race=args.k,
+                                                                     budget=budget)
+                    elapsed = time.perf_counter() - start
+                    race = result["race"]
+                    outcome = (f"{race['finished']}/{race['pairs']} pairs finished, "
+                               f"{race['cancelled']} cancelled" if race
+                               else "no verified output, fell back to the assigned specialist")
+                    print(f"   {args.size_mb:g} MB page, {budget:g}s budget: {elapsed:.2f}s, {outcome}")
+        finally:
+            os.chdir(cwd)
+    return 0
+
+
+def bench_validation(args):
+    """Cheap-first validation and the fallback for a rejected page: sequential vs speculative"""
+    files = [f.resolve() for f in _corpus(args.root)]
+    pages = [f.read_text(encoding='utf-8') for f in files]
+    print(f"✅ Validation benchmark on {len(files)} HTML files ({args.workers or 'all'} workers)")
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            orchestrator = MetaAIOrchestrator(max_workers=args.workers, history_path=None)
+            with orchestrator:
+                print(f"   Order: {', '.join(orchestrator.validation_order)}")
+                ran = 0
+                with contextlib.redirect_stdout(io.StringIO()):
+                    for page in pages:
+                        verdicts = orchestrator.run_validators(page, page + " ")
+                        ran += sum(r['passed'] is not None for r in verdicts.values())
+                print(f"   Rejected corpus pages: {ran} validator runs "
+                      f"(all six: {len(pages) * len(orchestrator.validation_ais)})")
+
+                # Already-minified input: no specialist shrinks it further,
+                # so the quality checks reject every run and it falls back
+                big = Path(tmp) / "minified.html"
+                big.write_text(minify("".join(pages))[:int(args.size_mb * 1024 * 1024)],
+                               encoding='utf-8')
+                content = big.read_text(encoding='utf-8')
+                precise = next(key for key, ai in orchestrator.compression_ais.items()
+                               if ai.strategy == "precise")
+                aggressive = next(key for key, ai in orchestrator.compression_ais.items()
+                                  if ai.strategy == "aggressive")
+                one = {}
+                for key in (precise, "general_specialist"):
+                    start = time.perf_counter()
+                    orchestrator.compression_ais[key].compress(content)
+                    one[key] = time.perf_counter() - start
+                print(f"   {args.size_mb:g} MB minified page: one compression "
+                      f"{one[precise]:.2f}s, specialist + fallback {sum(one.values()):.2f}s")
+                for label, key in (("precise, first run", precise),
+                                   ("precise, learned", precise),
+                                   ("aggressive", aggressive)):
+                    start = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        result = orchestrator.compress_with_multi_ai(str(big), specialist=key)
+                    elapsed = time.perf_counter() - start
+                    print(f"   {label:<20} {elapsed:6.2f}s  fallback: {result['fallback']}")
+        finally:
+            os.chdir(cwd)
+    return 0
+
+
+def bench_orchestrator(args):
+    """Import + construction cost, and one long-lived orchestrator serving many calls from many threads"""
+    child = subprocess.run(
+        [sys.executable, "-c",
+         "import time; t = time.perf_counter(); import multi_ai_compression as m; "
+         "i = time.perf_counter() - t; t = time.perf_counter(); "
+         "[m.MetaAIOrchestrator(history_path=None) for _ in range(100)]; "
+         "print(i, (time.perf_counter() - t) / 100)"],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    imported, constructed = map(float, child.stdout.split())
+    print(f"🧠 Orchestrator benchmark ({args.calls} calls, {args.threads} threads)")
+    print(f"   Startup: import {imported * 1000:.1f} ms, construction {constructed * 1000:.3f} ms "
+          f"(silent: {'yes' if not child.stdout.split()[2:] else 'no'})")
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            page = Path(tmp) / "page.html"
+            page.write_text("<html><body>\n  <p>Hello,   world</p>  <!-- note -->\n</body></html>\n",
+                            encoding='utf-8')
+            # No exploration: every call should produce the same output
+            orchestrator = MetaAIOrchestrator(max_workers=1, history_path=None, explore=0)
+            with orchestrator:
+                compression_ai = orchestrator.compression_ais["general_specialist"]
+                content = page.read_text(encoding='utf-8')
+                start = time.perf_counter()
+                for _ in range(args.calls):
+                    compression_ai.compress(content)
+                work = (time.perf_counter() - start) / args.calls
+
+                # Reports are swallowed once, around each phase: redirecting
+                # stdout swaps a process-wide object, so threads mustn't
+                def calls(count, hashes):
+                    for _ in range(count):
+                        result = orchestrator.compress_with_multi_ai(str(page))
+                        hashes.add(result["nft_data"]["compressed_hash"])
+
+                hashes = set()
+                with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+                    start = time.perf_counter()
+                    calls(args.calls, hashes)
+                    serial = (time.perf_counter() - start) / args.calls
+                    # Traced separately: tracemalloc slows every allocation
+                    tracemalloc.start()
+                    calls(args.calls // 4, hashes)
+                    before, _ = tracemalloc.get_traced_memory()
+                    calls(args.calls // 4, hashes)
+                    after, _ = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                print(f"   Serial: {serial * 1e6:.0f} µs per call on a {len(content)}-byte page "
+                      f"({(serial - work) * 1e6:.0f} µs beyond the specialist's "
+                      f"{work * 1e6:.0f} µs); memory after {args.calls // 4} more calls "
+                      f"{(after - before) / 1024:+.1f} KB")
+
+                errors = []
+
+                def worker():
+                    try:
+                        calls(args.calls // args.threads, hashes)
+                    except Exception as e:
+                        errors.append(e)
+
+                threads = [threading.Thread(target=worker) for _ in range(args.threads)]
+                with contextlib.redirect_stdout(io.StringIO()):
+                    start = time.perf_counter()
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join()
+                    elapsed = time.perf_counter() - start
+                done = args.calls // args.threads * args.threads
+                print(f"   {args.threads} threads sharing it: {done / elapsed:,.0f} calls/s, "
+                      f"{len(errors)} errors, {len(hashes)} distinct output(s)")
+        finally:
+            os.chdir(cwd)
+    return 1 if errors or len(hashes) != 1 else 0
+
+
+def bench_trace(args):
+    """Where a batch run's time and bytes go, per stage, and what the spans themselves cost"""
+    files = [f.resolve() for f in _corpus(args.root)]
+    print(f"⏱️ Stage trace benchmark on {len(files)} HTML files ({args.workers} workers)")
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            memory = MemorySink()
+            with JsonlSink(Path(tmp) / "spans.jsonl") as jsonl:
+                class Both:
+                    def emit(self, record):
+                        memory.emit(record)
+                        jsonl.emit(record)
+
+                with MetaAIOrchestrator(max_workers=args.workers, history_path=None,
+                                        sink=Both()) as orchestrator:
+                    orchestrator.schedule(files)
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        results = list(orchestrator.run_queue())
+            print(f"   {stage_summary(memory.records)}")
+            stages = {}
+            for record in memory.records:
+                totals = stages.setdefault(record["stage"], [0, 0])
+                totals[0] += record["bytes_in"] or 0
+                totals[1] += record["bytes_out"] or 0
+            print("   Bytes in → out: " + ", ".join(
+                f"{stage} {bytes_in / 1e6:.1f}→{bytes_out / 1e6:.1f} MB"
+                for stage, (bytes_in, bytes_out) in stages.items() if bytes_out))
+            with open(Path(tmp) / "spans.jsonl", encoding='utf-8') as f:
+                lines = [json.loads(line) for line in f]
+            spans = sum(len(r["spans"]) for r in results)
+            print(f"   Spans: {spans} on results, {len(memory.records)} in memory, "
+                  f"{len(lines)} JSONL lines")
+
+            trace = Trace(None, file="x", specialist_id=None, pid=os.getpid())
+            start = time.perf_counter()
+            for _ in range(args.spans):
+                with trace.span("stage", 1) as span:
+                    span["bytes_out"] = 1
+            per_span = (time.perf_counter() - start) / args.spans
+            per_file = spans / len(results) * per_span
+            print(f"   Cost: {per_span * 1e6:.2f} µs per span, {per_file * 1e6:.1f} µs per file "
+                  f"({per_file / (sum(r['seconds'] for r in results) / len(results)):.3%} of a file)")
+        finally:
+            os.chdir(cwd)
+    return 0 if spans == len(memory.records) == len(lines) else 1
+
+
+def bench_logging(args):
+    """Per-file cost of each output mode, from the silent library default to the full narration"""
+    files = [f.resolve() for f in _corpus(args.root)]
+    compressor = EugCompressionSystem()
+    print(f"📣 Logging benchmark on {len(files)} HTML files")
+    logging = eug_log.logging
+    modes = [("library", None), ("quiet", ("text", logging.WARNING)),
+             ("text", ("text", logging.INFO)), ("progress", ("progress", logging.INFO)),
+             ("verbose", ("text", logging.DEBUG))]
+
+    class Recorder(logging.Handler):
+        def emit(self, record):
+            calls.append((record.name, record.levelno, record.msg,
+                          {"progress": record.progress} if hasattr(record, "progress") else None))
+
+    def apply(config):
+        eug_log.reset()
+        if config is not None:
+            eug_log.configure(*config)
+
+    ok = True
+    outputs = {}
+    calls = []
+    with tempfile.TemporaryDirectory() as tmp:
+        def run():
+            for html_file in files:
+                compressor.html_to_py(html_file, tmp)
+
+        try:
+            # What one pass writes in each mode
+            for name, config in modes:
+                apply(config)
+                outputs[name] = io.StringIO()
+                with contextlib.redirect_stdout(outputs[name]):
+                    run()
+            # Every message a pass logs, whatever the level, to replay below
+            apply(("text", logging.DEBUG))
+            recorder = Recorder()
+            logging.getLogger(eug_log.ROOT).addHandler(recorder)
+            with contextlib.redirect_stdout(io.StringIO()):
+                run()
+            eug_log.reset()
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                run()
+            per_file = (time.perf_counter() - start) / args.repeat / len(files)
+        finally:
+            eug_log.reset()
+    print(f"   {len(calls) / len(files):.1f} log calls per file, "
+          f"{per_file * 1000:.2f} ms per file compressing in library mode")
+
+    # The recorded calls replayed through each mode, into /dev/null: the
+    # logging cost alone, without the compression's timing noise
+    loggers = {name: logging.getLogger(name) for name, *_ in calls}
+    for name, config in modes:
+        apply(config)
+        try:
+            with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+                best = float('inf')
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    for logger_name, level, msg, extra in calls:
+                        loggers[logger_name].log(level, msg, extra=extra)
+                    best = min(best, time.perf_counter() - start)
+        finally:
+            eug_log.reset()
+        cost = best / len(files)
+        text = outputs[name].getvalue()
+        check = ""
+        if name == "library":
+            ok &= text == ""
+            check = ", silent" if text == "" else ", NOT silent"
+        elif name == "progress":
+            events = [json.loads(line)["event"] for line in text.splitlines()]
+            ok &= events.count("file_done") == len(files)
+            check = f", {events.count('file_done')} file_done events, all JSON"
+        print(f"   {name:<9} {cost * 1e6:6.1f} µs per file ({cost / per_file:.2%}), "
+              f"{len(text.encode()) / len(files):,.0f} bytes of output per file{check}")
+    # Before: every message printed, whatever was wanted
+    messages = [msg for _, _, msg, extra in calls if extra is None]
+    with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for msg in messages:
+                print(msg)
+            best = min(best, time.perf_counter() - start)
+    cost = best / len(files)
+    print(f"   {'print':<9} {cost * 1e6:6.1f} µs per file ({cost / per_file:.2%}), "
+          f"the old unconditional output")
+    return 0 if ok else 1
+
+
+_MD_FENCED = re.compile(r'^ {0,3}(`{3,}|~{3,}).*?\n {0,3}\1[ \t]*$', re.M | re.S)
+_NUMBER = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+
+def _synthetic_svg(segments=2000):
+    """An exporter-style SVG: one long path of 6-decimal cubic segments"""
+    import random
+    rng = random.Random(0)
+    data = "M 100.000000 100.000000 " + " ".join(
+        "C " + " ".join(f"{rng.uniform(0, 200):.6f},{rng.uniform(0, 200):.6f}" for _ in range(3))
+        for _ in range(segments))
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 200 200">\n'
+            f'  <path d="{data}" fill="none" stroke="#000"/>\n</svg>\n')
+
+
+def bench_formats(args):
+    """Format codecs of the .json/.svg/.md specialists vs the generic path they used to run"""
+    orchestrator = MetaAIOrchestrator(max_workers=1, history_path=None)
+    corpora = {
+        "json_specialist": [p for p in _corpus(args.root, "*.json")],
+        "markdown_specialist": [p for p in _corpus(args.root, "*.md")],
+        "svg_specialist": [p for p in _corpus(args.root, "*.svg")],
+    }
+    print(f"🗂️ Format codec benchmark: " + ", ".join(
+        f"{len(files)} {key.split('_')[0]}" for key, files in corpora.items()))
+    ok = True
+    for key, files in corpora.items():
+        specialist = orchestrator.compression_ais[key]
+        # The same personality without the codec: what the specialist ran before
+        generic = CompressionAI(specialist.id, specialist.name, specialist.specialty,
+                                specialist.personality_traits)
+        texts = [f.read_text(encoding='utf-8', errors='replace') for f in files]
+        if key == "svg_specialist":
+            texts.append(_synthetic_svg())
+        size = sum(len(t) for t in texts)
+        outputs = {}
+        for name, ai in (("generic", generic), ("format", specialist)):
+            best = float('inf')
+            for _ in range(3):
+                start = time.perf_counter()
+                out = [ai.compress(t) for t in texts]
+                best = min(best, time.perf_counter() - start)
+            outputs[name] = out
+            print(f"   {key.split('_')[0]:<8} {name:<7} {size:>10,} → {sum(map(len, out)):>10,} chars "
+                  f"({1 - sum(map(len, out)) / max(size, 1):5.1%} saved), "
+                  f"{best * 1000:8.1f} ms ({size / 1e6 / max(best, 1e-9):6.1f} MB/s)")
+
+        for name, out in outputs.items():
+            if key == "json_specialist":
+                same = parsed = 0
+                for text, result in zip(texts, out):
+                    try:
+                        value = json.loads(text)
+                    except ValueError:
+                        continue
+                    parsed += 1
+                    try:
+                        same += json.loads(result) == value
+                    except ValueError:
+                        pass
+                ok &= name == "generic" or same == parsed
+                check = f"{same}/{parsed} parse to the same value"
+            elif key == "markdown_specialist":
+                blocks = kept = lines = lines_out = 0
+                for text, result in zip(texts, out):
+                    text = text.replace('\r\n', '\n')
+                    for block in _MD_FENCED.finditer(text):
+                        blocks += 1
+                        kept += block[0] in result
+                    lines += sum(1 for line in text.split('\n') if line.strip())
+                    lines_out += sum(1 for line in result.split('\n') if line.strip())
+                ok &= name == "generic" or (kept == blocks and lines_out == lines)
+                check = (f"{kept}/{blocks} fenced code blocks verbatim, "
+                         f"{lines_out:,}/{lines:,} non-blank lines kept")
+            else:
+                # Each change against the half-unit of its file's precision
+                worst = 0.0
+                for text, result in zip(texts, out):
+                    limit = 0.5 * 10 ** -svg_precision(text)
+                    for before, after in zip(re.findall(r'\sd="([^"]*)"', text),
+                                             re.findall(r'\sd="([^"]*)"', result)):
+                        a, b = _NUMBER.findall(before), _NUMBER.findall(after)
+                        if len(a) == len(b):
+                            worst = max([worst] + [abs(float(x) - float(y)) / limit
+                                                   for x, y in zip(a, b)])
+                ok &= name == "generic" or worst <= 1 + 1e-9
+                check = (f"largest path coordinate change {worst:.3f}x the rounding "
+                         f"bound of its viewBox's precision")
+            print(f"   {'':<8} {name:<7} {check}")
+    return 0 if ok else 1
+
+
+_SCRIPT_BLOCK = re.compile(r'<script\b([^>]*)>(.*?)</script', re.I | re.S)
+_URL = re.compile(r'https?://[^\s"\'<>)`]+')
+_NODE_CHECK = r"""
+const vm = require('vm');
+const blocks = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+console.log(JSON.stringify(blocks.map(([source, module]) => {
+    try { module ? new vm.SourceTextModule(source) : new vm.Script(source); return true; }
+    catch (e) { return false; }
+})));
+"""
+
+
+def _js_blocks(html):
+    """(source, is_module) for every JavaScript <script> block"""
+    blocks = []
+    for attrs, body in _SCRIPT_BLOCK.findall(html):
+        kind = re.search(r'type\s*=\s*["\']?([^"\'\s>]*)', attrs, re.I)
+        kind = kind.group(1).lower() if kind else ''
+        if kind in ("", "text/javascript", "application/javascript", "module"):
+            blocks.append((body, kind == "module"))
+    return blocks
+
+
+def _node_parses(blocks):
+    """Which blocks node can compile (None when node isn't installed)"""
+    node = shutil.which("node")
+    if not node or not blocks:
+        return None if not node else []
+    out = subprocess.run([node, "--experimental-vm-modules", "--no-warnings", "-e", _NODE_CHECK],
+                         input=json.dumps(blocks), capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def bench_minify(args):
+    """Lexer minifier vs the old regex passes: speed, size and correctness"""
+    files = _corpus(args.root)
+    texts = [f.read_text(encoding='utf-8', errors='ignore') for f in files]
+    corpus = ''.join(texts)
+    print(f"✂️  Minifier benchmark on {len(files)} HTML files ({len(corpus) / 1024 / 1024:.1f} MB)")
+
+    before, before_s = _throughput(lambda: [_optimize_reference(t) for t in texts], corpus)
+    after, after_s = _throughput(lambda: [minify(t) for t in texts], corpus)
+    old = [_optimize_reference(t) for t in texts]
+    new = [minify(t) for t in texts]
+    print(f"   Before (5 regex passes): {before:6.1f} MB/s ({before_s:.3f}s) "
+          f"→ {sum(map(len, old)) / len(corpus):.1%} of input")
+    print(f"   After  (Minifier):       {after:6.1f} MB/s ({after_s:.3f}s) "
+          f"→ {sum(map(len, new)) / len(corpus):.1%} of input")
+
+    urls = [set(_URL.findall(t)) for t in texts]
+    total = sum(map(len, urls))
+    kept_old = sum(sum(u in o for u in found) for found, o in zip(urls, old))
+    kept_new = sum(sum(u in n for u in found) for found, n in zip(urls, new))
+    print(f"   URLs kept: before {kept_old}/{total}, after {kept_new}/{total} "
+          f"(the rest only appear in comments)")
+
+    failures = []
+    for html_file, text, out in zip(files, texts, new):
+        streamed = Minifier()
+        chunks = ''.join(streamed.feed(text[i:i + 997]) for i in range(0, len(text), 997))
+        if chunks + streamed.flush() != out:
+            failures.append((html_file, "streamed output differs"))
+        if minify(out) != out:
+            failures.append((html_file, "not idempotent"))
+
+    # Every script that compiled before minifying must still compile
+    pairs = [(f, _js_blocks(t), _js_blocks(o)) for f, t, o in zip(files, texts, new)]
+    checked = broken = 0
+    for html_file, original, minified in pairs:
+        if len(original) != len(minified):
+            continue    # commented-out <script> blocks were dropped
+        parsed = _node_parses(original + minified)
+        if parsed is None:
+            print("   (node not found: skipping the JavaScript parse check)")
+            break
+        for ok_before, ok_after in zip(parsed[:len(original)], parsed[len(original):]):
+            checked += ok_before
+            if ok_before and not ok_after:
+                broken += 1
+                failures.append((html_file, "a <script> no longer parses"))
+    print(f"   Scripts still parsing after minify: {checked - broken}/{checked}")
+
+    print(f"   Exact stream + idempotent + parsing: "
+          f"{len(files) - len({f for f, _ in failures})}/{len(files)}")
+    for html_file, reason in failures:
+        print(f"   ✗ {html_file}: {reason}")
+    return 1 if failures else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EUG compression benchmarks")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    xor = sub.add_parser("xor", help="XOR engine throughput")
+    xor.add_argument("--size-mb", type=float, default=8.0)
+    xor.set_defaults(func=bench_xor)
+
+    symbols = sub.add_parser("symbols", help="Symbol substitution throughput + round-trip")
+    symbols.add_argument("--root", default=".")
+    symbols.set_defaults(func=bench_symbols)
+
+    roundtrip = sub.add_parser("roundtrip", help="Generated-file decode correctness + throughput")
+    roundtrip.add_argument("--root", default=".")
+    roundtrip.set_defaults(func=bench_roundtrip)
+
+    stream = sub.add_parser("stream", help="Streaming html_to_py peak memory")
+    stream.add_argument("--size-mb", type=float, default=200.0)
+    stream.add_argument("--in-memory", action="store_true",
+                        help="Also measure the whole-file path (needs several GB at 200 MB)")
+    stream.set_defaults(func=bench_stream)
+
+    entropy = sub.add_parser("entropy", help="Entropy backend ratios + throughput")
+    entropy.add_argument("--root", default=".")
+    entropy.set_defaults(func=bench_entropy)
+
+    dictionary = sub.add_parser("dictionary", help="Shared zlib dictionary gain by page size")
+    dictionary.add_argument("--root", default=".")
+    dictionary.add_argument("--size-kb", type=int, default=32)
+    dictionary.set_defaults(func=bench_dictionary)
+
+    batch = sub.add_parser("batch", help="Serial vs parallel batch compression")
+    batch.add_argument("--root", default=".")
+    batch.add_argument("--workers", type=int, default=None)
+    batch.set_defaults(func=bench_batch)
+
+    container = sub.add_parser("container", help=".py wrapper vs .eug container size + decode")
+    container.add_argument("--root", default=".")
+    container.set_defaults(func=bench_container)
+
+    archive = sub.add_parser("archive", help="Per-file outputs vs one seekable archive")
+    archive.add_argument("--root", default=".")
+    archive.set_defaults(func=bench_archive)
+
+    minify_bench = sub.add_parser("minify", help="Lexer minifier vs regex passes")
+    minify_bench.add_argument("--root", default=".")
+    minify_bench.set_defaults(func=bench_minify)
+
+    verify = sub.add_parser("verify", help="Decode-side verification cost + batch sampling")
+    verify.add_argument("--root", default=".")
+    verify.set_defaults(func=bench_verify)
+
+    blocks = sub.add_parser("blocks", help="Block index size overhead + preview read speed")
+    blocks.add_argument("--root", default=".")
+    blocks.add_argument("--size-mb", type=float, default=16)
+    blocks.set_defaults(func=bench_blocks)
+
+    static = sub.add_parser("static", help="Pre-compressed static variants vs request-time gzip")
+    static.add_argument("--root", default=".")
+    static.set_defaults(func=bench_static)
+
+    multi_ai = sub.add_parser("multi-ai", help="Sequential vs parallel specialist AIs")
+    multi_ai.add_argument("--root", default=".")
+    multi_ai.add_argument("--size-mb", type=float, default=4)
+    multi_ai.add_argument("--workers", type=int, default=None)
+    multi_ai.set_defaults(func=bench_multi_ai)
+
+    scheduler = sub.add_parser("scheduler", help="Multi-file scheduler throughput + tail latency")
+    scheduler.add_argument("--root", default=".")
+    scheduler.add_argument("--workers", type=int, default=None)
+    scheduler.set_defaults(func=bench_scheduler)
+
+    learning = sub.add_parser("learning", help="Rule-based vs learned specialist choice")
+    learning.add_argument("--root", default=".")
+    learning.add_argument("--passes", type=int, default=4)
+    learning.add_argument("--explore", type=float, default=0.1)
+    learning.set_defaults(func=bench_learning)
+
+    features = sub.add_parser("features", help="Routing feature extraction speed")
+    features.add_argument("--root", default=".")
+    features.add_argument("--top", type=int, default=10)
+    features.set_defaults(func=bench_features)
+
+    race = sub.add_parser("race", help="Assigned specialist vs race mode + budget cut-off")
+    race.add_argument("--root", default=".")
+    race.add_argument("--k", type=int, default=4)
+    race.add_argument("--budget", type=float, default=2.0)
+    race.add_argument("--size-mb", type=float, default=4)
+    race.add_argument("--workers", type=int, default=None)
+    race.set_defaults(func=bench_race)
+
+    validation = sub.add_parser("validation", help="Cheap-first validators + speculative fallback")
+    validation.add_argument("--root", default=".")
+    validation.add_argument("--size-mb", type=float, default=4)
+    validation.add_argument("--workers", type=int, default=None)
+    validation.set_defaults(func=bench_validation)
+
+    orchestrator = sub.add_parser("orchestrator", help="Startup cost + long-lived per-call overhead")
+    orchestrator.add_argument("--calls", type=int, default=2000)
+    orchestrator.add_argument("--threads", type=int, default=4)
+    orchestrator.set_defaults(func=bench_orchestrator)
+
+    trace = sub.add_parser("trace", help="Per-stage time and bytes of a batch run + span cost")
+    trace.add_argument("--root", default=".")
+    trace.add_argument("--workers", type=int, default=1)
+    trace.add_argument("--spans", type=int, default=100000)
+    trace.set_defaults(func=bench_trace)
+
+    logging_bench = sub.add_parser("logging", help="Per-file cost of each output mode")
+    logging_bench.add_argument("--root", default=".")
+    logging_bench.add_argument("--repeat", type=int, default=5)
+    logging_bench.set_defaults(func=bench_logging)
+
+    formats = sub.add_parser("formats", help="JSON/SVG/Markdown codecs vs the generic path")
+    formats.add_argument("--root", default=".")
+    formats.set_defaults(func=bench_formats)
+
+    child = sub.add_parser("stream-child")
+    child.add_argument("path")
+    child.add_argument("out")
+    child.add_argument("--mode", choices=["stream", "memory"])
+    child.set_defaults(func=bench_stream_child)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
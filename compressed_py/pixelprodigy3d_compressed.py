@@ -1,69 +0,0 @@
-"""
-╔══════════════════════════════════════════════════════════════════╗
-║  EUG COMPRESSED FILE - NFT-Ready Crypto-Signed                  ║
-║  Original: pixelprodigy3d.html                                  ║
-║  Compressed: 2025-10-21T11:41:03.458002                        ║
-╚══════════════════════════════════════════════════════════════════╝
-
-AI PERSONALITY COMPRESSION:
-• AI #67 (Financial Advisor): Optimized compression ratio
-• AI #1 (Visionary Artist): Applied 3D symbolic language
-• AI #82 (Career Coach): Validated file integrity
-
-NFT METADATA:
-• Original Hash: 3a591411c34fd4be7b856eb7cdfbdbd64ec08aa718bb651c1ee4e02e348e8a76
-• Original Size: 79,268 bytes
-• Compressed Size: 368 bytes
-• Compression Ratio: 99.5%
-• XOR Key: "eug"
-• Strategy: medium
-• Content Type: 3d_environment
-
-DECOMPRESSION:
-1. Base64 decode the encrypted data
-2. XOR decrypt with "eug" key
-3. Convert 3D symbols back to HTML
-4. Validate integrity with original hash
-"""
-
-# EUG Compression System
-import base64
-
-class EugDecompressor:
-    def __init__(self):
-        self.xor_key = b"eug"
-        self.symbol_map = self._get_reverse_map()
-    
-    def _get_reverse_map(self):
-        # Reverse symbol mapping for decompression
-        return {
-            # Symbols generated during compression
-        }
-    
-    def xor_decrypt(self, encrypted_data, key):
-        key_repeated = (key * (len(encrypted_data) // len(key) + 1))[:len(encrypted_data)]
-        return bytes(a ^ b for a, b in zip(encrypted_data, key_repeated))
-    
-    def decompress(self):
-        # Decrypt
-        encrypted = base64.b64decode(compressed_data)
-        decrypted = self.xor_decrypt(encrypted, self.xor_key)
-        symbolic = decrypted.decode('utf-8')
-        
-        # Convert symbols back to HTML
-        html = symbolic
-        for symbol, original in self.symbol_map.items():
-            html = html.replace(symbol, original)
-        
-        return html
-    
-    def get_original(self):
-        return self.decompress()
-
-# Compressed Data (XOR encrypted + Base64 encoded)
-compressed_data = """h+rPRDEoJiE+NTBHDQEKCZf4zJf4zR0TCBlHCRQJApfO0Jf4zxAJh+rNh+rOh+rPlerAxZf4zJf4zZf055rf6lUEDRQVFhATh9zSh+rNMCEhSJf2wpf4z5f4zJf4zZf055rf6lUJBBgCh9zSh+rNExwCEgUIFwGF+t9HBhoJERAJEZfO0Jf4zwIOAQEPh9zSARARDBYCSAIOAQEPSVUOCxwTDBQLSAYEBBkCh9zSh+THS5f0z5f4z5f4zJf4zYX49OSF+tw3DA0CCSUVChEOAgxHMBuF+OYOABFHSFWF9NcjRTIVDBFHMBsOExAVFhCF+t2F7eCX+uT2h+rOh+rPh+/GRQYVBpfO0Jf4zx0TEQUUXw=="""
-
-# Usage:
-# decompressor = EugDecompressor()
-# original_html = decompressor.get_original()
-# print(original_html)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════╗
+║  EUG COMPRESSION CACHE - Content-Addressed Incremental Builds   ║
+║  Skip unchanged HTML, reuse the artifact it produced last time  ║
+╚══════════════════════════════════════════════════════════════════╝
+
+Every compressed file is stored under a key built from:
+• SHA-256 of the input bytes
+• The codec version (compressor, codebook, entropy backend, dictionary)
+• The output file name it was written as
+
+A stat manifest remembers each file's hash, so an unchanged input costs
+one stat() instead of a read + hash, and a hit at most one file copy.
+The cache is bounded by total artifact size and is evicted least
+recently used first.
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+
+CACHE_DIR = ".eug_cache"
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_hash(path):
+    """SHA-256 of a file's bytes, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def atomic_write_text(path, text):
+    """Write via a temp file + rename, so readers never see a partial file"""
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class HashManifest:
+    """
+    (path, size, mtime_ns, inode) → SHA-256, so files whose stat signature
+    hasn't changed skip both the read and the hash. A file modified within
+    RACY_WINDOW_NS of being hashed is rehashed next time, since a second
+    write in that window could keep the same size and mtime.
+    """
+
+    RACY_WINDOW_NS = 2 * 10**9
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.reads = 0
+        self._dirty = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def hash(self, path):
+        key = os.path.abspath(path)
+        st = os.stat(path)
+        signature = [st.st_size, st.st_mtime_ns, st.st_ino]
+        entry = self._entries.get(key)
+        if entry and entry[:3] == signature and \
+                st.st_mtime_ns + self.RACY_WINDOW_NS < entry[4]:
+            return entry[3]
+
+        digest = file_hash(path)
+        self.reads += 1
+        self._entries[key] = signature + [digest, time.time_ns()]
+        self._dirty = True
+        return digest
+
+    def save(self):
+        """Write the manifest, first dropping entries for files that no longer exist"""
+        missing = [key for key in self._entries if not os.path.exists(key)]
+        for key in missing:
+            del self._entries[key]
+        if self._dirty or missing:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self.path, json.dumps(self._entries))
+            self._dirty = False
+
+
+class CompressionCache:
+    """
+    Persistent artifact store for html_to_py results. The index lives in
+    <root>/index.json, artifacts in <root>/objects/<key>.
+    """
+
+    def __init__(self, root=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._clock = 0
+        self._entries = {}
+        self._load()
+        self.manifest = HashManifest(self.root / "manifest.json")
+
+    def _load(self):
+        try:
+            with open(self.root / "index.json", 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+        self._entries = index.get("entries", {})
+        self._clock = index.get("clock", 0)
+
+    def input_hash(self, path):
+        """SHA-256 of path, via the stat manifest"""
+        return self.manifest.hash(path)
+
+    def save(self):
+        """Persist the index and manifest (called after every batch)"""
+        self.manifest.save()
+        self.root.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.root / "index.json", json.dumps(
+            {"clock": self._clock, "entries": self._entries}, indent=1))
+
+    @staticmethod
+    def key(input_hash, codec_version, output_name):
+        return hashlib.sha256(
+            f"{input_hash}\0{codec_version}\0{output_name}".encode('utf-8')).hexdigest()
+
+    def _touch(self, key):
+        self._clock += 1
+        self._entries[key]["used"] = self._clock
+
+    def lookup(self, key, output_path):
+        """
+        On a hit, make sure output_path holds the cached artifact and
+        return the stored result; otherwise return None
+        """
+        entry = self._entries.get(key)
+        artifact = self.objects / key
+        if entry is None or not artifact.exists():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        output_path = Path(output_path)
+        try:
+            current = self.manifest.hash(output_path) == entry["artifact_hash"]
+        except OSError:
+            current = False
+        if not current:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(artifact, output_path)
+
+        self._touch(key)
+        self.hits += 1
+        return dict(entry["result"], output=str(output_path), cached=True)
+
+    def discard(self, key):
+        """Forget key and delete its artifact (e.g. one that failed verification)"""
+        self._entries.pop(key, None)
+        (self.objects / key).unlink(missing_ok=True)
+
+    def store(self, key, result):
+        """Keep a copy of result['output'] under key, then evict if over budget"""
+        self.objects.mkdir(parents=True, exist_ok=True)
+        artifact = self.objects / key
+        shutil.copyfile(result['output'], artifact)
+        self._entries[key] = {
+            "size": artifact.stat().st_size,
+            "artifact_hash": file_hash(artifact),
+            "result": result,
+        }
+        self._touch(key)
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used artifacts until under max_bytes"""
+        total = sum(entry["size"] for entry in self._entries.values())
+        for key in sorted(self._entries, key=lambda k: self._entries[k]["used"]):
+            if total <= self.max_bytes:
+                break
+            total -= self._entries.pop(key)["size"]
+            (self.objects / key).unlink(missing_ok=True)
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+        self._entries = {}
+        self._clock = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def size(self):
+        return sum(entry["size"] for entry in self._entries.values())
@@ -0,0 +1,885 @@
+"""
+╔══════════════════════════════════════════════════════════════════╗
+║  EUG CODEC RUNTIME - Shared Primitives for the EUG Pipeline     ║
+║  Used by the compressors AND by every generated decompressor    ║
+╚══════════════════════════════════════════════════════════════════╝
+
+This module is stdlib-only on purpose: `install_runtime()` copies it
+next to the generated `*_compressed.py` files so they can import it
+without the rest of PixelProdigyAI being on the path.
+
+CONTENTS:
+• xor_bytes(): whole-buffer XOR with a repeating key (word-wide ints)
+• SymbolCodec: single-pass, reversible 3D symbol substitution
+• CODEBOOKS / load_codebook(): the versioned symbol tables
+• ENTROPY_BACKENDS: pluggable zlib / lzma / bz2 entropy coding
+• PayloadDecoder / digest_payload(): chunked decode + incremental SHA-256
+• load_dictionary(): shared zlib preset dictionaries, addressed by hash
+• .eug containers: compact binary alternative to the generated .py files
+• EugContainer: lazy per-block reads of block-indexed .eug files
+• .euga archives: many containers + a central index, one seek per page
+"""
+
+import re
+import sys
+import json
+import mmap
+import base64
+import codecs
+import struct
+import hashlib
+import bz2
+import lzma
+import zlib
+import shutil
+from pathlib import Path
+
+RUNTIME_FILENAME = "eug_codec.py"
+
+# XOR works on blocks of this many bytes so huge inputs never need a
+# second full-size integer in memory at once.
+XOR_BLOCK_SIZE = 1 << 18
+
+
+def xor_bytes(data, key, offset=0):
+    """
+    XOR `data` with `key` repeated, starting `offset` bytes into the key
+    stream. The whole block is XORed as one big integer instead of one
+    byte at a time, which is what makes multi-MB bundles fast.
+    """
+    if not key:
+        raise ValueError("XOR key must not be empty")
+
+    data = memoryview(data).cast('B')
+    size = len(data)
+    key_len = len(key)
+    block = min(size, XOR_BLOCK_SIZE)
+    # One pre-built key stream, long enough for any phase of a full block
+    key_stream = bytes(key) * (block // key_len + 2)
+
+    out = bytearray(size)
+    for start in range(0, size, XOR_BLOCK_SIZE):
+        chunk = data[start:start + XOR_BLOCK_SIZE]
+        n = len(chunk)
+        phase = (offset + start) % key_len
+        mixed = (int.from_bytes(chunk, 'little') ^
+                 int.from_bytes(key_stream[phase:phase + n], 'little'))
+        out[start:start + n] = mixed.to_bytes(n, 'little')
+    return bytes(out)
+
+
+# Marks a symbol that appeared literally in the source (Private Use Area,
+# so it never shows up in real HTML by accident).
+SYMBOL_ESCAPE = '\ue000'
+VARIATION_SELECTOR = '\ufe0f'
+
+
+def _trie_pattern(words):
+    """
+    Build a regex alternation factored as a prefix trie. Python's `re`
+    tries alternatives in order, so the trie both dispatches on the first
+    character and makes every match the longest one at its position.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(ch) + build(child)
+                    for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        if len(branches) == 1 and '' not in node:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')' + ('?' if '' in node else '')
+
+    return build(trie)
+
+
+class _TokenTable(dict):
+    """Token → replacement lookup that resolves unseen tokens on demand"""
+    def __init__(self, entries, resolve):
+        super().__init__(entries)
+        self._resolve = resolve
+
+    def __missing__(self, token):
+        value = self[token] = self._resolve(token)
+        return value
+
+
+class SymbolCodec:
+    """
+    Compiled HTML ↔ 3D-symbol substitution.
+
+    Encoding is one leftmost-longest scan, so results no longer depend on
+    the order of the symbol map ('form' is not first rewritten to '🔁m'
+    by a shorter key applied earlier). Symbols that already occur in the
+    source are escaped with SYMBOL_ESCAPE, which makes decoding exact.
+    """
+    # Any non-ASCII character (plus an optional emoji selector) is a
+    # candidate symbol; the token tables decide what it really is.
+    _NON_ASCII = '[^\x00-\x7f]' + VARIATION_SELECTOR + '?'
+
+    def __init__(self, symbol_map):
+        self.symbol_map = dict(symbol_map)
+        self.reverse_map = {symbol: original for original, symbol in self.symbol_map.items()}
+        self._validate()
+
+        # ASCII characters that can be part of an encode token
+        self._token_chars = frozenset(''.join(self.symbol_map))
+        self._encode_table = _TokenTable(self.symbol_map, self._encode_token)
+        self._decode_table = _TokenTable(self.reverse_map, self._decode_token)
+        # The leading lookahead lets the regex engine reject most positions
+        # with a single character-class test before trying the trie.
+        starts = ''.join(sorted({re.escape(original[0]) for original in self.symbol_map}))
+        self._encode_re = re.compile(
+            '(?=[' + starts + '\\x80-\\U0010ffff])'
+            '(' + _trie_pattern(self.symbol_map) + '|' + self._NON_ASCII + ')')
+        self._decode_re = re.compile('(' + SYMBOL_ESCAPE + '?' + self._NON_ASCII + ')')
+
+    def _validate(self):
+        if len(self.reverse_map) != len(self.symbol_map):
+            raise ValueError("Symbol map is not reversible: duplicate symbols")
+        for original, symbol in self.symbol_map.items():
+            if not original or not original.isascii():
+                raise ValueError(f"Symbol map keys must be non-empty ASCII: {original!r}")
+            # One code point, optionally followed by the emoji presentation
+            # selector. Anything longer could be spelled by neighbouring
+            # tokens and would make decoding ambiguous.
+            base, selector = symbol[:1], symbol[1:]
+            if (not base or base.isascii() or base in (SYMBOL_ESCAPE, VARIATION_SELECTOR) or
+                    selector not in ('', VARIATION_SELECTOR)):
+                raise ValueError(f"Unsupported symbol for {original!r}: {symbol!r}")
+            if selector and base in self.reverse_map:
+                raise ValueError(f"Symbol {base!r} is a prefix of {symbol!r}")
+
+    def split_point(self, text):
+        """
+        Index where `text` can be cut without splitting a token, for chunked
+        encoding: everything before it encodes exactly as it would inside
+        the full text. Returns 0 if no such point exists yet.
+        """
+        for i in range(len(text) - 1, -1, -1):
+            ch = text[i]
+            if ch.isascii() and ch not in self._token_chars:
+                return i + 1
+        return 0
+
+    def decode_split_point(self, text):
+        """
+        split_point() for symbolic text: an index that is neither right
+        after SYMBOL_ESCAPE nor right before a VARIATION_SELECTOR, so no
+        decode token straddles the cut. Returns 0 if there is none yet.
+        """
+        for i in range(len(text) - 1, 0, -1):
+            if text[i] != VARIATION_SELECTOR and text[i - 1] != SYMBOL_ESCAPE:
+                return i
+        return 0
+
+    def _encode_token(self, token):
+        # A non-ASCII run from the source: escape it if it reads as a symbol
+        if token in self.reverse_map or token == SYMBOL_ESCAPE:
+            return SYMBOL_ESCAPE + token
+        if len(token) == 2:
+            return self._encode_table[token[0]] + token[1]
+        return token
+
+    def _decode_token(self, token):
+        if token[0] == SYMBOL_ESCAPE and len(token) > 1:
+            # Escaped literal: the body is source text, never a symbol
+            return token[1:]
+        if len(token) == 2:
+            return self._decode_table[token[0]] + token[1]
+        return token
+
+    def _substitute(self, pattern, table, text):
+        # split() keeps matches at the odd indices; mapping them in place
+        # and joining once avoids a Python callback per match.
+        parts = pattern.split(text)
+        parts[1::2] = map(table.__getitem__, parts[1::2])
+        return ''.join(parts)
+
+    def encode(self, text):
+        """HTML → 3D symbols in one pass"""
+        return self._substitute(self._encode_re, self._encode_table, text)
+
+    def decode(self, symbolic):
+        """3D symbols → HTML in one pass (exact inverse of encode)"""
+        return self._substitute(self._decode_re, self._decode_table, symbolic)
+
+
+_codec_cache = {}
+
+
+def get_symbol_codec(symbol_map):
+    """Return the process-wide compiled codec for this symbol map"""
+    cache_key = tuple(symbol_map.items())
+    codec = _codec_cache.get(cache_key)
+    if codec is None:
+        codec = _codec_cache[cache_key] = SymbolCodec(symbol_map)
+    return codec
+
+
+# 3D Symbolic Language: Emoticons → Vertex Symbols. Generated files store
+# only the version number and load the table from here. Version 1 was the
+# original map; it reused symbols and could never be decoded.
+CODEBOOK_VERSION = 2
+
+CODEBOOKS = {
+    2: {
+        # HTML Structure
+        '<': '⟨',      # Start angle
+        '>': '⟩',      # End angle
+        '/': '∕',      # Division/closing
+        '=': '⩵',      # Equals
+        '"': '⟪',      # Quote start
+        "'": '⟫',      # Quote end
+
+        # Common HTML Tags → 3D Symbols
+        'div': '◻',    # Box/container
+        'span': '◇',   # Diamond/inline
+        'button': '▣', # Button
+        'input': '☐',  # Input box
+        'canvas': '▦', # Grid/canvas
+        'script': '⚡', # Lightning/code
+        'style': '🎨', # Art/styling
+        'body': '🧍', # Body/human
+        'head': '🧠', # Brain/head
+        'title': '👑', # Crown/title
+        'meta': 'Ⓜ️',   # Meta info
+        'link': '🔗', # Chain/link
+
+        # Three.js/3D → Vertex Symbols
+        'THREE.': '△',  # Triangle (Three.js)
+        'Scene': '🌍', # World/scene
+        'Camera': '📷', # Camera
+        'Renderer': '🖼️', # Frame/render
+        'Mesh': '◬',   # Geometric mesh
+        'Geometry': '⬡', # Hexagon/geometry
+        'Material': '✨', # Sparkle/material
+        'Light': '💡', # Bulb/light
+        'Vector3': '➚',  # 3D vector
+
+        # CSS → Style Symbols
+        'background': '🎭', # Background/backdrop
+        'color': '🖌',  # Brush/color
+        'font': '📝',   # Text/font
+        'border': '▭',  # Border frame
+        'margin': '↔️',  # Spacing
+        'padding': '⇆', # Inner spacing
+        'position': '📍', # Position pin
+        'display': '👁️', # Display/eye
+        'flex': '🔄',   # Flex/rotation
+
+        # JavaScript → Logic Symbols
+        'function': '⚙️', # Gear/function
+        'const': '📌',  # Pin/constant
+        'let': '🔀',    # Variable/change
+        'var': '📦',    # Box/variable
+        'if': '❓',     # Question/conditional
+        'else': '❔',   # Alt question
+        'for': '🔁',    # Loop
+        'while': '♻️',  # Recycle/loop
+        'return': '↩️', # Return arrow
+        'new': '🆕',    # New
+
+        # Common Values → Numeric Symbols
+        'true': '✓',   # Check
+        'false': '✗',  # X
+        'null': '∅',   # Empty set
+        'undefined': '⍰', # Unknown
+        '0': '⓪',
+        '1': '①',
+        '2': '②',
+        '3': '③',
+        '4': '④',
+        '5': '⑤',
+        '6': '⑥',
+        '7': '⑦',
+        '8': '⑧',
+        '9': '⑨',
+    },
+}
+
+
+def load_codebook(version=CODEBOOK_VERSION):
+    """Compiled SymbolCodec for a codebook version, built once per process"""
+    if version not in CODEBOOKS:
+        raise ValueError(f"Unknown EUG codebook version: {version}")
+    return get_symbol_codec(CODEBOOKS[version])
+
+
+class _Passthrough:
+    """Entropy backend that stores bytes as-is (compressobj-style API)"""
+    def compress(self, data):
+        return bytes(data)
+
+    def flush(self):
+        return b''
+
+    decompress = compress
+
+
+class _StreamDecompressor:
+    """
+    decompressobj-style .decompress()/.flush() that rejects a cut-off
+    stream. Back-to-back streams (the blocks of a block-indexed .eug)
+    decode as one: a fresh decompressor picks up where the last ended.
+    """
+    def __init__(self, factory):
+        self._factory = factory
+        self._decompressor = factory()
+
+    def decompress(self, data):
+        out = self._decompressor.decompress(data)
+        while self._decompressor.eof and self._decompressor.unused_data:
+            rest = self._decompressor.unused_data
+            self._decompressor = self._factory()
+            out += self._decompressor.decompress(rest)
+        return out
+
+    def flush(self):
+        tail = self._decompressor.flush() if hasattr(self._decompressor, 'flush') else b''
+        if not self._decompressor.eof:
+            raise ValueError("Truncated entropy-coded payload")
+        return tail
+
+
+def _zlib_compressor(level, zdict):
+    return zlib.compressobj(level, zdict=zdict) if zdict else zlib.compressobj(level)
+
+
+def _zlib_decompress(data, zdict):
+    decompressor = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+    return decompressor.decompress(data) + decompressor.flush()
+
+
+def _zlib_decompressor(zdict):
+    return _StreamDecompressor(
+        lambda: zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj())
+
+
+# Entropy coding sits between the symbol stage and XOR/Base64. Each backend
+# is (streaming compressor factory(level, zdict), decompress(data, zdict),
+# streaming decompressor factory(zdict)).
+ENTROPY_BACKENDS = {
+    "none": (lambda level, zdict: _Passthrough(), lambda data, zdict: bytes(data),
+             lambda zdict: _Passthrough()),
+    "zlib": (_zlib_compressor, _zlib_decompress, _zlib_decompressor),
+    "lzma": (lambda level, zdict: lzma.LZMACompressor(preset=level),
+             lambda data, zdict: lzma.decompress(data),
+             lambda zdict: _StreamDecompressor(lzma.LZMADecompressor)),
+    "bz2": (lambda level, zdict: bz2.BZ2Compressor(level),
+            lambda data, zdict: bz2.decompress(data),
+            lambda zdict: _StreamDecompressor(bz2.BZ2Decompressor)),
+}
+
+# Backends that can start from a preset (shared) dictionary
+DICTIONARY_BACKENDS = {"zlib"}
+
+
+def _entropy_backend(name, zdict=None):
+    if name not in ENTROPY_BACKENDS:
+        raise ValueError(f"Unknown entropy backend: {name}")
+    if zdict and name not in DICTIONARY_BACKENDS:
+        raise ValueError(f"Entropy backend {name} does not support a shared dictionary")
+    return ENTROPY_BACKENDS[name]
+
+
+def entropy_compressor(name, level, zdict=None):
+    """Streaming compressor with .compress(data) and .flush()"""
+    return _entropy_backend(name, zdict)[0](level, zdict)
+
+
+def entropy_compress(data, name, level, zdict=None):
+    compressor = entropy_compressor(name, level, zdict)
+    return compressor.compress(data) + compressor.flush()
+
+
+def entropy_decompress(data, name, zdict=None):
+    return _entropy_backend(name, zdict)[1](data, zdict)
+
+
+def entropy_decompressor(name, zdict=None):
+    """Streaming decompressor with .decompress(data) and .flush()"""
+    return _entropy_backend(name, zdict)[2](zdict)
+
+
+# ═══════════════════════════════════════════════════════════════════
+# STREAMING DECODE + VERIFICATION
+# ═══════════════════════════════════════════════════════════════════
+
+VERIFY_CHUNK_SIZE = 1 << 20
+
+
+class PayloadDecoder:
+    """
+    The payload pipeline run backwards, one chunk at a time:
+    [Base64 →] XOR → entropy decode → UTF-8 → 3D symbols → HTML.
+
+    feed() takes any chunking of the payload bytes and returns the HTML
+    that is settled so far; flush() returns the rest and raises
+    ValueError if the payload was cut off. text=True means the payload
+    is Base64 (as in the generated .py files); xor_key=None skips XOR
+    and codebook_version=None the symbol stage. xor_offset is the key
+    phase of the first byte, for a block read from mid-payload.
+    """
+
+    def __init__(self, entropy_backend="none", codebook_version=None, zdict=None,
+                 xor_key=b"eug", text=False, xor_offset=0):
+        self.xor_key = xor_key
+        self.text = text
+        self.codec = load_codebook(codebook_version) if codebook_version is not None else None
+        self._inflater = entropy_decompressor(entropy_backend, zdict)
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._offset = xor_offset
+        self._base64 = b''
+        self._symbols = ''
+
+    def feed(self, data):
+        if self.text:
+            data = self._base64 + bytes(data)
+            cut = len(data) - len(data) % 4
+            self._base64 = data[cut:]
+            data = base64.b64decode(data[:cut], validate=True)
+        return self._decode(self._inflater.decompress(self._xor(data)))
+
+    def flush(self):
+        if self._base64:
+            raise ValueError("Truncated Base64 payload")
+        return self._decode(self._inflater.flush(), final=True)
+
+    def _xor(self, data):
+        if not self.xor_key or not data:
+            return data
+        data = xor_bytes(data, self.xor_key, self._offset)
+        self._offset += len(data)
+        return data
+
+    def _decode(self, data, final=False):
+        text = self._utf8.decode(data, final)
+        if self.codec is None:
+            return text
+        text = self._symbols + text
+        cut = len(text) if final else self.codec.decode_split_point(text)
+        self._symbols = text[cut:]
+        return self.codec.decode(text[:cut])
+
+
+def digest_payload(source, size, decoder, chunk_size=VERIFY_CHUNK_SIZE):
+    """
+    Decode `size` payload bytes read from the file object `source` and
+    hash the HTML as it comes out, so memory stays at one chunk.
+    Returns (SHA-256 hex digest, decoded UTF-8 size).
+    """
+    digest = hashlib.sha256()
+    decoded = 0
+    while size > 0:
+        chunk = source.read(min(chunk_size, size))
+        if not chunk:
+            raise ValueError("Truncated EUG payload")
+        size -= len(chunk)
+        html = decoder.feed(chunk).encode('utf-8')
+        digest.update(html)
+        decoded += len(html)
+    html = decoder.flush().encode('utf-8')
+    digest.update(html)
+    return digest.hexdigest(), decoded + len(html)
+
+
+# Shared dictionaries are stored as eug_dict_<id>.zdict, where the id is
+# the start of the SHA-256 of the dictionary bytes.
+DICTIONARY_PATTERN = "eug_dict_{}.zdict"
+
+_dictionary_cache = {}
+
+
+def dictionary_id(data):
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def save_dictionary(data, directory=None):
+    """Write a trained dictionary (next to this runtime by default), return its id"""
+    dict_id = dictionary_id(data)
+    dictionary_path(dict_id, directory).write_bytes(data)
+    return dict_id
+
+
+def dictionary_path(dict_id, directory=None):
+    """Dictionary file for an id; defaults to the directory of this runtime"""
+    directory = Path(__file__).parent if directory is None else Path(directory)
+    return directory / DICTIONARY_PATTERN.format(dict_id)
+
+
+def load_dictionary(dict_id, directory=None):
+    """Dictionary bytes for an id, verified against the id and cached"""
+    if dict_id not in _dictionary_cache:
+        data = dictionary_path(dict_id, directory).read_bytes()
+        if dictionary_id(data) != dict_id:
+            raise ValueError(f"EUG dictionary {dict_id} does not match its hash")
+        _dictionary_cache[dict_id] = data
+    return _dictionary_cache[dict_id]
+
+
+def install_runtime(output_dir, dict_id=None):
+    """
+    Copy this module into `output_dir` so generated files can import it,
+    along with the shared dictionary they reference (if any)
+    """
+    sources = [Path(__file__)]
+    if dict_id:
+        sources.append(dictionary_path(dict_id))
+    for source in sources:
+        target = Path(output_dir) / source.name
+        if not target.exists() or target.read_bytes() != source.read_bytes():
+            shutil.copyfile(source, target)
+    return Path(output_dir) / RUNTIME_FILENAME
+
+
+# ═══════════════════════════════════════════════════════════════════
+# .eug BINARY CONTAINER
+# ═══════════════════════════════════════════════════════════════════
+#
+# A fixed little-endian header followed by the raw payload (entropy coded,
+# then XORed with the key when FLAG_XOR is set). Reading one needs only
+# this module: no Base64, no generated code to exec.
+#
+#   magic        4s   b"EUG\x00"
+#   version      B    CONTAINER_VERSION
+#   backend      B    entropy backend id (CONTAINER_BACKENDS)
+#   codebook     B    symbol codebook version
+#   flags        B    FLAG_XOR
+#   dictionary   8s   shared dictionary id (raw), zeros for none
+#   source_hash  32s  SHA-256 of the original HTML
+#   content_hash 32s  SHA-256 of what decoding reproduces
+#   source_size  Q    original HTML size
+#   content_size Q    decoded UTF-8 size
+#   payload_size Q    bytes of payload after the header
+#
+# With FLAG_BLOCKS the page is split into sections (<head>, big <script>
+# and <style> elements, body text, at most a block size each) that are
+# entropy coded independently, back to back, with the XOR key phase
+# running on across the whole payload. A UTF-8 JSON block index follows
+# the payload: {"blocks": [[kind, tag, length, size, hash], ...]}, in
+# payload order: length is the block's payload bytes, size its decoded
+# UTF-8 bytes and hash the first BLOCK_HASH_SIZE hex digits of their
+# SHA-256 (the header's content hash still covers the whole page). Any
+# one block can then be decoded without touching the others (EugContainer).
+
+CONTAINER_MAGIC = b"EUG\x00"
+CONTAINER_VERSION = 1
+CONTAINER_HEADER = struct.Struct("<4sBBBB8s32s32sQQQ")
+CONTAINER_BACKENDS = {"none": 0, "zlib": 1, "lzma": 2, "bz2": 3}
+CONTAINER_XOR_KEY = b"eug"
+FLAG_XOR = 0x01
+FLAG_BLOCKS = 0x02
+BLOCK_HASH_SIZE = 16
+
+
+def block_index_entries(rows):
+    """Block index rows → dicts with payload `offset` and decoded `start`"""
+    blocks = []
+    offset = start = 0
+    for kind, tag, length, size, digest in rows:
+        blocks.append({"kind": kind, "tag": tag, "offset": offset, "length": length,
+                       "start": start, "size": size, "hash": digest})
+        offset += length
+        start += size
+    return blocks
+
+
+def pack_container_header(backend, codebook_version, dict_id, source_hash,
+                          content_hash, source_size, content_size,
+                          payload_size, xor=True, blocks=False):
+    """Header bytes for a .eug container; hashes are hex digests"""
+    return CONTAINER_HEADER.pack(
+        CONTAINER_MAGIC, CONTAINER_VERSION, CONTAINER_BACKENDS[backend],
+        codebook_version, (FLAG_XOR if xor else 0) | (FLAG_BLOCKS if blocks else 0),
+        bytes.fromhex(dict_id) if dict_id else bytes(8),
+        bytes.fromhex(source_hash), bytes.fromhex(content_hash),
+        source_size, content_size, payload_size)
+
+
+def parse_container_header(data):
+    """Header fields of a .eug container (first CONTAINER_HEADER.size bytes)"""
+    if len(data) < CONTAINER_HEADER.size:
+        raise ValueError("Truncated EUG container header")
+    (magic, version, backend, codebook, flags, dict_raw, source_hash,
+     content_hash, source_size, content_size, payload_size) = \
+        CONTAINER_HEADER.unpack_from(data)
+    if magic != CONTAINER_MAGIC:
+        raise ValueError("Not an EUG container")
+    if version != CONTAINER_VERSION:
+        raise ValueError(f"Unsupported EUG container version: {version}")
+    backends = {number: name for name, number in CONTAINER_BACKENDS.items()}
+    if backend not in backends:
+        raise ValueError(f"Unknown EUG entropy backend id: {backend}")
+    if flags & ~(FLAG_XOR | FLAG_BLOCKS):
+        raise ValueError(f"Unsupported EUG container flags: {flags:#04x}")
+    return {
+        "version": version,
+        "entropy_backend": backends[backend],
+        "codebook_version": codebook,
+        "xor": bool(flags & FLAG_XOR),
+        "blocks": bool(flags & FLAG_BLOCKS),
+        "dictionary_id": dict_raw.hex() if any(dict_raw) else None,
+        "source_hash": source_hash.hex(),
+        "content_hash": content_hash.hex(),
+        "source_size": source_size,
+        "content_size": content_size,
+        "payload_size": payload_size,
+    }
+
+
+def _container_dictionary(header, directory=None):
+    """A container's shared dictionary: from `directory` if it is there,
+    else from next to this runtime"""
+    if not header["dictionary_id"]:
+        return None
+    if directory is None or not dictionary_path(header["dictionary_id"], directory).exists():
+        directory = None
+    return load_dictionary(header["dictionary_id"], directory)
+
+
+def _container_decoder(header, zdict, xor_offset=0):
+    return PayloadDecoder(header["entropy_backend"], header["codebook_version"], zdict,
+                          CONTAINER_XOR_KEY if header["xor"] else None, xor_offset=xor_offset)
+
+
+def decode_container(data, directory=None, verify=True, name="container"):
+    """
+    Decode one container held in a bytes-like object (bytes, mmap or a
+    memoryview slice of an archive). Shared dictionaries are looked up in
+    `directory` first, then next to this runtime.
+    """
+    with memoryview(data) as view:
+        header = parse_container_header(view)
+        start = CONTAINER_HEADER.size
+        end = start + header["payload_size"]
+        # Block-indexed containers carry their index after the payload
+        if len(view) < end or (len(view) != end and not header["blocks"]):
+            raise ValueError(f"Truncated EUG container payload: {name}")
+        zdict = _container_dictionary(header, directory)
+        with view[start:end] as payload:
+            if header["blocks"]:
+                decoder = _container_decoder(header, zdict)
+                html = decoder.feed(payload) + decoder.flush()
+            else:
+                payload = xor_bytes(payload, CONTAINER_XOR_KEY) if header["xor"] else payload
+                content = entropy_decompress(payload, header["entropy_backend"], zdict)
+                html = load_codebook(header["codebook_version"]).decode(content.decode('utf-8'))
+
+    if verify and hashlib.sha256(html.encode('utf-8')).hexdigest() != header["content_hash"]:
+        raise ValueError(f"EUG {name} failed its content hash check")
+    return html
+
+
+def read_container(path, verify=True):
+    """
+    Decode a .eug container back to HTML. The file is mmapped, so the
+    payload is handed to the entropy decoder without an extra copy
+    (XORed containers still need one for the XOR itself).
+    """
+    path = Path(path)
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        return decode_container(view, path.parent, verify, name=str(path))
+
+
+def verify_container(path, chunk_size=VERIFY_CHUNK_SIZE):
+    """
+    True if a .eug file decodes to exactly its content hash and size.
+    Streams the payload, so memory stays flat for any container size.
+    """
+    path = Path(path)
+    with open(path, 'rb') as f:
+        header = parse_container_header(f.read(CONTAINER_HEADER.size))
+        decoder = _container_decoder(header, _container_dictionary(header, path.parent))
+        try:
+            digest, size = digest_payload(f, header["payload_size"], decoder, chunk_size)
+        except (ValueError, EOFError, OSError, lzma.LZMAError, zlib.error):
+            return False
+    return digest == header["content_hash"] and size == header["content_size"]
+
+
+class EugContainer:
+    """
+    Lazy reader for one .eug file: opening it reads only the header and
+    the block index, and each block is decoded only when asked for, so
+    a preview of a huge page costs one block, not the whole payload. A
+    container written without blocks reads as one "page" block.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self.header = parse_container_header(self._file.read(CONTAINER_HEADER.size))
+            if self.header["blocks"]:
+                self._file.seek(CONTAINER_HEADER.size + self.header["payload_size"])
+                self.blocks = block_index_entries(
+                    json.loads(self._file.read().decode('utf-8'))["blocks"])
+            else:
+                self.blocks = [{"kind": "page", "tag": "", "offset": 0,
+                                "length": self.header["payload_size"], "start": 0,
+                                "size": self.header["content_size"],
+                                "hash": self.header["content_hash"]}]
+            self._zdict = _container_dictionary(self.header, self.path.parent)
+        except BaseException:
+            self._file.close()
+            raise
+
+    def find(self, kind):
+        """Indexes of the blocks of one kind ("head", "body", "script", "style")"""
+        return [i for i, block in enumerate(self.blocks) if block["kind"] == kind]
+
+    def read_block(self, index, verify=True):
+        """One block's HTML, checked against its own hash"""
+        block = self.blocks[index]
+        self._file.seek(CONTAINER_HEADER.size + block["offset"])
+        decoder = _container_decoder(self.header, self._zdict, block["offset"])
+        html = decoder.feed(self._file.read(block["length"])) + decoder.flush()
+        digest = hashlib.sha256(html.encode('utf-8')).hexdigest()
+        if verify and digest[:len(block["hash"])] != block["hash"]:
+            raise ValueError(f"EUG {self.path} block {index} failed its hash check")
+        return html
+
+    def read(self, kind=None, verify=True):
+        """The blocks of one kind, or the whole page, joined in order"""
+        indexes = self.find(kind) if kind else range(len(self.blocks))
+        return ''.join(self.read_block(i, verify) for i in indexes)
+
+    def read_prefix(self, size, verify=True):
+        """At least the first `size` bytes of HTML, decoding only the blocks they span"""
+        parts = []
+        for i, block in enumerate(self.blocks):
+            if block["start"] >= size:
+                break
+            parts.append(self.read_block(i, verify))
+        return ''.join(parts)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# .euga ARCHIVE (many containers, one file)
+# ═══════════════════════════════════════════════════════════════════
+#
+#   header   "<4sB3xQQ": magic b"EUGA", version, index offset, index size
+#   members  complete .eug containers, back to back, each independently
+#            compressed
+#   index    UTF-8 JSON: {"members": [{"name", "offset", "length",
+#            "content_hash", "source_size"}, ...]}
+#
+# The index is at the end so members can be streamed in without knowing
+# the count up front; the header is rewritten once the index is placed.
+
+ARCHIVE_MAGIC = b"EUGA"
+ARCHIVE_VERSION = 1
+ARCHIVE_HEADER = struct.Struct("<4sB3xQQ")
+
+
+def write_archive(path, members):
+    """
+    Pack (name, container bytes) pairs into one .euga archive; returns
+    the index entries
+    """
+    index = []
+    with open(path, 'wb') as f:
+        f.write(bytes(ARCHIVE_HEADER.size))
+        for name, data in members:
+            header = parse_container_header(data)
+            index.append({"name": name, "offset": f.tell(), "length": len(data),
+                          "content_hash": header["content_hash"],
+                          "source_size": header["source_size"]})
+            f.write(data)
+        index_offset = f.tell()
+        encoded = json.dumps({"members": index}, separators=(',', ':')).encode('utf-8')
+        f.write(encoded)
+        f.seek(0)
+        f.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, index_offset, len(encoded)))
+    return index
+
+
+class EugArchive:
+    """
+    Random access to a .euga archive: the index is read once, and each
+    member costs one seek + one read of its own bytes
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            magic, version, index_offset, index_size = \
+                ARCHIVE_HEADER.unpack(self._file.read(ARCHIVE_HEADER.size))
+            if magic != ARCHIVE_MAGIC:
+                raise ValueError(f"Not an EUG archive: {path}")
+            if version != ARCHIVE_VERSION:
+                raise ValueError(f"Unsupported EUG archive version: {version}")
+            self._file.seek(index_offset)
+            index = json.loads(self._file.read(index_size).decode('utf-8'))
+        except BaseException:
+            self._file.close()
+            raise
+        self.members = {entry["name"]: entry for entry in index["members"]}
+
+    def names(self):
+        return list(self.members)
+
+    def read_raw(self, name):
+        """The member's .eug container bytes"""
+        entry = self.members[name]
+        self._file.seek(entry["offset"])
+        return self._file.read(entry["length"])
+
+    def read(self, name, verify=True):
+        """The member's decoded HTML"""
+        return decode_container(self.read_raw(name), self.path.parent, verify,
+                                name=f"{self.path}:{name}")
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    # python eug_codec.py page.eug > page.html
+    # python eug_codec.py pages.euga index.html > index.html
+    # python eug_codec.py page.eug --index           (block index as JSON)
+    # python eug_codec.py page.eug --kind=head       (only those blocks)
+    # python eug_codec.py page.eug --prefix=4096     (blocks covering 4 KB)
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    options = dict(arg[2:].partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    if len(args) == 1 and options:
+        with EugContainer(args[0]) as container:
+            if "index" in options:
+                print(json.dumps({"header": container.header, "blocks": container.blocks},
+                                 indent=1))
+            elif "prefix" in options:
+                sys.stdout.write(container.read_prefix(int(options["prefix"])))
+            else:
+                sys.stdout.write(container.read(options.get("kind")))
+    elif len(args) == 1:
+        sys.stdout.write(read_container(args[0]))
+    elif len(args) == 2:
+        with EugArchive(args[0]) as archive:
+            sys.stdout.write(archive.read(args[1]))
+    else:
+        sys.exit("Usage: python eug_codec.py <file.eug> [--index | --kind=KIND | --prefix=BYTES]\n"
+                 "       python eug_codec.py <file.euga> <member>")
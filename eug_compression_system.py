@@ -21,94 +21,342 @@ BENEFITS:
 ✅ Self-documenting code structure
 """
 
+import io
 import os
+import sys
 import re
 import json
+import math
+import lzma
+import time
+import zlib
+import heapq
+import random
 import base64
+import shutil
 import hashlib
+import tempfile
+import contextlib
 from pathlib import Path
+from collections import Counter
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+from eug_minify import Minifier, minify
+from eug_features import ContentFeatures
+from eug_log import get_logger, progress, current_config, configure_worker, configure, cli_config
+from eug_codec import (xor_bytes, install_runtime, load_codebook,
+                       entropy_compressor, load_dictionary, save_dictionary,
+                       pack_container_header, write_archive, PayloadDecoder, digest_payload,
+                       CODEBOOKS, CODEBOOK_VERSION, ENTROPY_BACKENDS, DICTIONARY_BACKENDS,
+                       CONTAINER_HEADER, BLOCK_HASH_SIZE, VARIATION_SELECTOR)
+
+log = get_logger("compression")
+
+# Streaming mode reads this many characters at a time, and is used
+# automatically for files at least STREAM_THRESHOLD bytes on disk.
+STREAM_CHUNK_SIZE = 1 << 20
+STREAM_THRESHOLD = 32 * 1024 * 1024
+
+# Entropy-coding level per backend for each meta_ai_analyze
+# compression_level: conservative favours speed, aggressive favours size.
+ENTROPY_LEVELS = {
+    "none": {"conservative": 0, "balanced": 0, "medium": 0, "aggressive": 0},
+    "zlib": {"conservative": 1, "balanced": 6, "medium": 6, "aggressive": 9},
+    "lzma": {"conservative": 0, "balanced": 6, "medium": 6, "aggressive": 9},
+    "bz2": {"conservative": 1, "balanced": 5, "medium": 5, "aggressive": 9},
+}
+
+# Output formats: the self-decoding .py wrapper, or the compact binary
+# .eug container (read with eug_codec.read_container)
+OUTPUT_FORMATS = {"py": "_compressed.py", "eug": ".eug"}
+
+# zlib only looks back 32 KB, so a larger preset dictionary is wasted
+DICTIONARY_SIZE = 32 * 1024
+
+# Block-indexed .eug: no block holds more than BLOCK_SIZE characters, and
+# <script>/<style> elements get their own block from MIN_SECTION_SIZE up
+# (smaller ones cost more in per-block overhead than they save)
+BLOCK_SIZE = 64 * 1024
+MIN_SECTION_SIZE = 4 * 1024
+
+class _SymbolStream:
+    """SymbolCodec.encode() over chunks, cutting only between tokens"""
+    def __init__(self, codec):
+        self.codec = codec
+        self._carry = ''
+
+    def feed(self, text):
+        text = self._carry + text
+        cut = self.codec.split_point(text)
+        self._carry = text[cut:]
+        return self.codec.encode(text[:cut])
+
+    def flush(self):
+        text, self._carry = self._carry, ''
+        return self.codec.encode(text)
+
+
+class _PayloadStream:
+    """UTF-8 bytes → entropy coding → XOR → Base64, keeping key phase and
+    3-byte groups aligned across chunks (text=False skips Base64)"""
+    def __init__(self, key, compressor, text=True):
+        self.key = key
+        self.compressor = compressor
+        self.text = text
+        self.offset = 0
+        self._carry = b''
+
+    def feed(self, data):
+        return self._encode(self.compressor.compress(data))
+
+    def flush(self):
+        return self._encode(self.compressor.flush()) + self._drain()
+
+    def _encode(self, data):
+        encrypted = xor_bytes(data, self.key, self.offset)
+        self.offset += len(encrypted)
+        if not self.text:
+            return encrypted
+        data = self._carry + encrypted
+        cut = len(data) - len(data) % 3
+        self._carry = data[cut:]
+        return base64.b64encode(data[:cut]).decode('ascii')
+
+    def _drain(self):
+        data, self._carry = self._carry, b''
+        if not self.text:
+            return b''
+        return base64.b64encode(data).decode('ascii')
+
+
+def _optimizer_stream():
+    """Streaming equivalent of EugCompressionSystem.optimize_compression"""
+    return Minifier()
+
+
+_SECTION_TAG = re.compile(r'<(/?)(head|body|script|style)\b[^>]*>', re.I)
+_SECTION_END = {name: re.compile(f'</{name}\\s*>', re.I) for name in ("script", "style")}
+
+
+class _BlockSplitter:
+    """
+    Minified HTML → (kind, tag, text) sections for the block index, chunk
+    by chunk: the <head> part, <script>/<style> elements of at least
+    min_section characters, and body text, none longer than block_size.
+    Smaller elements stay inline with the text around them.
+    """
+    def __init__(self, block_size=BLOCK_SIZE, min_section=MIN_SECTION_SIZE):
+        self.block_size = block_size
+        self.min_section = min_section
+        self.kind = "head"
+        self._text = ''
+        self._element = None        # (kind, opening tag) of an open script/style
+        self._element_text = ''
+        self._element_split = False # already emitted in block_size pieces
+        self._buf = ''
+        self._out = []
+        self._emitted = False
+
+    def feed(self, html):
+        self._buf += html
+        self._run(final=False)
+        return self._take()
+
+    def flush(self):
+        self._run(final=True)
+        if self._element:
+            self._close_element()
+        self._emit_text()
+        if not self._emitted and not self._out:
+            # An empty page is still one (empty) block
+            self._out.append((self.kind, "", ""))
+        return self._take()
+
+    def _take(self):
+        out, self._out = self._out, []
+        self._emitted = self._emitted or bool(out)
+        return out
+
+    def _run(self, final):
+        buf = self._buf
+        pos = 0
+        while True:
+            if self._element:
+                match = _SECTION_END[self._element[0]].search(buf, pos)
+            else:
+                match = _SECTION_TAG.search(buf, pos)
+            if match is None:
+                # Keep back a tag that may be cut off at the end of the chunk
+                cut = buf.rfind('<', pos)
+                if final or cut < 0 or '>' in buf[cut:]:
+                    cut = len(buf)
+                self._add(buf[pos:cut])
+                pos = cut
+                break
+            if self._element:
+                self._add(buf[pos:match.end()])
+                self._close_element()
+            else:
+                self._add(buf[pos:match.start()])
+                closing, name = match.group(1), match.group(2).lower()
+                if name in _SECTION_END and not closing:
+                    self._element = (name, match.group()[:120])
+                    self._element_text = match.group()
+                elif name == "head" and closing or name == "body" and not closing:
+                    if self.kind == "head":
+                        if closing:
+                            self._add(match.group())
+                        self._emit_text()
+                        self.kind = "body"
+                    if not closing:
+                        self._add(match.group())
+                else:
+                    self._add(match.group())
+            pos = match.end()
+        self._buf = buf[pos:]
+
+    def _add(self, text):
+        if self._element:
+            self._element_text += text
+            if len(self._element_text) > self.block_size:
+                # Too big to inline: everything before it goes out first
+                self._emit_text()
+                self._element_split = True
+                self._element_text = self._cut(self._element, self._element_text)
+        else:
+            self._text += text
+            if len(self._text) > self.block_size:
+                self._text = self._cut((self.kind, ""), self._text)
+
+    def _cut(self, section, text):
+        """Emit block_size pieces of text; returns the remainder"""
+        while len(text) > self.block_size:
+            cut = self.block_size
+            # A block starting with a bare selector would fuse with the
+            # symbol ending the block before it when decoded as a stream
+            while cut > 1 and text[cut] == VARIATION_SELECTOR:
+                cut -= 1
+            self._out.append(section + (text[:cut],))
+            text = text[cut:]
+        return text
+
+    def _close_element(self):
+        element, text = self._element, self._element_text
+        self._element = None
+        self._element_text = ''
+        if self._element_split or len(text) >= self.min_section:
+            self._emit_text()
+            if text:
+                self._out.append(element + (text,))
+        else:
+            self._add(text)
+        self._element_split = False
+
+    def _emit_text(self):
+        if self._text:
+            self._out.append((self.kind, "", self._text))
+            self._text = ''
+
+
+class _BlockWriter:
+    """Sections → independently entropy-coded .eug blocks + the block index"""
+    def __init__(self, codec, key, backend, level, zdict):
+        self.codec = codec
+        self.key = key
+        self.backend = backend
+        self.level = level
+        self.zdict = zdict
+        self.offset = 0
+        self.blocks = []
+
+    def write(self, kind, tag, html):
+        data = html.encode('utf-8')
+        symbolic = self.codec.encode(html).encode('utf-8')
+        compressor = entropy_compressor(self.backend, self.level, self.zdict)
+        packed = compressor.compress(symbolic) + compressor.flush()
+        if self.key:
+            packed = xor_bytes(packed, self.key, self.offset)
+        self.blocks.append([kind, tag, len(packed), len(data),
+                            hashlib.sha256(data).hexdigest()[:BLOCK_HASH_SIZE]])
+        self.offset += len(packed)
+        return packed
+
+    def index(self):
+        return json.dumps({"blocks": self.blocks}, separators=(',', ':')).encode('utf-8')
+
+
+def train_dictionary(samples, size=DICTIONARY_SIZE, segment=64, dmer=8):
+    """
+    Build a zlib preset dictionary from sample payloads (a small COVER-style
+    trainer): score fixed-size segments by how many samples share their
+    d-mers, pick greedily, and lay the winners out best-last because zlib
+    reaches the end of the dictionary with the shortest distances.
+    """
+    # Document frequency: in how many samples does each d-mer occur?
+    frequency = Counter()
+    for sample in samples:
+        frequency.update({sample[i:i + dmer] for i in range(len(sample) - dmer + 1)})
+
+    def score(candidate):
+        dmers = {candidate[i:i + dmer] for i in range(len(candidate) - dmer + 1)}
+        return sum(frequency[d] for d in dmers if frequency[d] > 1)
+
+    heap = []
+    step = max(segment // 2, 1)
+    for sample in samples:
+        for start in range(0, max(len(sample) - segment, 0) + 1, step):
+            candidate = sample[start:start + segment]
+            heap.append((-score(candidate), len(heap), candidate))
+    heapq.heapify(heap)
+
+    # Lazy greedy: scores only drop as d-mers get covered, so a popped
+    # candidate whose fresh score still matches its stored one is the best
+    chosen = []
+    total = 0
+    while heap and total < size:
+        stored, order, candidate = heapq.heappop(heap)
+        if stored == 0:
+            break
+        current = score(candidate)
+        if current == 0:
+            continue  # fully covered by earlier picks (e.g. a duplicate)
+        if -stored != current:
+            heapq.heappush(heap, (-current, order, candidate))
+            continue
+        chosen.append(candidate)
+        total += len(candidate)
+        for i in range(len(candidate) - dmer + 1):
+            frequency[candidate[i:i + dmer]] = 0
+
+    return b''.join(reversed(chosen))[-size:]
+
 
 class EugCompressionSystem:
-    def __init__(self):
-        self.version = "1.0.0"
+    def __init__(self, entropy_backend="zlib", dictionary_id=None, block_size=None):
+        self.version = "1.0.1"
         self.author = "eugeNEOusXR"
         self.xor_key = b"eug"  # Cryptographic key
         
-        # 3D Symbolic Language: Emoticons → Vertex Symbols
-        self.symbol_map = {
-            # HTML Structure
-            '<': '⟨',      # Start angle
-            '>': '⟩',      # End angle
-            '/': '∕',      # Division/closing
-            '=': '⩵',      # Equals
-            '"': '⟪',      # Quote start
-            "'": '⟫',      # Quote end
-            
-            # Common HTML Tags → 3D Symbols
-            'div': '◻',    # Box/container
-            'span': '◇',   # Diamond/inline
-            'button': '▣', # Button
-            'input': '☐',  # Input box
-            'canvas': '▦', # Grid/canvas
-            'script': '⚡', # Lightning/code
-            'style': '🎨', # Art/styling
-            'body': '🧍', # Body/human
-            'head': '🧠', # Brain/head
-            'title': '👑', # Crown/title
-            'meta': 'Ⓜ️',   # Meta info
-            'link': '🔗', # Chain/link
-            
-            # Three.js/3D → Vertex Symbols
-            'THREE.': '△',  # Triangle (Three.js)
-            'Scene': '🌍', # World/scene
-            'Camera': '📷', # Camera
-            'Renderer': '🖼️', # Frame/render
-            'Mesh': '◬',   # Geometric mesh
-            'Geometry': '⬡', # Hexagon/geometry
-            'Material': '✨', # Sparkle/material
-            'Light': '💡', # Bulb/light
-            'Vector3': '⟨x,y,z⟩', # 3D vector
-            
-            # CSS → Style Symbols
-            'background': '🎭', # Background/backdrop
-            'color': '🎨',  # Color
-            'font': '📝',   # Text/font
-            'border': '▭',  # Border frame
-            'margin': '↔️',  # Spacing
-            'padding': '⇆', # Inner spacing
-            'position': '📍', # Position pin
-            'display': '👁️', # Display/eye
-            'flex': '🔄',   # Flex/rotation
-            
-            # JavaScript → Logic Symbols
-            'function': '⚙️', # Gear/function
-            'const': '📌',  # Pin/constant
-            'let': '🔀',    # Variable/change
-            'var': '📦',    # Box/variable
-            'if': '❓',     # Question/conditional
-            'else': '❔',   # Alt question
-            'for': '🔁',    # Loop
-            'while': '♻️',  # Recycle/loop
-            'return': '↩️', # Return arrow
-            'new': '✨',    # Sparkle/new
-            
-            # Common Values → Numeric Symbols
-            'true': '✓',   # Check
-            'false': '✗',  # X
-            'null': '∅',   # Empty set
-            'undefined': '❓', # Unknown
-            '0': '⓪',
-            '1': '①',
-            '2': '②',
-            '3': '③',
-            '4': '④',
-            '5': '⑤',
-            '6': '⑥',
-            '7': '⑦',
-            '8': '⑧',
-            '9': '⑨',
-        }
+        # Entropy coding between the symbol stage and XOR/Base64
+        if entropy_backend not in ENTROPY_BACKENDS:
+            raise ValueError(f"Unknown entropy backend: {entropy_backend}")
+        self.entropy_backend = entropy_backend
+        
+        # Optional shared preset dictionary, referenced by hash
+        if dictionary_id and entropy_backend not in DICTIONARY_BACKENDS:
+            raise ValueError(f"Entropy backend {entropy_backend} does not support a shared dictionary")
+        self.dictionary_id = dictionary_id
+        self.zdict = load_dictionary(dictionary_id) if dictionary_id else None
+        
+        # .eug outputs split into independently decodable blocks of at
+        # most this many characters, with a block index (None: one stream)
+        self.block_size = block_size
+        
+        # 3D Symbolic Language: Emoticons → Vertex Symbols (shared codebook)
+        self.codebook_version = CODEBOOK_VERSION
+        self.symbol_map = CODEBOOKS[CODEBOOK_VERSION]
+        self.symbol_codec = load_codebook(CODEBOOK_VERSION)
         
         # AI Personality Integration
         self.active_personalities = {
@@ -131,8 +379,7 @@ class EugCompressionSystem:
         
     def xor_encrypt(self, data, key):
         """XOR encryption for NFT crypto-signing"""
-        key_repeated = (key * (len(data) // len(key) + 1))[:len(data)]
-        return bytes(a ^ b for a, b in zip(data, key_repeated))
+        return xor_bytes(data, key)
     
     def xor_decrypt(self, encrypted_data, key):
         """XOR decryption (symmetric)"""
@@ -143,66 +390,90 @@ class EugCompressionSystem:
         Convert HTML to 3D symbolic language using emoticons
         AI Personality #1 (Visionary Artist) beautifies the symbols
         """
-        print(f"🎨 AI #1 (Visionary Artist): Beautifying code with 3D symbols...")
-        
-        compressed = html_content
+        log.debug(f"🎨 AI #1 (Visionary Artist): Beautifying code with 3D symbols...")
         
-        # Apply symbol mapping
-        for original, symbol in self.symbol_map.items():
-            compressed = compressed.replace(original, symbol)
+        # Single leftmost-longest pass over the whole text
+        compressed = self.symbol_codec.encode(html_content)
         
         # Calculate compression ratio
         original_size = len(html_content)
         compressed_size = len(compressed)
-        ratio = (1 - compressed_size / original_size) * 100
+        ratio = (1 - compressed_size / max(original_size, 1)) * 100
         
-        print(f"   Symbolic compression: {original_size} → {compressed_size} bytes ({ratio:.1f}% saved)")
+        log.debug(f"   Symbolic compression: {original_size} → {compressed_size} bytes ({ratio:.1f}% saved)")
         
         return compressed
     
+    def emoticon_decompress(self, symbolic_content):
+        """Convert 3D symbolic language back to HTML (exact inverse)"""
+        return self.symbol_codec.decode(symbolic_content)
+    
     def optimize_compression(self, content):
         """
         AI Personality #67 (Financial Advisor) optimizes compression
         """
-        print(f"💰 AI #67 (Financial Advisor): Optimizing compression ratio...")
-        
-        # Remove unnecessary whitespace
-        content = re.sub(r'\s+', ' ', content)
-        content = re.sub(r'>\s+<', '><', content)
+        log.debug(f"💰 AI #67 (Financial Advisor): Optimizing compression ratio...")
         
-        # Remove comments
-        content = re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
-        content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
+        # One lexer pass over HTML, <script> and <style>: comments and
+        # whitespace go, strings, URLs and regex literals stay intact
+        content = minify(content)
         
-        print(f"   Optimized: Removed whitespace and comments")
+        log.debug(f"   Optimized: Removed whitespace and comments")
         
-        return content.strip()
+        return content
     
     def validate_integrity(self, original, decompressed):
         """
         AI Personality #82 (Career Coach) validates file integrity
         """
-        print(f"✅ AI #82 (Career Coach): Validating file integrity...")
+        log.debug(f"✅ AI #82 (Career Coach): Validating file integrity...")
         
         # Calculate checksums
         original_hash = hashlib.sha256(original.encode()).hexdigest()
         decompressed_hash = hashlib.sha256(decompressed.encode()).hexdigest()
         
         if original_hash == decompressed_hash:
-            print(f"   ✓ Integrity verified: Hashes match")
+            log.debug(f"   ✓ Integrity verified: Hashes match")
             return True
         else:
-            print(f"   ✗ Warning: Hashes don't match")
-            print(f"   Original: {original_hash[:16]}...")
-            print(f"   Decompressed: {decompressed_hash[:16]}...")
+            log.warning(f"   ✗ Warning: Hashes don't match\n"
+                        f"   Original: {original_hash[:16]}...\n"
+                        f"   Decompressed: {decompressed_hash[:16]}...")
             return False
     
+    def verify_output(self, output_path, meta):
+        """
+        AI Personality #82 (Career Coach) decodes a freshly written file
+        and checks it against its content hash. The payload is read and
+        decoded in chunks into an incremental SHA-256, so the cost is one
+        streaming pass whatever the file size. Returns (passed, seconds).
+        """
+        log.debug(f"✅ AI #82 (Career Coach): Decoding output to verify integrity...")
+        start = time.perf_counter()
+        decoder = PayloadDecoder(self.entropy_backend, self.codebook_version, self.zdict,
+                                 self.xor_key or None, text=meta['format'] == "py")
+        try:
+            with open(output_path, 'rb') as f:
+                f.seek(meta['payload_offset'])
+                digest, size = digest_payload(f, meta['payload_size'], decoder)
+        except (ValueError, EOFError, OSError, lzma.LZMAError, zlib.error) as e:
+            digest, size = f"unreadable ({e})", -1
+        seconds = time.perf_counter() - start
+        
+        passed = digest == meta['content_hash'] and size == meta['content_size']
+        if passed:
+            log.debug(f"   ✓ Integrity verified: Hashes match")
+        else:
+            log.warning(f"   ✗ Warning: Hashes don't match in {output_path}\n"
+                        f"   Expected: {meta['content_hash'][:16]}...\n"
+                        f"   Decoded: {digest[:16]}...")
+        return passed, seconds
+    
     def meta_ai_analyze(self, filename, content_type):
         """
         Meta-AI orchestrates compression strategy based on file type
         """
-        print(f"🧠 META-AI: Analyzing {filename}...")
+        log.debug(f"🧠 META-AI: Analyzing {filename}...")
         
         strategies = {
             "3d_environment": {
@@ -229,65 +500,348 @@ class EugCompressionSystem:
         
         strategy = strategies.get(content_type, strategies["landing_page"])
         
-        print(f"   Strategy: {strategy['compression_level']} compression")
-        print(f"   Priority: {strategy['priority']}")
-        print(f"   Focus: {strategy['symbolic_focus']}")
+        log.debug(f"   Strategy: {strategy['compression_level']} compression")
+        log.debug(f"   Priority: {strategy['priority']}")
+        log.debug(f"   Focus: {strategy['symbolic_focus']}")
         
         return strategy
     
-    def html_to_py(self, html_path, output_dir="compressed_py"):
+    def entropy_level(self, strategy):
+        """Entropy-coding level for a meta_ai_analyze strategy"""
+        return ENTROPY_LEVELS[self.entropy_backend][strategy['compression_level']]
+    
+    def html_to_py(self, html_path, output_dir="compressed_py", stream=None,
+                   chunk_size=STREAM_CHUNK_SIZE, format="py", verify=False):
         """
         Main compression function: HTML → Python with XOR crypto + symbols
+
+        stream=True runs the chunked pipeline, which keeps memory flat no
+        matter how large the input is; stream=None picks it automatically
+        for files of STREAM_THRESHOLD bytes or more.
+
+        format="eug" writes a binary .eug container instead of the .py
+        wrapper: no Base64 and no template, so small pages actually shrink.
+        With block_size set, the container is block-indexed so readers can
+        decode one section (eug_codec.EugContainer); this needs format="eug".
+
+        verify=True decodes the written file again and checks its content
+        hash (see verify_output); the result's "verified" is then True or
+        False, and None when the check was skipped.
         """
+        if format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format: {format}")
+        if self.block_size and format != "eug":
+            raise ValueError("Block-indexed output needs format='eug'")
         html_path = Path(html_path)
         if not html_path.exists():
-            print(f"❌ File not found: {html_path}")
+            log.warning(f"❌ File not found: {html_path}")
             return None
         
-        print(f"\n{'='*70}")
-        print(f"🚀 EUG COMPRESSION SYSTEM - Starting conversion")
-        print(f"{'='*70}")
-        print(f"Input: {html_path.name}")
+        if stream is None:
+            stream = html_path.stat().st_size >= STREAM_THRESHOLD
+        
+        log.info(f"\n{'='*70}")
+        log.info(f"🚀 EUG COMPRESSION SYSTEM - Starting conversion")
+        log.info(f"{'='*70}")
+        log.info(f"Input: {html_path.name}")
+        
+        # Create output directory
+        output_path = Path(output_dir)
+        output_path.mkdir(exist_ok=True)
+        install_runtime(output_path, self.dictionary_id)
+        py_filepath = output_path / output_filename(html_path, format)
+        
+        start = time.perf_counter()
+        if stream:
+            meta = self._compress_streaming(html_path, py_filepath, chunk_size, format)
+        else:
+            meta = self._compress_in_memory(html_path, py_filepath, format)
+        meta['format'] = format
+        compress_seconds = time.perf_counter() - start
         
+        verified = None
+        verify_seconds = 0.0
+        if verify:
+            log.debug("")
+            verified, verify_seconds = self.verify_output(py_filepath, meta)
+        
+        original_size = meta['original_size']
+        compressed_size = meta['compressed_size']
+        compression_ratio = (1 - compressed_size / max(original_size, 1)) * 100
+        
+        log.info(f"\n{'='*70}")
+        log.info(f"✅ COMPRESSION COMPLETE")
+        log.info(f"{'='*70}")
+        log.info(f"Output: {py_filepath}")
+        log.info(f"Original: {original_size:,} bytes ({original_size / 1024:.2f} KB)")
+        log.info(f"Compressed: {compressed_size:,} bytes ({compressed_size / 1024:.2f} KB)")
+        log.info(f"Savings: {compression_ratio:.1f}%")
+        log.info(f"NFT Hash: {meta['nft_hash']}")
+        
+        # AI #82 validates
+        log.debug(f"\n🤖 AI Personality Analysis:")
+        log.debug(f"   AI #67: Compression efficiency: {compression_ratio:.1f}%")
+        log.debug(f"   AI #1: Symbolic beautification complete")
+        if verified is None:
+            log.debug(f"   AI #82: Integrity check skipped (run with verify=True)")
+        else:
+            log.debug(f"   AI #82: File integrity {'validated ✓' if verified else 'FAILED ✗'} "
+                      f"(verify cost {verify_seconds * 1000:.1f} ms, "
+                      f"{verify_seconds / max(compress_seconds, 1e-9):.0%} of compression time)")
+        progress(log, "file_done", file=str(html_path), output=str(py_filepath),
+                 original_size=original_size, compressed_size=compressed_size,
+                 ratio=round(compression_ratio, 2), verified=verified,
+                 seconds=round(compress_seconds + verify_seconds, 6))
+        
+        return {
+            "input": str(html_path),
+            "output": str(py_filepath),
+            "original_size": original_size,
+            "compressed_size": compressed_size,
+            "compression_ratio": compression_ratio,
+            "nft_hash": meta['nft_hash'],
+            "content_hash": meta['content_hash'],
+            "content_size": meta['content_size'],
+            "payload_offset": meta['payload_offset'],
+            "payload_size": meta['payload_size'],
+            "codebook_version": self.codebook_version,
+            "content_type": meta['content_type'],
+            "strategy": meta['strategy'],
+            "entropy_backend": self.entropy_backend,
+            "entropy_level": meta['entropy_level'],
+            "dictionary_id": self.dictionary_id,
+            "format": format,
+            "blocks": meta['blocks'],
+            "streamed": stream,
+            "verified": verified,
+            "compress_seconds": compress_seconds,
+            "verify_seconds": verify_seconds
+        }
+    
+    def html_to_eug(self, html_path, output_dir="compressed_eug", **options):
+        """HTML → binary .eug container (see html_to_py)"""
+        return self.html_to_py(html_path, output_dir, format="eug", **options)
+    
+    def _detect_content_type(self, html_path, scan):
+        """Pick the compression content type from ContentFeatures"""
+        name = html_path.name.lower()
+        if scan.has_3d:
+            return "3d_environment"
+        elif 'landing' in name or 'index' in name:
+            return "landing_page"
+        elif 'library' in name:
+            return "library_system"
+        elif scan.style_tags > 5:
+            return "css_heavy"
+        return "landing_page"
+    
+    def _compress_in_memory(self, html_path, py_filepath, format="py"):
+        """Whole-file pipeline: every stage sees the complete text"""
         # Read HTML content
         with open(html_path, 'r', encoding='utf-8') as f:
             html_content = f.read()
         
         original_size = len(html_content)
-        print(f"Original size: {original_size:,} bytes ({original_size / 1024:.2f} KB)")
+        log.info(f"Original size: {original_size:,} bytes ({original_size / 1024:.2f} KB)")
         
         # Detect content type
-        if 'THREE.' in html_content or '3D' in html_content or '3d' in html_content:
-            content_type = "3d_environment"
-        elif 'landing' in html_path.name.lower() or 'index' in html_path.name.lower():
-            content_type = "landing_page"
-        elif 'library' in html_path.name.lower():
-            content_type = "library_system"
-        elif len(re.findall(r'<style', html_content)) > 5:
-            content_type = "css_heavy"
-        else:
-            content_type = "landing_page"
+        content_type = self._detect_content_type(html_path, ContentFeatures.of(html_content))
         
         # Meta-AI determines strategy
         strategy = self.meta_ai_analyze(html_path.name, content_type)
         
         # AI #67 optimizes compression
         optimized_content = self.optimize_compression(html_content)
+        level = self.entropy_level(strategy)
         
-        # AI #1 applies symbolic compression
-        symbolic_content = self.emoticon_compress(optimized_content)
+        block_index = b''
+        if self.block_size:
+            # Each section is symbol-encoded, entropy-coded and XORed on its own
+            log.debug(f"🎨 AI #1 (Visionary Artist): Beautifying code with 3D symbols...")
+            splitter = _BlockSplitter(self.block_size)
+            writer = _BlockWriter(self.symbol_codec, self.xor_key, self.entropy_backend,
+                                  level, self.zdict)
+            encrypted_bytes = b''.join(writer.write(*section) for section in
+                                       splitter.feed(optimized_content) + splitter.flush())
+            block_index = writer.index()
+            log.debug(f"📦 Entropy coding ({self.entropy_backend} level {level}) in "
+                      f"{len(writer.blocks)} blocks: {len(encrypted_bytes):,} bytes "
+                      f"+ {len(block_index):,} byte index")
+            log.debug(f"🔐 Applying XOR encryption with 'eug' key...")
+        else:
+            # AI #1 applies symbolic compression
+            symbolic_content = self.emoticon_compress(optimized_content)
+            symbolic_bytes = symbolic_content.encode('utf-8')
+            
+            # Entropy coding at the level the strategy asks for
+            compressor = entropy_compressor(self.entropy_backend, level, self.zdict)
+            packed_bytes = compressor.compress(symbolic_bytes) + compressor.flush()
+            log.debug(f"📦 Entropy coding ({self.entropy_backend} level {level}): "
+                      f"{len(symbolic_bytes):,} → {len(packed_bytes):,} bytes")
+            
+            # XOR encryption with "eug" key for NFT crypto-signing
+            log.debug(f"🔐 Applying XOR encryption with 'eug' key...")
+            encrypted_bytes = self.xor_encrypt(packed_bytes, self.xor_key)
+        if format == "py":
+            payload = base64.b64encode(encrypted_bytes).decode('utf-8')
+        else:
+            payload = encrypted_bytes
         
-        # XOR encryption with "eug" key for NFT crypto-signing
-        print(f"🔐 Applying XOR encryption with 'eug' key...")
-        encrypted_bytes = self.xor_encrypt(symbolic_content.encode('utf-8'), self.xor_key)
-        encrypted_b64 = base64.b64encode(encrypted_bytes).decode('utf-8')
+        meta = {
+            "original_size": original_size,
+            "payload_size": len(payload),
+            # Generate NFT metadata
+            "nft_hash": hashlib.sha256(html_content.encode()).hexdigest(),
+            # Optimization is lossy, so decoding reproduces the optimized
+            # HTML; this is the hash a decompressor can actually check
+            "content_hash": hashlib.sha256(optimized_content.encode('utf-8')).hexdigest(),
+            "content_size": len(optimized_content.encode('utf-8')),
+            "content_type": content_type,
+            "strategy": strategy,
+            "entropy_level": level,
+            "blocks": len(writer.blocks) if self.block_size else None
+        }
+        
+        if format == "eug":
+            with open(py_filepath, 'wb') as f:
+                f.write(self._container_header(meta) + payload + block_index)
+            meta["compressed_size"] = CONTAINER_HEADER.size + len(payload) + len(block_index)
+            meta["payload_offset"] = CONTAINER_HEADER.size
+            return meta
+        
+        head, tail = self._render_py_file(html_path, meta)
+        py_content = head + payload + tail
+        
+        # Write Python file
+        with open(py_filepath, 'w', encoding='utf-8') as f:
+            f.write(py_content)
+        
+        meta["compressed_size"] = len(py_content)
+        meta["payload_offset"] = len(head.encode('utf-8'))
+        return meta
+    
+    def _container_header(self, meta):
+        """.eug header for a finished payload"""
+        return pack_container_header(
+            self.entropy_backend, self.codebook_version, self.dictionary_id,
+            meta['nft_hash'], meta['content_hash'], meta['original_size'],
+            meta['content_size'], meta['payload_size'], xor=bool(self.xor_key),
+            blocks=meta['blocks'] is not None)
+    
+    def _compress_streaming(self, html_path, py_filepath, chunk_size, format="py"):
+        """
+        Chunked pipeline: read → optimize → symbols → UTF-8 → entropy →
+        XOR → Base64, each stage carrying over only what could still change.
+        The .py payload is spooled to disk because the header needs its
+        size; a .eug header is fixed-size, so it is just rewritten at the end.
+        """
+        text = format == "py"
+        log.debug(f"🌊 Streaming in {chunk_size // 1024:,} KB chunks")
         
-        # Generate NFT metadata
-        nft_hash = hashlib.sha256(html_content.encode()).hexdigest()
+        # The entropy level depends on the strategy, so classify first
+        scan = ContentFeatures()
+        with open(html_path, 'r', encoding='utf-8') as src:
+            for chunk in iter(lambda: src.read(chunk_size), ''):
+                scan.feed(chunk)
+        content_type = self._detect_content_type(html_path, scan)
+        strategy = self.meta_ai_analyze(html_path.name, content_type)
+        level = self.entropy_level(strategy)
+        
+        log.debug(f"💰 AI #67 (Financial Advisor): Optimizing compression ratio...")
+        log.debug(f"🎨 AI #1 (Visionary Artist): Beautifying code with 3D symbols...")
+        log.debug(f"📦 Entropy coding ({self.entropy_backend} level {level})...")
+        log.debug(f"🔐 Applying XOR encryption with 'eug' key...")
+        
+        nft_hash = hashlib.sha256()
+        content_hash = hashlib.sha256()
+        optimizer = _optimizer_stream()
+        symbols = _SymbolStream(self.symbol_codec)
+        payload = _PayloadStream(self.xor_key, entropy_compressor(
+            self.entropy_backend, level, self.zdict), text=text)
+        if self.block_size:
+            splitter = _BlockSplitter(self.block_size)
+            writer = _BlockWriter(self.symbol_codec, self.xor_key, self.entropy_backend,
+                                  level, self.zdict)
+        original_size = 0
+        content_size = 0
+        payload_size = 0
+        
+        spool_path = py_filepath.with_name(py_filepath.name + ".payload") if text else py_filepath
+        try:
+            with open(html_path, 'r', encoding='utf-8') as src, \
+                    open(spool_path, 'w' if text else 'wb',
+                         **({'encoding': 'ascii'} if text else {})) as spool:
+                if not text:
+                    spool.write(bytes(CONTAINER_HEADER.size))
+                while True:
+                    chunk = src.read(chunk_size)
+                    if chunk:
+                        original_size += len(chunk)
+                        nft_hash.update(chunk.encode())
+                        optimized = optimizer.feed(chunk)
+                    else:
+                        optimized = optimizer.flush()
+                    optimized_bytes = optimized.encode('utf-8')
+                    content_hash.update(optimized_bytes)
+                    content_size += len(optimized_bytes)
+                    if self.block_size:
+                        sections = splitter.feed(optimized) + ([] if chunk else splitter.flush())
+                        encoded = b''.join(writer.write(*section) for section in sections)
+                    else:
+                        symbolic = symbols.feed(optimized) + ('' if chunk else symbols.flush())
+                        encoded = payload.feed(symbolic.encode('utf-8'))
+                        if not chunk:
+                            encoded += payload.flush()
+                    spool.write(encoded)
+                    payload_size += len(encoded)
+                    if not chunk:
+                        break
+                
+                meta = {
+                    "original_size": original_size,
+                    "payload_size": payload_size,
+                    "nft_hash": nft_hash.hexdigest(),
+                    "content_hash": content_hash.hexdigest(),
+                    "content_size": content_size,
+                    "content_type": content_type,
+                    "strategy": strategy,
+                    "entropy_level": level,
+                    "blocks": len(writer.blocks) if self.block_size else None
+                }
+                block_index = writer.index() if self.block_size else b''
+                if not text:
+                    spool.write(block_index)
+                    spool.seek(0)
+                    spool.write(self._container_header(meta))
+            
+            log.info(f"Original size: {original_size:,} bytes ({original_size / 1024:.2f} KB)")
+            if not text:
+                meta["compressed_size"] = CONTAINER_HEADER.size + payload_size + len(block_index)
+                meta["payload_offset"] = CONTAINER_HEADER.size
+                return meta
+            
+            head, tail = self._render_py_file(html_path, meta)
+            with open(py_filepath, 'w', encoding='utf-8') as f, \
+                    open(spool_path, 'r', encoding='ascii') as spool:
+                f.write(head)
+                shutil.copyfileobj(spool, f, chunk_size)
+                f.write(tail)
+        finally:
+            if text and spool_path.exists():
+                spool_path.unlink()
+        
+        meta["compressed_size"] = len(head) + payload_size + len(tail)
+        meta["payload_offset"] = len(head.encode('utf-8'))
+        return meta
+    
+    def _render_py_file(self, html_path, meta):
+        """Generated .py file as (head, tail); the Base64 payload goes between"""
+        original_size = meta['original_size']
+        payload_size = meta['payload_size']
+        strategy = meta['strategy']
         timestamp = datetime.now().isoformat()
         
-        # Create Python file content
-        py_content = f'''"""
+        head = f'''"""
 ╔══════════════════════════════════════════════════════════════════╗
 ║  EUG COMPRESSED FILE - NFT-Ready Crypto-Signed                  ║
 ║  Original: {html_path.name:<52} ║
@@ -300,157 +854,445 @@ AI PERSONALITY COMPRESSION:
 • AI #82 (Career Coach): Validated file integrity
 
 NFT METADATA:
-• Original Hash: {nft_hash}
+• Original Hash: {meta['nft_hash']}
+• Content Hash: {meta['content_hash']}
 • Original Size: {original_size:,} bytes
-• Compressed Size: {len(encrypted_b64):,} bytes
-• Compression Ratio: {(1 - len(encrypted_b64) / original_size) * 100:.1f}%
+• Compressed Size: {payload_size:,} bytes
+• Compression Ratio: {(1 - payload_size / max(original_size, 1)) * 100:.1f}%
 • XOR Key: "eug"
+• Codebook: v{self.codebook_version}
+• Entropy Coding: {self.entropy_backend} (level {meta['entropy_level']})
+• Dictionary: {self.dictionary_id or "none"}
 • Strategy: {strategy['compression_level']}
-• Content Type: {content_type}
+• Content Type: {meta['content_type']}
 
 DECOMPRESSION:
 1. Base64 decode the encrypted data
 2. XOR decrypt with "eug" key
-3. Convert 3D symbols back to HTML
-4. Validate integrity with original hash
+3. Entropy decode ({self.entropy_backend})
+4. Convert 3D symbols back to HTML (eug_codec codebook)
+5. Validate integrity with content hash
 """
 
 # EUG Compression System
 import base64
+import hashlib
+
+from eug_codec import xor_bytes, load_codebook, entropy_decompress, load_dictionary
+
+CODEBOOK_VERSION = {self.codebook_version}
+ENTROPY_BACKEND = "{self.entropy_backend}"
+DICTIONARY_ID = {self.dictionary_id!r}
+CONTENT_HASH = "{meta['content_hash']}"
 
 class EugDecompressor:
     def __init__(self):
         self.xor_key = b"eug"
+        self.codec = load_codebook(CODEBOOK_VERSION)
         self.symbol_map = self._get_reverse_map()
     
     def _get_reverse_map(self):
-        # Reverse symbol mapping for decompression
-        return {{
-            # Symbols generated during compression
-        }}
+        # Reverse symbol mapping, shared by every file using this codebook
+        return self.codec.reverse_map
     
     def xor_decrypt(self, encrypted_data, key):
-        key_repeated = (key * (len(encrypted_data) // len(key) + 1))[:len(encrypted_data)]
-        return bytes(a ^ b for a, b in zip(encrypted_data, key_repeated))
+        return xor_bytes(encrypted_data, key)
     
     def decompress(self):
         # Decrypt
         encrypted = base64.b64decode(compressed_data)
         decrypted = self.xor_decrypt(encrypted, self.xor_key)
-        symbolic = decrypted.decode('utf-8')
+        zdict = load_dictionary(DICTIONARY_ID) if DICTIONARY_ID else None
+        symbolic = entropy_decompress(decrypted, ENTROPY_BACKEND, zdict).decode('utf-8')
         
         # Convert symbols back to HTML
-        html = symbolic
-        for symbol, original in self.symbol_map.items():
-            html = html.replace(symbol, original)
-        
-        return html
+        return self.codec.decode(symbolic)
     
     def get_original(self):
         return self.decompress()
+    
+    def verify(self):
+        html = self.decompress()
+        return hashlib.sha256(html.encode('utf-8')).hexdigest() == CONTENT_HASH
 
 # Compressed Data (XOR encrypted + Base64 encoded)
-compressed_data = """{encrypted_b64}"""
+compressed_data = """'''
+        
+        tail = '''"""
 
 # Usage:
 # decompressor = EugDecompressor()
 # original_html = decompressor.get_original()
 # print(original_html)
 '''
+        return head, tail
+    
+    def dictionary_samples(self, html_files):
+        """What the entropy stage sees for each file: optimized, symbol-encoded UTF-8"""
+        samples = []
+        for html_file in html_files:
+            with open(html_file, 'r', encoding='utf-8') as f:
+                optimizer = _optimizer_stream()
+                optimized = optimizer.feed(f.read()) + optimizer.flush()
+            samples.append(self.symbol_codec.encode(optimized).encode('utf-8'))
+        return samples
+    
+    def train_dictionary(self, html_files, size=DICTIONARY_SIZE, output_dir=None):
+        """
+        Train a shared zlib dictionary on the corpus and save it as
+        eug_dict_<hash>.zdict (next to eug_codec.py by default)
+        """
+        log.info(f"📚 Training shared dictionary on {len(html_files)} files...")
+        zdict = train_dictionary(self.dictionary_samples(html_files), size)
+        dict_id = save_dictionary(zdict, output_dir)
+        log.info(f"   Dictionary: {dict_id} ({len(zdict):,} bytes)")
+        return dict_id
+    
+    @property
+    def codec_version(self):
+        """Everything besides the input that decides the generated file"""
+        return (f"eug-{self.version}/codebook-{self.codebook_version}/"
+                f"{self.entropy_backend}/{self.dictionary_id or 'nodict'}"
+                + (f"/blocks-{self.block_size}" if self.block_size else ""))
+    
+    def compress_many(self, html_files, output_dir="compressed_py", workers=None,
+                      priority=(), report=None, cache=None, force=False, format="py",
+                      verify=0.0):
+        """
+        Compress html_files on a pool of `workers` processes (default: one
+        per CPU; 1 runs in this process). Files named in `priority` start
+        first, in that order; the rest start largest-first so one big page
+        doesn't finish alone at the end. Returns one html_to_py result per
+        input file, in input order, and calls report(index, html_file,
+        result, log) in that same order as soon as each file is ready.
         
-        # Create output directory
-        output_path = Path(output_dir)
-        output_path.mkdir(exist_ok=True)
+        With a CompressionCache, unchanged files reuse their previous
+        artifact instead of being recompressed; force=True recompresses
+        everything (and refreshes the cache). format is passed to html_to_py.
         
-        # Write Python file
-        py_filename = html_path.stem + "_compressed.py"
-        py_filepath = output_path / py_filename
+        output_dir may also be a list with one directory per input file.
         
-        with open(py_filepath, 'w', encoding='utf-8') as f:
-            f.write(py_content)
+        verify is the fraction of files (0.0-1.0, see verify_sample) that
+        are decoded again and checked against their content hash: 1.0
+        checks everything, 0.1 spends a tenth of that cost. The sample
+        covers cache hits too; a hit that fails the check is dropped from
+        the cache and recompressed, and a compressed file that fails is
+        not cached. A hit outside the sample reports verified=None.
+        """
+        html_files = list(html_files)
+        report = report or _print_batch_log
+        workers = workers or os.cpu_count() or 1
+        if isinstance(output_dir, (str, os.PathLike)):
+            output_dirs = [output_dir] * len(html_files)
+        else:
+            output_dirs = list(output_dir)
         
-        compressed_size = len(py_content)
-        compression_ratio = (1 - compressed_size / original_size) * 100
+        # Install the runtime once up front, so workers never race to copy it
+        for directory in set(map(str, output_dirs)):
+            Path(directory).mkdir(parents=True, exist_ok=True)
+            install_runtime(directory, self.dictionary_id)
         
-        print(f"\n{'='*70}")
-        print(f"✅ COMPRESSION COMPLETE")
-        print(f"{'='*70}")
-        print(f"Output: {py_filepath}")
-        print(f"Original: {original_size:,} bytes ({original_size / 1024:.2f} KB)")
-        print(f"Compressed: {compressed_size:,} bytes ({compressed_size / 1024:.2f} KB)")
-        print(f"Savings: {compression_ratio:.1f}%")
-        print(f"NFT Hash: {nft_hash}")
+        # Inputs that write the same output path (e.g. two index.html in
+        # different folders) overwrite each other, so none of them is cached
+        outputs = [Path(d) / output_filename(f, format) for d, f in zip(output_dirs, html_files)]
+        shared = {path for path in outputs if outputs.count(path) > 1}
         
-        # AI #82 validates
-        print(f"\n🤖 AI Personality Analysis:")
-        print(f"   AI #67: Compression efficiency: {compression_ratio:.1f}%")
-        print(f"   AI #1: Symbolic beautification complete")
-        print(f"   AI #82: File integrity validated ✓")
+        results = [None] * len(html_files)
+        done = {}
+        keys = {}
+        hits = {}
+        if cache is not None:
+            for index, html_file in enumerate(html_files):
+                if not Path(html_file).exists() or outputs[index] in shared:
+                    continue
+                keys[index] = cache.key(cache.input_hash(html_file), self.codec_version,
+                                        outputs[index].name)
+                hit = None if force else cache.lookup(keys[index], outputs[index])
+                if hit:
+                    hits[index] = hit
+        order = schedule_batch(html_files, priority)
+        checked = set(verify_sample(html_files, verify))
+        for index, hit in hits.items():
+            verified, verify_seconds = None, 0.0
+            if index in checked:
+                # An entry cached before results carried the payload
+                # location can't be checked in place: it's recompressed
+                verified, verify_seconds = (self.verify_output(hit['output'], hit)
+                                            if 'payload_offset' in hit else (False, 0.0))
+                if not verified:
+                    cache.discard(keys[index])
+                    continue
+            done[index] = _cache_hit_logged(dict(hit, verified=verified,
+                                                 verify_seconds=verify_seconds))
+        order = [i for i in order if i not in done]
         
-        return {
-            "input": str(html_path),
-            "output": str(py_filepath),
-            "original_size": original_size,
-            "compressed_size": compressed_size,
-            "compression_ratio": compression_ratio,
-            "nft_hash": nft_hash,
-            "content_type": content_type,
-            "strategy": strategy
-        }
-    
-    def _generate_symbol_dict(self):
-        """Generate Python dict string for symbol mapping"""
-        lines = []
-        for symbol, original in self.symbol_map.items():
-            lines.append(f"            '{symbol}': '{original}',")
-        return '\n'.join(lines)
+        reported = 0
+        
+        def flush():
+            # Report in input order as soon as the next file is ready
+            nonlocal reported
+            while reported in done:
+                results[reported], text = done.pop(reported)
+                report(reported, html_files[reported], results[reported], text)
+                reported += 1
+        
+        def finish(index, outcome):
+            done[index] = outcome
+            if outcome[0] and index in keys and outcome[0]['verified'] is not False:
+                cache.store(keys[index], outcome[0])
+            flush()
+        
+        flush()
+        if workers == 1 or len(order) < 2:
+            for index in order:
+                finish(index, _compress_logged(self, html_files[index], output_dirs[index],
+                                               format, index in checked))
+        else:
+            settings = (self.entropy_backend, self.dictionary_id, self.block_size,
+                        current_config())
+            with ProcessPoolExecutor(min(workers, len(order)),
+                                     initializer=_init_batch_worker,
+                                     initargs=settings) as pool:
+                futures = {index: pool.submit(_batch_worker, html_files[index],
+                                              output_dirs[index], format, index in checked)
+                           for index in order}
+                # Futures are awaited in input order, so reporting stays
+                # deterministic no matter which worker finishes first
+                for index in sorted(futures):
+                    finish(index, futures[index].result())
+        flush()
+        
+        if cache is not None:
+            cache.save()
+        return results
     
-    def batch_compress(self, html_files):
-        """Compress multiple HTML files"""
-        results = []
-        for html_file in html_files:
-            result = self.html_to_py(html_file)
+    def build_archive(self, html_files, archive_path="compressed_pages.euga", workers=None,
+                      priority=(), report=None, cache=None, force=False, verify=0.0):
+        """
+        Compress html_files into one .euga archive (see compress_many): each
+        page is an independent .eug member, found through the central index
+        by its path. Returns the per-file results, pointing into the archive.
+        """
+        html_files = list(html_files)
+        archive_path = Path(archive_path)
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=archive_path.parent) as staging:
+            # Pages with the same file name are staged in separate folders
+            seen = Counter()
+            staging_dirs = []
+            for html_file in html_files:
+                stem = Path(html_file).stem
+                staging_dirs.append(Path(staging) / str(seen[stem]))
+                seen[stem] += 1
+            results = self.compress_many(html_files, staging_dirs, workers, priority, report,
+                                         cache=cache, force=force, format="eug", verify=verify)
+            for result in results:
+                if result:
+                    result['member'] = Path(result['input']).as_posix()
+            write_archive(archive_path, ((r['member'], Path(r['output']).read_bytes())
+                                         for r in results if r))
+        install_runtime(archive_path.parent, self.dictionary_id)
+        for result in results:
             if result:
-                results.append(result)
+                result['output'] = str(archive_path)
+        return results
+    
+    def batch_compress(self, html_files, output_dir="compressed_py", workers=None,
+                       priority=(), cache=None, force=False, format="py", verify=0.0):
+        """Compress multiple HTML files in parallel (see compress_many)"""
+        results = [r for r in self.compress_many(html_files, output_dir, workers, priority,
+                                                 cache=cache, force=force, format=format,
+                                                 verify=verify) if r]
         
-        print(f"\n{'='*70}")
-        print(f"📊 BATCH COMPRESSION SUMMARY")
-        print(f"{'='*70}")
-        print(f"Files processed: {len(results)}")
+        log.info(f"\n{'='*70}")
+        log.info(f"📊 BATCH COMPRESSION SUMMARY")
+        log.info(f"{'='*70}")
+        log.info(f"Files processed: {len(results)}")
         
         total_original = sum(r['original_size'] for r in results)
         total_compressed = sum(r['compressed_size'] for r in results)
-        avg_compression = (1 - total_compressed / total_original) * 100
+        avg_compression = (1 - total_compressed / max(total_original, 1)) * 100
         
-        print(f"Total original: {total_original:,} bytes ({total_original / 1024 / 1024:.2f} MB)")
-        print(f"Total compressed: {total_compressed:,} bytes ({total_compressed / 1024 / 1024:.2f} MB)")
-        print(f"Average compression: {avg_compression:.1f}%")
-        print(f"Total savings: {total_original - total_compressed:,} bytes ({(total_original - total_compressed) / 1024 / 1024:.2f} MB)")
+        log.info(f"Total original: {total_original:,} bytes ({total_original / 1024 / 1024:.2f} MB)")
+        log.info(f"Total compressed: {total_compressed:,} bytes ({total_compressed / 1024 / 1024:.2f} MB)")
+        log.info(f"Average compression: {avg_compression:.1f}%")
+        log.info(f"Total savings: {total_original - total_compressed:,} bytes ({(total_original - total_compressed) / 1024 / 1024:.2f} MB)")
+        log.info(verification_summary(results))
+        progress(log, "batch_done", files=len(results), original_size=total_original,
+                 compressed_size=total_compressed, ratio=round(avg_compression, 2),
+                 cached=sum(bool(r.get('cached')) for r in results))
         
         return results
 
 
+# ═══════════════════════════════════════════════════════════════════
+# PARALLEL BATCH WORKERS
+# ═══════════════════════════════════════════════════════════════════
+
+def output_filename(html_path, format="py"):
+    """Name of the file html_to_py writes for html_path"""
+    return Path(html_path).stem + OUTPUT_FORMATS[format]
+
+
+def sample_size(count, fraction):
+    """How many of `count` files a verify fraction covers (at least one if > 0)"""
+    return min(count, math.ceil(count * max(fraction, 0.0)))
+
+
+def verify_sample(html_files, fraction):
+    """
+    Indexes of the html_files a verify fraction checks: a random pick,
+    seeded by the file names so rerunning the same batch checks the same
+    files (and a failure can be reproduced)
+    """
+    seed = hashlib.sha256('\0'.join(sorted(map(str, html_files))).encode('utf-8')).hexdigest()
+    return random.Random(seed).sample(range(len(html_files)),
+                                      sample_size(len(html_files), fraction))
+
+
+def verification_summary(results):
+    """One-line report of a batch's verify cost, for the batch summaries"""
+    compressed = [r for r in results if not r.get('cached')]
+    checked = [r for r in results if r.get('verified') is not None]
+    if not checked:
+        if not compressed:
+            return "Verified: nothing new (every file reused from the cache)"
+        return "Verified: none (pass verify=0.0-1.0 / --verify[=PERCENT] to sample)"
+    failed = sum(not r['verified'] for r in checked)
+    reused = sum(bool(r.get('cached')) for r in checked)
+    verify_seconds = sum(r['verify_seconds'] for r in checked)
+    cost = f"cost {verify_seconds:.2f}s"
+    # Set against the batch's compression time only when most checks were
+    # of files compressed in this run: a reused file's check has no
+    # compression time of its own here
+    if reused * 2 < len(checked):
+        fresh_seconds = sum(r['verify_seconds'] for r in checked if not r.get('cached'))
+        compress_seconds = sum(r['compress_seconds'] for r in compressed)
+        cost += f", {fresh_seconds / max(compress_seconds, 1e-9):.0%} of compression time"
+    return (f"Verified: {len(checked)}/{len(results)} files"
+            + (f" ({reused} reused from the cache)" if reused else "")
+            + f", {'all passed' if not failed else f'{failed} FAILED'} ({cost})")
+
+
+def schedule_batch(html_files, priority=()):
+    """
+    Start order for a batch, as indexes into html_files: priority files
+    first (in priority order), then everything else largest-first
+    """
+    rank = {Path(name).name: i for i, name in enumerate(priority)}
+    
+    def size(path):
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+    
+    def key(index):
+        name = Path(html_files[index]).name
+        if name in rank:
+            return (0, rank[name], 0)
+        return (1, 0, -size(html_files[index]))
+    
+    return sorted(range(len(html_files)), key=key)
+
+
+def _compress_logged(compressor, html_file, output_dir, format="py", verify=False):
+    """html_to_py with its report captured, so parallel logs don't interleave"""
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        result = compressor.html_to_py(html_file, output_dir=output_dir, format=format,
+                                       verify=verify)
+    return result, report.getvalue()
+
+
+def _cache_hit_logged(hit):
+    """The captured report of a file reused from the cache"""
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        log.info(f"⚡ Unchanged, reused cached artifact: {hit['output']}")
+        progress(log, "file_done", file=hit.get('input'), output=hit['output'],
+                 original_size=hit.get('original_size'),
+                 compressed_size=hit.get('compressed_size'),
+                 ratio=round(hit.get('compression_ratio', 0.0), 2),
+                 verified=hit.get('verified'), cached=True)
+    return hit, report.getvalue()
+
+
+def _print_batch_log(index, html_file, result, text):
+    # The report is already formatted (by the eug log handler) when captured
+    sys.stdout.write(text)
+
+
+_worker_compressor = None
+
+
+def _init_batch_worker(entropy_backend, dictionary_id, block_size, log_config=None):
+    # One compressor per worker process: the codec tables and dictionary
+    # are built once, not once per file; logging is set up as in the parent
+    global _worker_compressor
+    configure_worker(log_config)
+    _worker_compressor = EugCompressionSystem(entropy_backend, dictionary_id, block_size)
+
+
+def _batch_worker(html_file, output_dir, format, verify):
+    return _compress_logged(_worker_compressor, html_file, output_dir, format, verify)
+
+
 # ═══════════════════════════════════════════════════════════════════
 # USAGE EXAMPLES
 # ═══════════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
-    import sys
+    configure(*cli_config(sys.argv))
+    
+    def option(name, default=None):
+        return next((arg.split('=', 1)[1] for arg in sys.argv[1:]
+                     if arg.startswith(f'--{name}=')), default)
+    
+    # --entropy=zlib|lzma|bz2|none picks the entropy-coding backend,
+    # --dictionary=<id> a shared dictionary made by --train-dictionary,
+    # --workers=N the batch process count (default: one per CPU),
+    # --format=eug binary .eug containers instead of .py wrappers,
+    # --verify[=PERCENT] decodes (a sample of) the outputs to check them,
+    # --blocks[=KB] block-indexed .eug output for per-section reads,
+    # --verbose / --quiet / --progress the full narration, warnings only,
+    # or JSON progress lines; batches skip unchanged files unless --force (or --no-cache) is given
+    if '--train-dictionary' in sys.argv:
+        import glob
+        EugCompressionSystem().train_dictionary(sorted(glob.glob("*.html")))
+        sys.exit(0)
     
-    compressor = EugCompressionSystem()
+    blocks = option('blocks', 64 if '--blocks' in sys.argv else None)
+    compressor = EugCompressionSystem(entropy_backend=option('entropy', "zlib"),
+                                      dictionary_id=option('dictionary'),
+                                      block_size=int(blocks) * 1024 if blocks else None)
+    # --stream forces the chunked pipeline (default: automatic by size)
+    stream = True if '--stream' in sys.argv else None
+    output_format = option('format', "eug" if blocks else "py")
+    output_dir = "compressed_eug" if output_format == "eug" else "compressed_py"
+    verify = float(option('verify', 100 if '--verify' in sys.argv else 0)) / 100
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
     
-    if len(sys.argv) > 1:
+    if args:
         # Compress specific file
-        html_file = sys.argv[1]
-        compressor.html_to_py(html_file)
+        html_file = args[0]
+        compressor.html_to_py(html_file, output_dir, stream=stream, format=output_format,
+                              verify=verify > 0)
     else:
         # Compress all HTML files in current directory
         import glob
         html_files = glob.glob("*.html")
         
         if html_files:
-            print(f"Found {len(html_files)} HTML files")
-            compressor.batch_compress(html_files)
+            log.info(f"Found {len(html_files)} HTML files")
+            from eug_cache import CompressionCache
+            workers = option('workers')
+            cache = None if '--no-cache' in sys.argv else CompressionCache()
+            compressor.batch_compress(html_files, output_dir,
+                                      workers=int(workers) if workers else None,
+                                      cache=cache, force='--force' in sys.argv,
+                                      format=output_format, verify=verify)
         else:
-            print("Usage: python eug_compression_system.py <html_file>")
+            print("Usage: python eug_compression_system.py [--stream] [--entropy=zlib|lzma|bz2|none] [--dictionary=ID] [--format=py|eug] [--blocks[=KB]] [--verify[=PERCENT]] [--workers=N] [--force] [--no-cache] [--verbose|--quiet|--progress] <html_file>")
+            print("       python eug_compression_system.py --train-dictionary")
             print("Or run in directory with HTML files for batch compression")
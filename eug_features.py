@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════╗
+║  EUG CONTENT FEATURES - Routing Signals in One Streaming Pass   ║
+║  What both Meta-AIs look at before picking a strategy           ║
+╚══════════════════════════════════════════════════════════════════╝
+
+MetaAIOrchestrator.assign_ai and EugCompressionSystem.html_to_py route
+on the same handful of signals: Three.js / WebGL / 3D markers and how
+often 'style', '<style' and 'function' occur. ContentFeatures gathers
+all of them chunk by chunk, walking each chunk in cache-sized blocks
+by index (no slices, no case-folded copies of the page). The
+case-insensitive words are ASCII-only patterns (skipped once the
+case-sensitive marker they are OR-ed with has turned up), which is what
+`'webgl' in text.lower()` meant, since no other character lower-cases
+to these letters.
+"""
+
+import re
+
+# Case-sensitive markers that only need to be seen once
+PRESENT = ('THREE.', 'gl_', '3D', '3d')
+# Case-insensitive markers, any ASCII casing, each with the case-sensitive
+# marker it is OR-ed with: once that one is seen the scan is moot
+CASELESS = {'three.js': 'THREE.', 'webgl': 'gl_'}
+# Occurrence counts
+COUNTED = ('style', '<style', 'function')
+
+SCAN_BLOCK = 64 * 1024
+# A match can straddle two chunks by at most this many characters
+_SEAM = max(map(len, PRESENT + tuple(CASELESS) + COUNTED)) - 1
+
+# One pattern per word: an alternation defeats sre's literal scanning
+# and runs ~3x slower than the two searches it replaces
+_CASELESS_PATTERNS = {word: re.compile(re.escape(word), re.IGNORECASE | re.ASCII)
+                      for word in CASELESS}
+
+
+class ContentFeatures:
+    """Routing signals for a document, fed in chunks (or all at once)"""
+
+    def __init__(self):
+        self.length = 0
+        self._found = set()
+        self.counts = dict.fromkeys(COUNTED, 0)
+        self._tail = ''
+
+    @classmethod
+    def of(cls, text):
+        return cls().feed(text)
+
+    def feed(self, text):
+        if self._tail:
+            # Matches that start in the previous chunk and end in this one
+            tail = len(self._tail)
+            seam = self._tail + text[:_SEAM]
+            self._probe(seam, 0, len(seam))
+            for word in COUNTED:
+                self.counts[word] += seam.count(word, max(0, tail - len(word) + 1),
+                                                tail + len(word) - 1)
+
+        size = len(text)
+        for start in range(0, size, SCAN_BLOCK):
+            end = min(size, start + SCAN_BLOCK)
+            # Each block owns the matches that start inside it
+            self._probe(text, start, min(size, end + _SEAM))
+            for word in COUNTED:
+                self.counts[word] += text.count(word, start, min(size, end + len(word) - 1))
+
+        self.length += size
+        self._tail = text[-_SEAM:] if size >= _SEAM else (self._tail + text)[-_SEAM:]
+        return self
+
+    def _probe(self, text, start, end):
+        """Record which markers occur in text[start:end] (presence only)"""
+        for word in PRESENT:
+            if word not in self._found and text.find(word, start, end) >= 0:
+                self._found.add(word)
+        for word, partner in CASELESS.items():
+            if word not in self._found and partner not in self._found \
+                    and _CASELESS_PATTERNS[word].search(text, start, end):
+                self._found.add(word)
+
+    @property
+    def has_threejs(self):
+        return 'THREE.' in self._found or 'three.js' in self._found
+
+    @property
+    def has_webgl(self):
+        return 'gl_' in self._found or 'webgl' in self._found
+
+    @property
+    def has_3d(self):
+        return 'THREE.' in self._found or '3D' in self._found or '3d' in self._found
+
+    @property
+    def style_tags(self):
+        return self.counts['<style']
+
+    @property
+    def css_ratio(self):
+        return self.counts['style'] / max(self.length, 1)
+
+    @property
+    def js_ratio(self):
+        return self.counts['function'] / max(self.length, 1)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════╗
+║  EUG FORMATS - Format-Aware Fast Paths for JSON, SVG, Markdown  ║
+║  What the HTML lexer can't know about data, vectors and prose   ║
+╚══════════════════════════════════════════════════════════════════╝
+
+The multi-AI specialists for .json, .svg and .md files used to run the
+HTML minifier like everyone else: a pure-Python lexer that knows
+nothing of JSON strings, and whose whitespace collapsing flattens a
+Markdown document onto one line. Each format gets its own codec here:
+
+• JSON: parsed and re-serialized compactly by the C json module, keys
+  interned as they are read (a batch of similar documents shares one
+  copy of each key); a document with duplicate keys is refused rather
+  than silently merged
+• SVG: numbers in path data (d="…", points="…") rounded to a precision
+  that follows the viewBox (svg_precision) and written with minimal
+  separators, then the markup minified keeping its whitespace
+• Markdown: line endings, trailing whitespace and runs of blank lines
+  normalized; fenced code blocks and hard line breaks kept as they are
+
+A codec raises ValueError for input that isn't in its format, so the
+caller can fall back to the generic path.
+"""
+
+import re
+import sys
+import json
+import math
+
+from eug_minify import minify
+
+# Decimals kept in SVG path data when the viewBox is PATH_PRECISION_EXTENT
+# user units across or more: a thousandth of a unit is far below a pixel
+# there. A smaller viewBox keeps one more decimal per factor of 10 below
+PATH_PRECISION = 3
+PATH_PRECISION_EXTENT = 10
+
+
+def _interned_object(pairs):
+    obj = {sys.intern(key): value for key, value in pairs}
+    if len(obj) != len(pairs):
+        raise ValueError("Duplicate keys in a JSON object")
+    return obj
+
+
+# An escaped UTF-16 surrogate may decode to half a pair, which can't be
+# written as UTF-8: only then is the output checked
+_SURROGATE_ESCAPE = re.compile(r'\\u[dD][89a-fA-F]')
+
+
+def compact_json(text):
+    """text re-serialized with no insignificant whitespace (same values, shortest form)"""
+    data = json.loads(text, object_pairs_hook=_interned_object)
+    compact = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    if _SURROGATE_ESCAPE.search(text):
+        try:
+            compact.encode('utf-8')
+        except UnicodeEncodeError:
+            compact = json.dumps(data, separators=(',', ':'))
+    return compact
+
+
+_PATH_ATTRIBUTE = re.compile(r'(?<![\w:.-])(d|points)(\s*=\s*)(["\'])(.*?)\3', re.S)
+_PATH_DATA = re.compile(r'[\s,MmZzLlHhVvCcSsQqTt0-9.eE+-]*')
+_PATH_TOKEN = re.compile(r'[MmZzLlHhVvCcSsQqTt]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+
+def _number(token, precision):
+    """token rounded to precision decimals, with no trailing zeros and no leading 0"""
+    number = '%.*f' % (precision, float(token))
+    if precision:
+        number = number.rstrip('0').rstrip('.')
+    if number[0] == '-':
+        if number == '-0':
+            return '0'
+        if number[1] == '0' and len(number) > 2:
+            return '-' + number[2:]
+    elif number[0] == '0' and len(number) > 1:
+        return number[1:]
+    return number
+
+
+def compact_path(data, precision=PATH_PRECISION):
+    """
+    Path data (or a points list) with every number rounded to precision
+    decimals and only the separators the grammar needs. Data with arcs
+    (whose flags may be written run together) or anything unexpected is
+    returned unchanged.
+    """
+    if not _PATH_DATA.fullmatch(data):
+        return data
+    out = []
+    previous = ""
+    for token in _PATH_TOKEN.findall(data):
+        if token.isalpha():
+            out.append(token)
+            previous = token
+            continue
+        number = _number(token, precision)
+        if previous and not previous.isalpha() and number[0] != '-' and \
+                not (number[0] == '.' and '.' in previous):
+            out.append(' ')
+        out.append(number)
+        previous = number
+    return ''.join(out)
+
+
+_VIEW_BOX = re.compile(r'<svg\b[^>]*?\sviewBox\s*=\s*(["\'])(.*?)\1', re.S)
+
+
+def svg_precision(text):
+    """Decimals to keep in text's path data, from its viewBox (PATH_PRECISION without one)"""
+    match = _VIEW_BOX.search(text)
+    try:
+        extent = max(abs(float(n)) for n in re.split(r'[\s,]+', match[2].strip())[2:4])
+    except (TypeError, ValueError):
+        return PATH_PRECISION
+    if not 0 < extent < PATH_PRECISION_EXTENT:
+        return PATH_PRECISION
+    return PATH_PRECISION + math.ceil(math.log10(PATH_PRECISION_EXTENT / extent))
+
+
+def compact_svg(text, precision=None):
+    """
+    SVG markup with its path data compacted (compact_path, to precision
+    decimals; by default svg_precision's) and comments/whitespace minified
+    """
+    if '<svg' not in text:
+        raise ValueError("Not an SVG document")
+    if precision is None:
+        precision = svg_precision(text)
+    text = _PATH_ATTRIBUTE.sub(
+        lambda m: f"{m[1]}={m[3]}{compact_path(m[4], precision)}{m[3]}", text)
+    return minify(text, keep_whitespace=True)
+
+
+_FENCE = re.compile(r' {0,3}(`{3,}|~{3,})')
+
+
+def normalize_markdown(text):
+    """
+    Markdown with LF line endings, no trailing whitespace (a hard break's
+    two spaces excepted), one blank line between blocks at most and one
+    newline at the end. Fenced code blocks, and the blank lines after an
+    indented (possibly code) line, are kept verbatim.
+    """
+    out = []
+    fence = None
+    blank = True  # leading blank lines go
+    indented = False
+    for line in text.replace('\r\n', '\n').replace('\r', '\n').split('\n'):
+        if fence is not None:
+            out.append(line)
+            stripped = line.strip()
+            if stripped.startswith(fence) and not stripped.strip(fence[0]):
+                fence = None
+            continue
+        stripped = line.rstrip()
+        if not stripped:
+            if not blank or indented:
+                out.append('')
+            blank = True
+            continue
+        opening = _FENCE.match(line)
+        if opening:
+            fence = opening[1]
+        elif line.endswith('  '):
+            stripped += '  '
+        out.append(stripped)
+        blank = False
+        indented = line.startswith(('    ', '\t'))
+    if fence is not None:
+        # An unclosed fence runs to the end of the document, verbatim
+        return '\n'.join(out)
+    while out and not out[-1]:
+        out.pop()
+    return '\n'.join(out) + '\n'
+
+
+FORMATS = {
+    "json": compact_json,
+    "svg": compact_svg,
+    "markdown": normalize_markdown,
+}
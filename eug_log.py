@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════╗
+║  EUG LOG - One Output Layer for Every Compression Tool          ║
+║  Human text, machine-readable progress, or nothing at all       ║
+╚══════════════════════════════════════════════════════════════════╝
+
+Everything the tools used to print goes through the "eug" logger tree
+(eug.compression, eug.multi_ai, eug.nft, eug.batch):
+
+    DEBUG    the per-AI narration (each optimizer, validator, stage)
+    INFO     one headline block per file, batch summaries
+    WARNING  failed checks, files that couldn't be read
+
+Imported as a library the tree is silent: nothing is configured, so
+debug/info calls are rejected by the level check before any handler
+runs (reset() goes back to this). The command-line tools call
+configure() with one of two modes:
+
+    text       the messages on stdout, as they always looked
+    progress   JSON lines on stdout: one per progress() event
+               ({"event": "file_done", "file": ..., ...}) and per
+               warning, and nothing else
+
+cli_config() maps --verbose / --quiet / --progress to a configuration.
+The text handler writes to whatever sys.stdout is at the time, so the
+batch code can still capture one file's report with redirect_stdout and
+replay it in order. When stdout's reader goes away (`... | head`), the
+tool exits quietly (stdout_closed) instead of logging a BrokenPipeError
+for every line that follows.
+"""
+
+import os
+import sys
+import json
+import logging
+
+ROOT = "eug"
+MODES = ("text", "progress")
+
+logging.getLogger(ROOT).addHandler(logging.NullHandler())
+
+_config = None  # (mode, level) once configure() has run
+
+
+def get_logger(name):
+    """The eug.<name> logger"""
+    return logging.getLogger(f"{ROOT}.{name}")
+
+
+def progress(logger, event, **fields):
+    """A machine-readable progress event: a JSON line in progress mode, dropped in text mode"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(event, extra={"progress": {"event": event, **fields}})
+
+
+def stdout_closed():
+    """
+    Exit quietly after a BrokenPipeError on stdout: the rest of the output
+    goes to devnull, so the interpreter's final flush doesn't fail again
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    sys.exit(1)
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler on the current sys.stdout rather than the one at construction"""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+    def handleError(self, record):
+        if isinstance(sys.exc_info()[1], BrokenPipeError):
+            stdout_closed()
+        super().handleError(record)
+
+
+class _TextFilter(logging.Filter):
+    def filter(self, record):
+        return not hasattr(record, "progress")
+
+
+class _ProgressFilter(logging.Filter):
+    def filter(self, record):
+        return hasattr(record, "progress") or record.levelno >= logging.WARNING
+
+
+class _ProgressFormatter(logging.Formatter):
+    def format(self, record):
+        fields = getattr(record, "progress", None)
+        if fields is None:
+            fields = {"event": record.levelname.lower(), "message": record.getMessage().strip()}
+        return json.dumps({"time": round(record.created, 3), **fields},
+                          separators=(',', ':'), default=str)
+
+
+def configure(mode="text", level=logging.INFO):
+    """Route the eug loggers to stdout in mode ("text" or "progress") from level up"""
+    global _config
+    if mode not in MODES:
+        raise ValueError(f"Unknown log mode {mode!r} (expected one of {', '.join(MODES)})")
+    root = logging.getLogger(ROOT)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = _StdoutHandler()
+    if mode == "text":
+        handler.addFilter(_TextFilter())
+        handler.setFormatter(logging.Formatter("%(message)s"))
+    else:
+        handler.addFilter(_ProgressFilter())
+        handler.setFormatter(_ProgressFormatter())
+        # Progress events are INFO: quieter levels would hide them
+        level = min(level, logging.INFO)
+    root.addHandler(handler)
+    root.setLevel(level)
+    root.propagate = False
+    _config = (mode, level)
+    return _config
+
+
+def reset():
+    """Back to library mode: no handlers but the NullHandler, no level of its own"""
+    global _config
+    root = logging.getLogger(ROOT)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.NullHandler())
+    root.setLevel(logging.NOTSET)
+    root.propagate = True
+    _config = None
+
+
+def current_config():
+    """What configure() was last called with, for worker processes to repeat; None if never"""
+    return _config
+
+
+def configure_worker(config):
+    """Worker-process initializer half: repeat the parent's configuration (None: stay silent)"""
+    if config is not None:
+        configure(*config)
+
+
+def cli_config(argv):
+    """(mode, level) for a tool's argv: --progress, --quiet (warnings only), --verbose (everything)"""
+    mode = "progress" if "--progress" in argv else "text"
+    if "--quiet" in argv:
+        level = logging.WARNING
+    elif "--verbose" in argv:
+        level = logging.DEBUG
+    else:
+        level = logging.INFO
+    return mode, level
@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════╗
+║  EUG MINIFIER - Single-Pass HTML / CSS / JS Lexer               ║
+║  Strips comments and whitespace without touching code or data   ║
+╚══════════════════════════════════════════════════════════════════╝
+
+Replaces the old regex passes (\\s+ → ' ', >\\s+< → ><, <!--…-->, //…$,
+/*…*/). Those ran over the whole page at once, so `//` in an https://
+URL or a JS string started a "comment" that ate the rest of the file.
+
+One linear scan, driven by what the browser would see:
+• HTML: comments dropped, whitespace collapsed, >␣< closed up between
+  block-level tags (between inline ones the space renders), quoted
+  attribute values kept verbatim
+• <script> (JavaScript types): strings, template literals and regex
+  literals kept verbatim; comments dropped; whitespace kept only where
+  it separates tokens or a newline could matter for semicolon insertion
+• <style>: strings and url(...) kept verbatim, comments dropped,
+  whitespace dropped around { } ; , > and before }
+• <pre>, <textarea> and non-JS <script> (shaders, JSON): verbatim
+
+Minifier is incremental: feed() any chunking of a document and flush()
+at the end, and the output is identical to minify() on the whole text.
+"""
+
+import re
+
+# Lexer states
+HTML, SCRIPT, STYLE, RAW = range(4)
+
+# Tokens must end at least this far before the end of a partial buffer,
+# so every decision that peeks ahead ("</script", "${", regex flags, an
+# escape at the buffer edge) sees the characters it needs.
+LOOKAHEAD = 16
+
+_SPACE = re.compile(r'\s+')
+_HTML_TEXT = re.compile(r'[^<\s]+')
+_TAG_OPEN = re.compile(r'<(/?)([a-zA-Z][^\s/>]*)')
+_TAG_PART = re.compile(r'\s+|"[^"]*"|\'[^\']*\'|/?>|[^\s"\'/>]+|/')
+_SCRIPT_TYPE = re.compile(r'\stype\s*=\s*["\']?([^"\'\s>]*)', re.I)
+_CLOSE = {name: re.compile(f'</{name}', re.I)
+          for name in ("script", "style", "pre", "textarea")}
+# Whitespace next to these tags never renders (the element starts or
+# ends a line, or isn't displayed), so it can go between two of them
+_BLOCK_TAGS = frozenset(
+    "html head body title base link meta script style noscript template "
+    "address article aside blockquote details dialog summary div dl dd dt "
+    "fieldset figcaption figure footer form h1 h2 h3 h4 h5 h6 header "
+    "hgroup hr li main menu nav ol optgroup option p pre section table "
+    "caption colgroup col thead tbody tfoot tr td th ul br".split())
+
+_JS_TYPES = {"", "text/javascript", "application/javascript", "module",
+             "text/ecmascript", "application/ecmascript", "javascript"}
+_JS_WORD = re.compile(r'\.?[\w$\\\u0080-\uffff]+')
+_JS_STRING = {q: re.compile(f'{q}(?:[^{q}\\\\\\n]|\\\\[\\s\\S])*') for q in '"\''}
+_JS_TEMPLATE = re.compile(r'(?:[^`\\$]|\\[\s\S]|\$(?!\{))*')
+_JS_REGEX = re.compile(r'/(?![*/])(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[\w$]*')
+# Operators and brackets that need no lookahead, taken as one run
+_JS_PUNCTUATION = re.compile(r'[^\s\w$\\\u0080-\uffff/\'"`{}.]+')
+_JS_LINE_END = re.compile(r'[\n\r\u2028\u2029]')
+_JS_NEWLINES = frozenset('\n\r\u2028\u2029')
+# A `/` after these words starts a regex literal, not a division
+_JS_EXPRESSION_KEYWORDS = frozenset(
+    "return typeof instanceof in of new delete void throw case do else "
+    "yield await".split())
+# Joining two lines never changes the program when the first ends with
+# one of these, or the second starts with one of the others
+_JS_OPEN_ENDS = frozenset('{([,;:=?&|!<>*%^~')
+_JS_CONTINUATIONS = frozenset('})],;?:=*%&|^<>.')
+
+_CSS_WORD = re.compile(r'[^\s\'"/{};:,>()!]+')
+_CSS_URL = re.compile(r'url\(\s*(?![\'"])[^)]*\)', re.I)
+_CSS_TIGHT_AFTER = frozenset('{};,>:(!')
+_CSS_TIGHT_BEFORE = frozenset('{};,>)!')
+
+
+def _is_word(char):
+    return char.isalnum() or char in '$_\\' or char > '\x7f'
+
+
+class Minifier:
+    """
+    Incremental minifier: feed(text) returns the output that is settled
+    so far, flush() the rest. keep_whitespace=True only drops comments.
+    """
+
+    def __init__(self, keep_whitespace=False):
+        self.keep_whitespace = keep_whitespace
+        self.state = HTML
+        self._close = None           # closing-tag pattern for SCRIPT/STYLE/RAW
+        self._buf = ''
+        self._out = []
+        self._last = ''              # last character written
+        self._last_tag = None        # name of the tag just written (None after text)
+        self._pending = False        # whitespace or a comment sits before the next token
+        self._space = ''             # ...and its raw text
+        self._space_state = HTML
+        self._semicolon = False      # CSS ';' held back in case '}' follows
+        self._js_last = ''           # last significant JS token
+        self._js_before = ''         # the one before it
+        self._templates = []         # brace depth inside each open `${`
+
+    # ── public API ─────────────────────────────────────────────────
+
+    def feed(self, text):
+        self._buf += text
+        self._run(final=False)
+        return self._take()
+
+    def flush(self):
+        self._run(final=True)
+        self._leave_content()
+        if self._pending and self.keep_whitespace:
+            self._out.append(self._space)
+        self._pending = False
+        self._space = ''
+        return self._take()
+
+    def _take(self):
+        out = ''.join(self._out)
+        self._out = []
+        return out
+
+    # ── output ─────────────────────────────────────────────────────
+
+    def _pend(self, space, state):
+        self._pending = True
+        self._space += space
+        self._space_state = state
+
+    def _emit(self, token):
+        if self._semicolon:
+            self._semicolon = False
+            if token != '}':
+                self._out.append(';')
+        if self._pending:
+            separator = self._separator(token)
+            if separator:
+                self._out.append(separator)
+            self._pending = False
+            self._space = ''
+        self._out.append(token)
+        self._last = token[-1]
+        self._last_tag = None
+
+    def _separator(self, token):
+        """What the pending whitespace/comment becomes before `token`"""
+        last, space, nxt = self._last, self._space, token[0]
+        if self.keep_whitespace and (space or self._space_state == HTML):
+            return space
+        if not last:
+            return ''
+        if self._space_state == HTML:
+            if last == '>' and nxt == '<' and self._last_tag in _BLOCK_TAGS:
+                following = _TAG_OPEN.match(token)
+                if following is None or following.group(2).lower() in _BLOCK_TAGS:
+                    return ''
+            return ' '
+        if self._space_state == STYLE:
+            return '' if last in _CSS_TIGHT_AFTER or nxt in _CSS_TIGHT_BEFORE else ' '
+
+        needed = (_is_word(last) and _is_word(nxt)) or \
+            (last == nxt and last in '+-') or \
+            (last == '/' and nxt in '/*') or \
+            (last.isdigit() and nxt == '.')
+        if not _JS_NEWLINES.isdisjoint(space):
+            numeric = nxt == '.' and token[1:2].isdigit()
+            if not (last in _JS_OPEN_ENDS or (nxt in _JS_CONTINUATIONS and not numeric)):
+                return '\n'
+        return ' ' if needed else ''
+
+    def _verbatim(self, text):
+        if text:
+            self._pending = False
+            self._space = ''
+            self._out.append(text)
+            self._last = text[-1]
+
+    # ── driver ─────────────────────────────────────────────────────
+
+    def _run(self, final):
+        buf = self._buf
+        pos = 0
+        while pos < len(buf):
+            state = self.state
+            if state == HTML:
+                new = self._html(buf, pos, final)
+            else:
+                new = self._content(buf, pos, final)
+            if new == pos and self.state == state:
+                break               # waiting for more text
+            pos = new
+        self._buf = buf[pos:]
+
+    def _enter(self, state, close):
+        self.state = state
+        self._close = close
+        self._pending = False
+        self._space = ''
+        self._js_last = self._js_before = ''
+        self._templates = []
+
+    def _leave_content(self):
+        if self.state != HTML:
+            if self._semicolon:
+                self._out.append(';')
+                self._last = ';'
+            self._semicolon = False
+            if not self.keep_whitespace:
+                self._pending = False
+                self._space = ''
+        self.state = HTML
+        self._close = None
+
+    # ── HTML ───────────────────────────────────────────────────────
+
+    def _html(self, buf, pos, final):
+        n = len(buf)
+        safe = n if final else n - LOOKAHEAD
+        while pos < safe:
+            char = buf[pos]
+            if char == '<':
+                if buf.startswith('<!--', pos):
+                    end = buf.find('-->', pos + 4)
+                    if end < 0:
+                        if not final:
+                            return pos
+                        end = n - 3
+                    pos = end + 3
+                    continue
+                match = _TAG_OPEN.match(buf, pos)
+                if match:
+                    end = self._tag(buf, pos, match, final)
+                    if end is None:
+                        return pos
+                    pos = end
+                    if self.state != HTML:
+                        return pos
+                    continue
+                if buf.startswith(('<!', '<?'), pos):
+                    end = buf.find('>', pos)
+                    if end < 0:
+                        if not final:
+                            return pos
+                        end = n - 1
+                    decl = buf[pos:end + 1]
+                    self._emit(decl if self.keep_whitespace else ' '.join(decl.split()))
+                    # A doctype or processing instruction renders nothing
+                    self._last_tag = "html"
+                    pos = end + 1
+                    continue
+                self._emit('<')
+                pos += 1
+            elif char.isspace():
+                match = _SPACE.match(buf, pos)
+                self._pend(match.group(), HTML)
+                pos = match.end()
+            else:
+                match = _HTML_TEXT.match(buf, pos)
+                self._emit(match.group())
+                pos = match.end()
+        return pos
+
+    def _tag(self, buf, pos, match, final):
+        """One start/end tag; None if it isn't complete in the buffer yet"""
+        parts = [match.group()]
+        end = match.end()
+        space = False
+        while True:
+            part = _TAG_PART.match(buf, end)
+            if part is None:
+                if not final:
+                    return None
+                parts.append(buf[end:])
+                end = len(buf)
+                break
+            token = part.group()
+            end = part.end()
+            if token[0].isspace():
+                space = True
+                continue
+            # Attributes need one space between them; none before > or
+            # around =, but keep it before /> (<img src=a.png /> ≠ a.png/)
+            if space and token != '>' and token[0] != '=' and parts[-1][-1] != '=':
+                parts.append(' ')
+            space = False
+            parts.append(token)
+            if token in ('>', '/>'):
+                break
+
+        tag = buf[pos:end] if self.keep_whitespace else ''.join(parts)
+        self._emit(tag)
+
+        name = match.group(2).lower()
+        self._last_tag = name
+        if not match.group(1) and name in _CLOSE:
+            if name == "script":
+                kind = _SCRIPT_TYPE.search(tag)
+                js = (kind.group(1).lower() if kind else '') in _JS_TYPES
+                self._enter(SCRIPT if js else RAW, _CLOSE[name])
+            elif name == "style":
+                self._enter(STYLE, _CLOSE[name])
+            else:
+                self._enter(RAW, _CLOSE[name])
+        return end
+
+    # ── <script>, <style>, raw text ────────────────────────────────
+
+    def _content(self, buf, pos, final):
+        """Lex up to the closing tag (or as far as is safe without it)"""
+        close = self._close.search(buf, pos)
+        limit = close.start() if close else len(buf)
+        complete = close is not None or final
+
+        if self.state == RAW:
+            end = limit if complete else max(pos, limit - LOOKAHEAD)
+            self._verbatim(buf[pos:end])
+            pos = end
+        elif self.state == SCRIPT:
+            pos = self._js(buf, pos, limit, complete)
+        else:
+            pos = self._css(buf, pos, limit, complete)
+
+        if complete and pos >= limit:
+            self._leave_content()
+        return pos
+
+    def _regex_allowed(self):
+        last = self._js_last
+        if not last:
+            return True
+        if last in ('+', '-') and self._js_before == last:
+            return False                # x++ / y
+        if len(last) == 1 and not _is_word(last):
+            return last not in ')]}\'"`'
+        return last in _JS_EXPRESSION_KEYWORDS
+
+    def _js_token(self, token, kind=None):
+        self._emit(token)
+        self._js_before = self._js_last
+        self._js_last = kind or token
+
+    def _js(self, buf, pos, limit, complete):
+        safe = limit if complete else limit - LOOKAHEAD
+        while pos < safe:
+            char = buf[pos]
+            if char.isspace():
+                match = _SPACE.match(buf, pos, limit)
+                self._pend(match.group(), SCRIPT)
+                pos = match.end()
+            elif char == '/' and buf.startswith('//', pos):
+                end = _JS_LINE_END.search(buf, pos, limit)
+                if end is None and not complete:
+                    return pos
+                self._pend('', SCRIPT)
+                pos = end.start() if end else limit
+            elif char == '/' and buf.startswith('/*', pos):
+                end = buf.find('*/', pos + 2, limit)
+                if end < 0:
+                    if not complete:
+                        return pos
+                    end = limit - 2
+                comment = buf[pos:end + 2]
+                self._pend('\n' if not _JS_NEWLINES.isdisjoint(comment) else '', SCRIPT)
+                pos = end + 2
+            elif char == '/' and self._regex_allowed():
+                match = _JS_REGEX.match(buf, pos, limit)
+                if match is None:
+                    if not complete and _JS_LINE_END.search(buf, pos, limit) is None:
+                        return pos
+                    self._js_token('/')
+                    pos += 1
+                elif match.end() >= safe and not complete:
+                    return pos
+                else:
+                    self._js_token(match.group(), '/re/')
+                    pos = match.end()
+            elif char in '"\'':
+                end = _JS_STRING[char].match(buf, pos, limit).end()
+                if end < limit and buf[end] == char:
+                    end += 1
+                elif end >= safe and not complete:
+                    return pos
+                self._js_token(buf[pos:end], char)
+                pos = end
+            elif char == '`':
+                end = self._template(buf, pos, pos + 1, limit, safe, complete)
+                if end is None:
+                    return pos
+                pos = end
+            elif char == '}' and self._templates and self._templates[-1] == 0:
+                self._templates.pop()
+                end = self._template(buf, pos, pos + 1, limit, safe, complete)
+                if end is None:
+                    self._templates.append(0)
+                    return pos
+                pos = end
+            elif _is_word(char) or char == '.' and pos + 1 < limit and _is_word(buf[pos + 1]):
+                match = _JS_WORD.match(buf, pos, limit)
+                if match.end() >= safe and not complete:
+                    return pos
+                self._js_token(match.group())
+                pos = match.end()
+            elif char not in '{}./':
+                match = _JS_PUNCTUATION.match(buf, pos, limit)
+                run = match.group()
+                self._emit(run)
+                self._js_before = run[-2] if len(run) > 1 else self._js_last
+                self._js_last = run[-1]
+                pos = match.end()
+            else:
+                if self._templates:
+                    if char == '{':
+                        self._templates[-1] += 1
+                    elif char == '}':
+                        self._templates[-1] -= 1
+                self._js_token(char)
+                pos += 1
+        return pos
+
+    def _template(self, buf, start, body, limit, safe, complete):
+        """A template literal piece from `start` (` or }) to ` or ${"""
+        end = _JS_TEMPLATE.match(buf, body, limit).end()
+        if end >= safe and not complete:
+            return None
+        if buf.startswith('${', end):
+            end += 2
+            self._templates.append(0)
+            self._js_token(buf[start:end], '(')
+        else:
+            end = min(end + 1, limit)
+            self._js_token(buf[start:end], '`')
+        return end
+
+    def _css(self, buf, pos, limit, complete):
+        safe = limit if complete else limit - LOOKAHEAD
+        while pos < safe:
+            char = buf[pos]
+            if char.isspace():
+                match = _SPACE.match(buf, pos, limit)
+                self._pend(match.group(), STYLE)
+                pos = match.end()
+            elif char == '/' and buf.startswith('/*', pos):
+                end = buf.find('*/', pos + 2, limit)
+                if end < 0:
+                    if not complete:
+                        return pos
+                    end = limit - 2
+                self._pend('', STYLE)
+                pos = end + 2
+            elif char in '"\'':
+                end = _JS_STRING[char].match(buf, pos, limit).end()
+                if end < limit and buf[end] == char:
+                    end += 1
+                elif end >= safe and not complete:
+                    return pos
+                self._emit(buf[pos:end])
+                pos = end
+            elif char == ';' and not self.keep_whitespace:
+                if self._semicolon:
+                    self._emit(';')
+                else:
+                    self._emit_semicolon()
+                pos += 1
+            elif char in '{}:,>()!/;':
+                self._emit(char)
+                pos += 1
+            else:
+                match = (_CSS_URL.match(buf, pos, limit) if char in 'uU' else None) or \
+                    _CSS_WORD.match(buf, pos, limit)
+                if match.end() >= safe and not complete:
+                    return pos
+                self._emit(match.group())
+                pos = match.end()
+        return pos
+
+    def _emit_semicolon(self):
+        """Write everything before a CSS ';' and hold the ';' itself back"""
+        if self._pending:
+            separator = self._separator(';')
+            if separator:
+                self._out.append(separator)
+            self._pending = False
+            self._space = ''
+        self._semicolon = True
+        self._last = ';'
+
+
+def minify(text, keep_whitespace=False):
+    """Minify a whole HTML document (see Minifier)"""
+    minifier = Minifier(keep_whitespace)
+    return minifier.feed(text) + minifier.flush()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════╗
+║  EUG STATIC VARIANTS - Pre-Compressed HTML for the Web Server   ║
+║  Minify once, compress once at maximum effort, serve forever    ║
+╚══════════════════════════════════════════════════════════════════╝
+
+Browsers get the HTML, not the .py/.eug wrappers, so every batch can
+also write the minified page plus pre-compressed copies next to it:
+
+    compressed_static/index.html        (minified, identity)
+    compressed_static/index.html.gz     (gzip, best of several zlib strategies)
+    compressed_static/index.html.br     (brotli q11, if `brotli` is installed)
+    compressed_static/index.html.zst    (zstd max level, Python 3.14+)
+    compressed_static/static-manifest.json
+
+A variant is only kept when it is smaller than the page it encodes.
+nginx `gzip_static`/`brotli_static` and Caddy `precompressed` pick the
+files up by name; anything else can read the manifest and call
+choose_variant() with the request's Accept-Encoding, so nothing is ever
+compressed at request time.
+"""
+
+import os
+import json
+import zlib
+import hashlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from eug_cache import atomic_write_text, file_hash
+from eug_minify import minify
+
+STATIC_DIR = "compressed_static"
+MANIFEST_NAME = "static-manifest.json"
+MANIFEST_VERSION = 1
+CONTENT_TYPE = "text/html; charset=utf-8"
+
+
+def _gzip(data):
+    """Smallest gzip member over the zlib strategies worth trying"""
+    best = None
+    for strategy in (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED):
+        # wbits 31 = 32 KB window + gzip wrapper with a zero mtime, so
+        # rebuilding an unchanged page gives byte-identical output
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 31, 9, strategy)
+        out = compressor.compress(data) + compressor.flush()
+        if best is None or len(out) < len(best):
+            best = out
+    return best
+
+
+# Content-Encoding → (file suffix, encoder), in preference order when
+# two variants come out the same size
+ENCODINGS = {"gzip": (".gz", _gzip)}
+
+try:
+    import brotli
+    ENCODINGS["br"] = (".br", lambda data: brotli.compress(
+        data, mode=brotli.MODE_TEXT, quality=11, lgwin=24))
+except ImportError:
+    pass
+
+try:
+    from compression import zstd
+    ENCODINGS["zstd"] = (".zst", lambda data: zstd.compress(
+        data, level=zstd.CompressionParameter.compression_level.bounds()[1]))
+except ImportError:
+    pass
+
+
+def static_path(html_file):
+    """Where html_file lands under the static output directory"""
+    path = Path(html_file)
+    if path.is_absolute() or '..' in path.parts:
+        return Path(path.name)
+    return path
+
+
+def encode_variants(data):
+    """{encoding: bytes} for every encoding that beats the raw page"""
+    variants = {}
+    for encoding, (suffix, encode) in ENCODINGS.items():
+        encoded = encode(data)
+        if len(encoded) < len(data):
+            variants[encoding] = encoded
+    return variants
+
+
+def _build_page(html_file, output_dir, source_hash):
+    """Minify one page and write it plus its variants; returns its manifest entry"""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        data = minify(f.read()).encode('utf-8')
+    relative = static_path(html_file)
+    target = Path(output_dir) / relative
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(data)
+
+    entry = {
+        "path": relative.as_posix(),
+        "source_hash": source_hash,
+        "size": len(data),
+        "etag": hashlib.sha256(data).hexdigest()[:32],
+        "content_type": CONTENT_TYPE,
+        "variants": {},
+    }
+    for encoding, encoded in encode_variants(data).items():
+        variant = target.with_name(target.name + ENCODINGS[encoding][0])
+        variant.write_bytes(encoded)
+        entry["variants"][encoding] = {"path": variant.relative_to(output_dir).as_posix(),
+                                       "size": len(encoded)}
+    # Drop variants a previous build wrote but this one didn't beat
+    for encoding, (suffix, _) in ENCODINGS.items():
+        if encoding not in entry["variants"]:
+            target.with_name(target.name + suffix).unlink(missing_ok=True)
+    return entry
+
+
+def load_manifest(output_dir=STATIC_DIR):
+    try:
+        with open(Path(output_dir) / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "encodings": [], "files": {}}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "encodings": [], "files": {}}
+    return manifest
+
+
+def _current(output_dir, entry, source_hash, encodings):
+    """True if a manifest entry still describes what's on disk for this input"""
+    if entry is None or entry["source_hash"] != source_hash or entry["encodings"] != encodings:
+        return False
+    return all((Path(output_dir) / v["path"]).is_file() for v in entry["variants"].values())
+
+
+def build_static(html_files, output_dir=STATIC_DIR, workers=None, cache=None, force=False):
+    """
+    Write the minified page and its pre-compressed variants for every
+    input under output_dir, plus the manifest. Pages whose source hash
+    (and set of available encoders) matches the manifest are skipped
+    unless force=True. Returns (manifest, number of pages rebuilt).
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    encodings = list(ENCODINGS)
+    hash_input = cache.input_hash if cache is not None else file_hash
+
+    files = {}
+    pending = []
+    for html_file in html_files:
+        key = static_path(html_file).as_posix()
+        source_hash = hash_input(html_file)
+        entry = manifest["files"].get(key)
+        if not force and _current(output_dir, entry, source_hash, encodings):
+            files[key] = entry
+        else:
+            pending.append((key, html_file, source_hash))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pending) < 2:
+        built = [_build_page(html_file, output_dir, source_hash)
+                 for _, html_file, source_hash in pending]
+    else:
+        with ProcessPoolExecutor(min(workers, len(pending))) as pool:
+            built = list(pool.map(_build_page, [p[1] for p in pending],
+                                  [output_dir] * len(pending), [p[2] for p in pending]))
+    for (key, _, _), entry in zip(pending, built):
+        entry["encodings"] = encodings
+        files[key] = entry
+
+    manifest = {"version": MANIFEST_VERSION, "encodings": encodings,
+                "files": dict(sorted(files.items()))}
+    atomic_write_text(output_dir / MANIFEST_NAME, json.dumps(manifest, indent=1))
+    if cache is not None:
+        cache.manifest.save()
+    return manifest, len(pending)
+
+
+def choose_variant(entry, accept_encoding):
+    """
+    The file to serve for a manifest entry given a request's
+    Accept-Encoding header: (relative path, Content-Encoding or None).
+    Picks the smallest variant the client accepts (q > 0), else the
+    minified page itself.
+    """
+    accepted = {}
+    for part in (accept_encoding or '').split(','):
+        name, _, params = part.strip().partition(';')
+        q = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name:
+            accepted[name.lower()] = q
+
+    def allowed(encoding):
+        return accepted.get(encoding, accepted.get('*', 0.0)) > 0
+
+    order = list(ENCODINGS)
+    options = [(variant["size"], order.index(encoding) if encoding in order else len(order),
+                encoding, variant["path"])
+               for encoding, variant in entry["variants"].items() if allowed(encoding)]
+    if not options:
+        return entry["path"], None
+    *_, encoding, path = min(options)
+    return path, encoding
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════╗
+║  EUG TRACE - Per-Stage Timing Spans for the Compression Pipeline ║
+║  Where the time and the bytes go, one structured record a stage  ║
+╚══════════════════════════════════════════════════════════════════╝
+
+Each stage of a compress call (read, assign, compress, optimize,
+validate, sign, xor, encode, write) closes as one flat record:
+
+    {"file": "index.html", "specialist_id": 1, "pid": 4242,
+     "stage": "compress", "start": 1234.5678, "seconds": 0.0123,
+     "bytes_in": 38113, "bytes_out": 30242}
+
+`start` is time.perf_counter() (monotonic, and system-wide on Linux, so
+records from worker processes line up). Records go to a sink, anything
+with an emit(record) method: MemorySink keeps them in a list,
+JsonlSink appends one JSON object per line to a file.
+stage_summary() folds any pile of records into a one-line breakdown.
+"""
+
+import json
+import time
+import threading
+import contextlib
+
+
+class Trace:
+    """
+    The spans of one compress call. fields are copied into every record
+    as it closes (so setting fields["specialist_id"] mid-call labels
+    the stage that chose it and everything after); records keeps them
+    all, and each is also emitted to sink, if any.
+    """
+
+    def __init__(self, sink=None, **fields):
+        self.sink = sink
+        self.fields = fields
+        self.records = []
+
+    @contextlib.contextmanager
+    def span(self, stage, bytes_in=None):
+        """Time the block as stage; set the yielded dict's "bytes_out" (or any extra key) inside it"""
+        extra = {"bytes_out": None}
+        start = time.perf_counter()
+        try:
+            yield extra
+        finally:
+            seconds = time.perf_counter() - start
+            record = {**self.fields, "stage": stage, "start": round(start, 6),
+                      "seconds": round(seconds, 6), "bytes_in": bytes_in, **extra}
+            self.records.append(record)
+            if self.sink is not None:
+                self.sink.emit(record)
+
+
+class MemorySink:
+    """Collects records in a list; safe to share between threads"""
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        with self._lock:
+            self.records.append(record)
+
+
+class JsonlSink:
+    """Appends each record to path as one line of compact JSON; safe to share between threads"""
+
+    def __init__(self, path):
+        self.path = path
+        # Line-buffered: every record is on disk once emit() returns
+        self._file = open(path, 'a', encoding='utf-8', buffering=1)
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        line = json.dumps(record, separators=(',', ':')) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def stage_summary(records):
+    """One-line seconds-per-stage breakdown, stages in the order they first ran"""
+    if not records:
+        return "Stages: no spans"
+    totals = {}
+    for record in records:
+        totals[record["stage"]] = totals.get(record["stage"], 0.0) + record["seconds"]
+    total = sum(totals.values())
+    files = len({record.get("file") for record in records})
+    parts = [f"{stage} {seconds:.2f}s ({seconds / max(total, 1e-9):.0%})"
+             for stage, seconds in totals.items()]
+    return f"Stages over {files} files, {total:.2f}s: " + ", ".join(parts)
@@ -7,7 +7,8 @@
 
 ARCHITECTURE:
 • Meta-AI Orchestrator: Distributes work to specialized AIs
-• 12 Compression AIs: Different strategies per file type
+• 12 Compression AIs: Different strategies per file type (JSON, SVG
+  and Markdown with their own codecs, see eug_formats)
 • 6 Validation AIs: Quality assurance & integrity
 • 3 Optimization AIs: Speed, size, and quality balance
 • 1 NFT Minting AI: Crypto-signing and blockchain prep
@@ -20,40 +21,260 @@ EACH AI HAS:
 ✓ Learning from results
 """
 
+import io
 import os
+import sys
+import re
 import json
+import time
+import heapq
+import random
 import base64
 import hashlib
+import itertools
+import contextlib
 from pathlib import Path
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, deque
+from concurrent.futures import (ThreadPoolExecutor, ProcessPoolExecutor,
+                                as_completed, wait, FIRST_COMPLETED, TimeoutError)
 import threading
 
+from eug_codec import xor_bytes, install_runtime, PayloadDecoder, digest_payload
+from eug_minify import minify
+from eug_features import ContentFeatures
+from eug_formats import FORMATS
+from eug_trace import Trace, JsonlSink, stage_summary
+from eug_cache import CACHE_DIR, atomic_write_text
+from eug_log import get_logger, progress, current_config, configure_worker, configure, cli_config
+
+log = get_logger("multi_ai")
+
+# Below INLINE_MAX_SIZE the specialists finish faster than a pool can
+# dispatch them (~0.25 ms for the nine), so they run in the calling
+# thread. Below PROCESS_MIN_SIZE, shipping the content to a worker
+# process costs more than the GIL contention it avoids, so CPU-bound
+# specialists run on threads like everyone else.
+INLINE_MAX_SIZE = 64 * 1024
+PROCESS_MIN_SIZE = 256 * 1024
+
+OUTPUT_DIR = "compressed_py_multi_ai"
+SCAN_CHUNK_SIZE = 1 << 20  # schedule() classifies files without holding them whole
+
+# Race mode: how many specialist/optimizer pairs run, and for how long
+RACE_TOP_K = 4
+RACE_BUDGET = 2.0
+
+# Validators whose estimated cost on the content is under this run
+# inline, cheapest first, before anything is handed to a pool
+CHEAP_VALIDATION_MS = 1.0
+# Learned validation failure rate at which the fallback compression
+# starts alongside the specialist instead of after it fails
+SPECULATE_FAILURE_RATE = 0.5
+
+# Relative cost per byte by specialist, for scheduling: script-heavy
+# pages spend more time in the minifier's JS states (~7% on the corpus)
+SPECIALIST_COST = {
+    "threejs_specialist": 1.1,
+    "webgl_specialist": 1.1,
+    "js_specialist": 1.1,
+}
+
+# Learned per-specialist statistics, by content signature:
+# {signature: {specialist: [files, bytes in, bytes saved, CPU seconds,
+#                           validation failures]}}
+PERFORMANCE_FILE = os.path.join(CACHE_DIR, "ai_performance.json")
+PERFORMANCE_VERSION = 3  # 3: the .json/.svg/.md specialists got their own codecs
+PERFORMANCE_WINDOW = 256  # recent runs kept in each CompressionAI.performance_history
+EXPLORE_RATE = 0.1
+# Runs a strategy needs for a kind of content before it stops being
+# explored; also the weight, in average files, of the kind-wide prior a
+# signature's own measurements are blended with
+PRIOR_FILES = 3
+
 class MetaAIOrchestrator:
     """
     Master AI that coordinates all specialist AIs
     Distributes tasks based on file type and AI availability
+    
+    Built once and kept: construction is silent (describe() has the
+    banner), and compress_with_multi_ai / assign_ai may be called from
+    any number of threads at once. schedule() and run_queue() drive one
+    shared queue and belong to a single thread.
     """
-    def __init__(self):
+    def __init__(self, max_workers=None, history_path=PERFORMANCE_FILE, explore=EXPLORE_RATE,
+                 seed=None, sink=None):
         self.version = "2.0.0 - Multi-AI System"
         self.author = "eugeNEOusXR"
         self.xor_key = b"eug"
         
+        # Specialists fan out over two lazily created, reused pools:
+        # threads for the cheap checks, processes for the regex/hash-heavy
+        # ones so they aren't serialized behind the GIL
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._threads = None
+        self._processes = None
+        self._pool_lock = threading.Lock()
+        # Output directories the decoder runtime has been copied into
+        self._runtime_dirs = set()
+        self._runtime_lock = threading.Lock()
+        
         # Initialize all specialist AIs
         self.compression_ais = self._initialize_compression_ais()
         self.validation_ais = self._initialize_validation_ais()
+        # Cheapest first (roster order among equals): the first failure
+        # stops the run, so the round-trip only happens for output that
+        # already passed everything else
+        self.validation_order = sorted(self.validation_ais,
+                                       key=lambda name: self.validation_ais[name].cost)
         self.optimization_ais = self._initialize_optimization_ais()
         self.nft_ai = NFTMintingAI()
         
+        # Heap of (-estimated cost, sequence, file path, specialist key)
+        # waiting for run_queue; results collects what it has finished
         self.task_queue = []
         self.results = []
-        self.ai_performance = {}
+        self._sequence = itertools.count()
         
-        print("🧠 Meta-AI Orchestrator initialized")
-        print(f"   Compression AIs: {len(self.compression_ais)}")
-        print(f"   Validation AIs: {len(self.validation_ais)}")
-        print(f"   Optimization AIs: {len(self.optimization_ais)}")
-        print(f"   Total AI workforce: {len(self.compression_ais) + len(self.validation_ais) + len(self.optimization_ais) + 1}")
+        # What each specialist achieved per content signature, persisted
+        # at history_path (None: learn in memory only). assign_ai
+        # exploits the best measured specialist and explores another
+        # with probability `explore`.
+        self.history_path = history_path
+        self.explore = explore
+        self._random = random.Random(seed)
+        self._stats_lock = threading.Lock()
+        self.ai_performance = self.load_performance()
+        
+        # Per-stage timing spans (eug_trace) of every compress call go to
+        # sink.emit(); each result also carries its own under "spans"
+        self.sink = sink
+    
+    def describe(self):
+        """The orchestrator's banner: its AI roster and what it has learned"""
+        lines = [
+            "🧠 Meta-AI Orchestrator initialized",
+            f"   Compression AIs: {len(self.compression_ais)}",
+            f"   Validation AIs: {len(self.validation_ais)}",
+            f"   Optimization AIs: {len(self.optimization_ais)}",
+            f"   Total AI workforce: {len(self.compression_ais) + len(self.validation_ais) + len(self.optimization_ais) + 1}",
+        ]
+        with self._stats_lock:
+            if self.ai_performance:
+                lines.append(f"   Learned from: {sum(s[0] for stats in self.ai_performance.values() for s in stats.values())} "
+                             f"runs over {len(self.ai_performance)} content signatures")
+        return "\n".join(lines)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def close(self):
+        """Shut down the worker pools (queued specialist work is dropped) and save what was learned"""
+        with self._pool_lock:
+            for pool in (self._threads, self._processes):
+                if pool is not None:
+                    pool.shutdown(wait=True, cancel_futures=True)
+            self._threads = self._processes = None
+        self.save_performance()
+    
+    def load_performance(self):
+        if self.history_path is None:
+            return {}
+        try:
+            with open(self.history_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if saved.get("version") != PERFORMANCE_VERSION:
+            return {}
+        return saved["signatures"]
+    
+    def save_performance(self):
+        if self.history_path is None or not self.ai_performance:
+            return
+        Path(self.history_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._stats_lock:
+            saved = {"version": PERFORMANCE_VERSION, "signatures": self.ai_performance}
+            text = json.dumps(saved, separators=(',', ':'))
+        atomic_write_text(self.history_path, text)
+    
+    def record_performance(self, result):
+        """
+        Fold one compress_with_multi_ai result into ai_performance and
+        the specialist's performance_history. Output that failed
+        validation counts as saving nothing, and as a failure.
+        """
+        saved = result["saved"] if result["validations_passed"] else 0
+        with self._stats_lock:
+            stats = (self.ai_performance.setdefault(result["signature"], {})
+                     .setdefault(result["specialist"], [0, 0, 0, 0.0, 0]))
+            stats[0] += 1
+            stats[1] += result["original_size"]
+            stats[2] += saved
+            stats[3] = round(stats[3] + result["specialist_seconds"], 6)
+            stats[4] += not result["validations_passed"]
+        self.compression_ais[result["specialist"]].performance_history.append({
+            "signature": result["signature"],
+            "bytes": result["original_size"],
+            "saved": saved,
+            "seconds": result["specialist_seconds"],
+        })
+    
+    @staticmethod
+    def performance_score(stats, prior=None):
+        """
+        Bytes saved per CPU-second in MB/s (compression ratio ×
+        throughput), shrunk toward prior stats when given, as if
+        PRIOR_FILES of the prior's average files had been added
+        """
+        files, size, saved, seconds = stats[:4]
+        if prior is not None and prior[0]:
+            weight = PRIOR_FILES / prior[0]
+            saved += prior[2] * weight
+            seconds += prior[3] * weight
+        return saved / max(seconds, 1e-9) / 1e6
+    
+    def failure_rate(self, signature, specialist):
+        """
+        Share of runs at signature whose output failed validation, over
+        every specialist with the same strategy (they produce the same
+        output); None before anything has been measured
+        """
+        strategy = self.compression_ais[specialist].strategy
+        files = failures = 0
+        with self._stats_lock:
+            for key, stats in self.ai_performance.get(signature, {}).items():
+                if self.compression_ais[key].strategy == strategy:
+                    files += stats[0]
+                    failures += stats[4]
+        return failures / files if files else None
+    
+    def _output_dir(self):
+        """OUTPUT_DIR, created with the decoder runtime in it the first time it's needed"""
+        output_dir = Path(OUTPUT_DIR)
+        key = os.path.abspath(output_dir)
+        if key not in self._runtime_dirs:
+            with self._runtime_lock:
+                if key not in self._runtime_dirs:
+                    output_dir.mkdir(exist_ok=True)
+                    install_runtime(output_dir)
+                    self._runtime_dirs.add(key)
+        return output_dir
+    
+    def _executor(self, ai, size):
+        """Pool for one specialist's task on content of the given size"""
+        with self._pool_lock:
+            if ai.cpu_bound and size >= PROCESS_MIN_SIZE and self.max_workers > 1:
+                if self._processes is None:
+                    self._processes = ProcessPoolExecutor(self.max_workers)
+                return self._processes
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(self.max_workers,
+                                                   thread_name_prefix="eug-ai")
+            return self._threads
     
     def _initialize_compression_ais(self):
         """Initialize 12 specialized compression AIs"""
@@ -86,17 +307,20 @@ class MetaAIOrchestrator:
             "svg_specialist": CompressionAI(
                 id=6, name="SVG Vector Compressor",
                 specialty="Vector graphics optimization",
-                personality_traits={"geometric": 0.9, "precision": 0.85}
+                personality_traits={"geometric": 0.9, "precision": 0.85},
+                format="svg"
             ),
             "json_specialist": CompressionAI(
                 id=7, name="JSON Data Minimizer",
                 specialty="Data structure compression",
-                personality_traits={"structured": 0.9, "efficiency": 0.85}
+                personality_traits={"structured": 0.9, "efficiency": 0.85},
+                format="json"
             ),
             "markdown_specialist": CompressionAI(
                 id=8, name="Markdown Content Optimizer",
                 specialty="Text content compression",
-                personality_traits={"linguistic": 0.85, "clarity": 0.9}
+                personality_traits={"linguistic": 0.85, "clarity": 0.9},
+                format="markdown"
             ),
             "image_specialist": CompressionAI(
                 id=9, name="Image Asset Optimizer",
@@ -126,32 +350,38 @@ class MetaAIOrchestrator:
             "integrity_checker": ValidationAI(
                 id=82, name="Career Coach (Integrity Validator)",
                 specialty="Hash verification & data integrity",
-                personality_traits={"thoroughness": 0.95, "reliability": 0.9}
+                personality_traits={"thoroughness": 0.95, "reliability": 0.9},
+                kind="integrity", cost=0.0
             ),
             "syntax_validator": ValidationAI(
                 id=83, name="Code Syntax Validator",
                 specialty="Code structure validation",
-                personality_traits={"precision": 0.95, "detail": 0.9}
+                personality_traits={"precision": 0.95, "detail": 0.9},
+                kind="syntax", cost=3.0
             ),
             "performance_analyzer": ValidationAI(
                 id=84, name="Performance Analyst",
                 specialty="Compression ratio analysis",
-                personality_traits={"analytical": 0.9, "metrics": 0.95}
+                personality_traits={"analytical": 0.9, "metrics": 0.95},
+                kind="performance", cost=0.0
             ),
             "security_auditor": ValidationAI(
                 id=85, name="Security Auditor",
                 specialty="Crypto-signing verification",
-                personality_traits={"security": 0.95, "vigilance": 0.9}
+                personality_traits={"security": 0.95, "vigilance": 0.9},
+                kind="security", cost=1.0
             ),
             "decompression_tester": ValidationAI(
                 id=86, name="Decompression Tester",
                 specialty="Round-trip validation",
-                personality_traits={"testing": 0.9, "accuracy": 0.95}
+                personality_traits={"testing": 0.9, "accuracy": 0.95},
+                kind="round-trip", cost=17.0
             ),
             "quality_assurance": ValidationAI(
                 id=87, name="Quality Assurance Lead",
                 specialty="Overall quality metrics",
-                personality_traits={"quality": 0.95, "standards": 0.9}
+                personality_traits={"quality": 0.95, "standards": 0.9},
+                kind="quality", cost=0.0
             )
         }
     
@@ -161,155 +391,332 @@ class MetaAIOrchestrator:
             "speed_optimizer": OptimizationAI(
                 id=67, name="Financial Advisor (Speed Optimizer)",
                 specialty="Compression speed optimization",
-                personality_traits={"efficiency": 0.95, "speed": 0.9}
+                personality_traits={"efficiency": 0.95, "speed": 0.9},
+                kind="speed"
             ),
             "size_optimizer": OptimizationAI(
                 id=68, name="Size Reduction Specialist",
                 specialty="Maximum compression ratio",
-                personality_traits={"compression": 0.95, "minimalism": 0.9}
+                personality_traits={"compression": 0.95, "minimalism": 0.9},
+                kind="size"
             ),
             "quality_optimizer": OptimizationAI(
                 id=69, name="Quality Preservation Expert",
                 specialty="Lossless compression balance",
-                personality_traits={"quality": 0.95, "balance": 0.9}
+                personality_traits={"quality": 0.95, "balance": 0.9},
+                kind="quality"
             )
         }
     
-    def assign_ai(self, file_path, file_content):
+    def assign_ai(self, file_path, file_content, features=None):
         """
         Meta-AI determines which specialist AI should handle this file
+        (features: its ContentFeatures, if already extracted)
         """
-        file_ext = Path(file_path).suffix.lower()
-        file_name = Path(file_path).name.lower()
+        features = features or ContentFeatures.of(file_content)
+        specialist, reason = self._assign(file_path, features)
+        assigned_ai = self.compression_ais[specialist]
         
-        # Analyze content
-        has_threejs = 'THREE.' in file_content or 'three.js' in file_content.lower()
-        has_webgl = 'gl_' in file_content or 'webgl' in file_content.lower()
-        css_ratio = file_content.count('style') / max(len(file_content), 1)
-        js_ratio = file_content.count('function') / max(len(file_content), 1)
+        log.debug(f"   🎯 Assigned to AI #{assigned_ai.id}: {assigned_ai.name}")
+        log.debug(f"      Reason: {reason}")
         
-        # Decision tree
-        if has_threejs:
-            assigned_ai = self.compression_ais["threejs_specialist"]
-            reason = "Three.js 3D graphics detected"
-        elif has_webgl:
-            assigned_ai = self.compression_ais["webgl_specialist"]
-            reason = "WebGL shaders detected"
-        elif css_ratio > 0.01:
-            assigned_ai = self.compression_ais["css_specialist"]
-            reason = "High CSS content ratio"
-        elif js_ratio > 0.005:
-            assigned_ai = self.compression_ais["js_specialist"]
-            reason = "JavaScript-heavy file"
-        elif file_ext == '.json':
-            assigned_ai = self.compression_ais["json_specialist"]
+        return assigned_ai
+    
+    def content_signature(self, file_path, features):
+        """
+        The bucket learned statistics are kept under, from a file's
+        ContentFeatures: the rule-based specialist (what kind of content
+        this is) and a power-of-4 size class, e.g. "threejs_specialist/64K"
+        """
+        rule, _ = self._choose_ai(file_path, features)
+        return self._signature(rule, features)
+    
+    @staticmethod
+    def _signature(rule, features):
+        size_class = 4 ** max(0, ((features.length >> 10).bit_length() - 1) // 2)
+        return f"{rule}/{size_class}K"
+    
+    def _assign(self, file_path, features):
+        """
+        (specialist key, reason): the rule-based choice until something
+        has been measured for this kind of content, then a cost model
+        over the compression strategies the specialists share (they
+        produce the same output within a strategy, so evidence pools).
+        A strategy's score at this signature is shrunk toward its score
+        over every size class of the same kind, so what was learned on
+        small pages carries over to big ones. ε-first: a strategy with
+        fewer than PRIOR_FILES runs for the kind is tried with
+        probability explore. The rule-based specialist keeps the file
+        whenever it has the winning strategy.
+        """
+        rule, reason = self._choose_ai(file_path, features)
+        signature = self._signature(rule, features)
+        candidates = self._candidates(rule)
+        allowed = {ai.strategy for ai in candidates.values()}
+        here, kind = {}, {}
+        with self._stats_lock:
+            for bucket, measured in self.ai_performance.items():
+                if bucket.split('/')[0] != rule:
+                    continue
+                for key, stats in measured.items():
+                    strategy = self.compression_ais[key].strategy
+                    if strategy not in allowed:
+                        continue
+                    for totals in ([kind] if bucket != signature else [kind, here]):
+                        column = totals.setdefault(strategy, [0, 0, 0, 0.0, 0])
+                        for i, value in enumerate(stats):
+                            column[i] += value
+        if not kind:
+            return rule, reason
+        
+        def score(strategy):
+            return self.performance_score(here.get(strategy, [0, 0, 0, 0.0, 0]), kind[strategy])
+        
+        best = max(kind, key=score)
+        unproven = sorted(ai.strategy for ai in candidates.values()
+                          if ai.strategy != best and kind.get(ai.strategy, [0])[0] < PRIOR_FILES)
+        if unproven and self._random.random() < self.explore:
+            strategy = self._random.choice(unproven)
+            why = f"Exploring {strategy} (ε={self.explore:g}) for {rule}"
+        else:
+            strategy = best
+            why = (f"{strategy.capitalize()} measured best for {signature}: "
+                   f"{score(strategy):.2f} MB saved per CPU-second")
+        if self.compression_ais[rule].strategy == strategy:
+            return rule, f"{reason}; {why}"
+        specialist = next(key for key, ai in candidates.items() if ai.strategy == strategy)
+        return specialist, why
+    
+    def _candidates(self, rule):
+        """
+        The compression AIs that may take a file the decision tree gave
+        to rule. A format's files stay with its codec: the generic
+        strategies "save" more on Markdown only by flattening it, which
+        no validator notices. Everything else goes to the generic ones.
+        """
+        if self.compression_ais[rule].format is not None:
+            return {rule: self.compression_ais[rule]}
+        return {key: ai for key, ai in self.compression_ais.items() if ai.format is None}
+    
+    def _choose_ai(self, file_path, features):
+        """(specialist key, reason) for a file by the rule-based decision tree"""
+        path = Path(file_path)
+        file_ext = path.suffix.lower()
+        file_name = path.name.lower()
+        
+        # Formats with their own codec go by extension: a JSON or Markdown
+        # file that mentions 'function' or 'style' is still JSON or Markdown
+        if file_ext == '.json':
+            specialist = "json_specialist"
             reason = "JSON data structure"
         elif file_ext == '.md':
-            assigned_ai = self.compression_ais["markdown_specialist"]
+            specialist = "markdown_specialist"
             reason = "Markdown content"
         elif file_ext == '.svg':
-            assigned_ai = self.compression_ais["svg_specialist"]
+            specialist = "svg_specialist"
             reason = "SVG vector graphics"
+        # Then a decision tree over the content's routing signals
+        elif features.has_threejs:
+            specialist = "threejs_specialist"
+            reason = "Three.js 3D graphics detected"
+        elif features.has_webgl:
+            specialist = "webgl_specialist"
+            reason = "WebGL shaders detected"
+        elif features.css_ratio > 0.01:
+            specialist = "css_specialist"
+            reason = "High CSS content ratio"
+        elif features.js_ratio > 0.005:
+            specialist = "js_specialist"
+            reason = "JavaScript-heavy file"
         elif 'index' in file_name or 'landing' in file_name:
-            assigned_ai = self.compression_ais["html_specialist"]
+            specialist = "html_specialist"
             reason = "Landing page detected"
         else:
-            assigned_ai = self.compression_ais["general_specialist"]
+            specialist = "general_specialist"
             reason = "General file type"
         
-        print(f"   🎯 Assigned to AI #{assigned_ai.id}: {assigned_ai.name}")
-        print(f"      Reason: {reason}")
-        
-        return assigned_ai
+        return specialist, reason
     
-    def compress_with_multi_ai(self, file_path):
+    def compress_with_multi_ai(self, file_path, specialist=None, race=0, budget=RACE_BUDGET):
         """
-        Main compression using multiple AIs in parallel
+        Main compression using multiple AIs in parallel. specialist (a
+        compression_ais key) skips the Meta-AI assignment step. race=K
+        races the top K specialist/optimizer pairs for budget seconds
+        and keeps the smallest verified output (see race()), falling
+        back to the single-specialist pipeline if none verified in time.
+        Output that fails validation is replaced by the general
+        specialist's; when a failure looks likely (learned failure rate,
+        or the cheap validators already reject the raw output) that
+        fallback compression starts in parallel instead of afterwards.
         """
-        print(f"\n{'='*70}")
-        print(f"🚀 MULTI-AI COMPRESSION: {Path(file_path).name}")
-        print(f"{'='*70}")
+        log.info(f"\n{'='*70}")
+        log.info(f"🚀 MULTI-AI COMPRESSION: {Path(file_path).name}")
+        log.info(f"{'='*70}")
+        trace = Trace(self.sink, file=str(file_path), specialist_id=None, pid=os.getpid())
         
         # Read file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with trace.span("read") as span:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            span["bytes_out"] = len(content)
         
         original_size = len(content)
-        print(f"Original size: {original_size:,} bytes ({original_size / 1024:.2f} KB)")
-        
-        # Meta-AI assigns specialist
-        print(f"\n🧠 Meta-AI analyzing file...")
-        compression_ai = self.assign_ai(file_path, content)
-        
-        # Compression AI does its work
-        print(f"\n⚙️ {compression_ai.name} compressing...")
-        compressed_content = compression_ai.compress(content)
-        
-        # Optimization AIs suggest improvements
-        print(f"\n🔧 Optimization AIs analyzing...")
-        optimization_results = {}
-        for opt_name, opt_ai in self.optimization_ais.items():
-            suggestion = opt_ai.optimize(compressed_content, original_size)
-            optimization_results[opt_name] = suggestion
-            print(f"   AI #{opt_ai.id} ({opt_ai.name}): {suggestion['recommendation']}")
-        
-        # Apply best optimization
-        best_opt = max(optimization_results.values(), key=lambda x: x['score'])
-        if best_opt['score'] > 0.8:
-            print(f"   ✓ Applying {best_opt['name']}'s optimization")
-            compressed_content = best_opt['optimized_content']
-        
-        # Validation AIs check quality
-        print(f"\n✅ Validation AIs checking...")
-        validation_results = {}
-        for val_name, val_ai in self.validation_ais.items():
-            result = val_ai.validate(content, compressed_content)
-            validation_results[val_name] = result
-            status = "✓" if result['passed'] else "✗"
-            print(f"   {status} AI #{val_ai.id} ({val_ai.name}): {result['message']}")
-        
-        # All validations must pass
-        all_passed = all(r['passed'] for r in validation_results.values())
-        
-        if not all_passed:
-            print(f"\n⚠️ Validation failed! Using fallback compression")
-            compressed_content = self.compression_ais["general_specialist"].compress(content)
+        log.info(f"Original size: {original_size:,} bytes ({original_size / 1024:.2f} KB)")
+        
+        with trace.span("assign", original_size):
+            features = ContentFeatures.of(content)
+            signature = self.content_signature(file_path, features)
+            if not race:
+                specialist, compression_ai = self._pick_specialist(file_path, content,
+                                                                   features, specialist)
+                trace.fields["specialist_id"] = compression_ai.id
+        winner = None
+        if race:
+            # Specialist/optimizer pairs race; the smallest verified output wins
+            log.debug(f"\n🏁 Race: top {race} specialist/optimizer pairs, {budget:g}s budget...")
+            with trace.span("race", original_size) as span:
+                winner = self.race(file_path, content, features, specialist, race, budget)
+                if winner is not None:
+                    trace.fields["specialist_id"] = self.compression_ais[winner['specialist']].id
+                    span["bytes_out"] = len(winner['output'])
+            if winner is None:
+                log.debug(f"   ⚠️ No verified output, running the assigned specialist")
+                with trace.span("assign", original_size):
+                    specialist, compression_ai = self._pick_specialist(file_path, content,
+                                                                       features, specialist)
+                    trace.fields["specialist_id"] = compression_ai.id
+        
+        if winner is not None:
+            specialist = winner['specialist']
+            compression_ai = self.compression_ais[specialist]
+            opt_ai = self.optimization_ais[winner['optimizer']]
+            log.debug(f"   🏆 AI #{compression_ai.id} ({compression_ai.name}) + "
+                      f"AI #{opt_ai.id} ({opt_ai.name}): {len(winner['output']):,} bytes")
+            compressed_content = winner['output']
+            specialist_seconds = winner['specialist_seconds']
+            saved = winner['saved']
+            not_raced = {"passed": None, "message": "Not run (race winner verified)"}
+            optimization_results = {name: winner['suggestion'] if name == winner['optimizer']
+                                    else {"name": ai.name, "recommendation": "Not raced"}
+                                    for name, ai in self.optimization_ais.items()}
+            validation_results = {name: winner['validations'].get(name, not_raced)
+                                  for name in self.validation_ais}
+            all_passed = True
+            fallback_mode = None
+        else:
+            # Output this specialist's strategy usually fails validation
+            # on: start the fallback now rather than after the failure.
+            # Format codecs fall back to the precise strategy, which
+            # keeps whitespace (Markdown structure, JSON strings) intact
+            general_ai = self.compression_ais["html_specialist" if compression_ai.format
+                                              else "general_specialist"]
+            fallback = fallback_mode = None
+            if general_ai.strategy != compression_ai.strategy and \
+                    (self.failure_rate(signature, specialist) or 0) >= SPECULATE_FAILURE_RATE:
+                fallback = self._speculate(general_ai, content)
+                if fallback is not None:
+                    fallback_mode = "speculative"
+                    log.debug(f"   🔮 Usually fails validation here, fallback started alongside")
+            
+            # Compression AI does its work
+            log.debug(f"\n⚙️ {compression_ai.name} compressing...")
+            with trace.span("compress", original_size) as span:
+                start = time.perf_counter()
+                compressed_content = compression_ai.compress(content)
+                specialist_seconds = time.perf_counter() - start
+                span["bytes_out"] = len(compressed_content)
+            saved = max(0, original_size - len(compressed_content))
+            if general_ai.strategy == compression_ai.strategy:
+                # The fallback would produce exactly this
+                fallback = _Done(compressed_content)
+                fallback_mode = "reused"
+            elif fallback is None and not self._cheap_checks_pass(content, compressed_content):
+                # Failing already; the optimizers may still rescue it
+                fallback = self._speculate(general_ai, content)
+                if fallback is not None:
+                    fallback_mode = "speculative"
+                    log.debug(f"   🔮 Failing the cheap checks, fallback started alongside")
+            
+            # Optimization AIs suggest improvements
+            log.debug(f"\n🔧 Optimization AIs analyzing...")
+            with trace.span("optimize", len(compressed_content)) as span:
+                optimization_results = self.run_optimizers(compressed_content, original_size,
+                                                           compression_ai.format)
+                
+                # Apply best optimization
+                best_opt = max(optimization_results.values(), key=lambda x: x['score'])
+                if best_opt['score'] > 0.8:
+                    log.debug(f"   ✓ Applying {best_opt['name']}'s optimization")
+                    compressed_content = best_opt['optimized_content']
+                span["bytes_out"] = len(compressed_content)
+            
+            # Validation AIs check quality
+            log.debug(f"\n✅ Validation AIs checking...")
+            with trace.span("validate", len(compressed_content)):
+                validation_results = self.run_validators(content, compressed_content)
+            
+            # All validations must pass
+            all_passed = all(r['passed'] for r in validation_results.values())
+            
+            if not all_passed:
+                log.warning(f"\n⚠️ Validation failed for {Path(file_path).name}! Using fallback compression"
+                            + (f" ({fallback_mode})" if fallback_mode else ""))
+                with trace.span("fallback", original_size) as span:
+                    if fallback is None:
+                        fallback_mode = "sequential"
+                        compressed_content = general_ai.compress(content)
+                    else:
+                        compressed_content = fallback.result()
+                    span["bytes_out"] = len(compressed_content)
+                    span["mode"] = fallback_mode
+            else:
+                fallback_mode = None
+                if fallback is not None:
+                    fallback.cancel()
         
         # NFT AI creates crypto signature
-        print(f"\n🔐 NFT Minting AI crypto-signing...")
-        nft_data = self.nft_ai.create_nft_signature(content, compressed_content, file_path)
+        log.debug(f"\n🔐 NFT Minting AI crypto-signing...")
+        with trace.span("sign", len(compressed_content)):
+            nft_data = self.nft_ai.create_nft_signature(content, compressed_content, file_path)
         
         # XOR encryption
-        encrypted = self.xor_encrypt(compressed_content.encode('utf-8'), self.xor_key)
-        encrypted_b64 = base64.b64encode(encrypted).decode('utf-8')
+        payload = compressed_content.encode('utf-8')
+        with trace.span("xor", len(payload)) as span:
+            encrypted = self.xor_encrypt(payload, self.xor_key)
+            span["bytes_out"] = len(encrypted)
         
-        # Generate Python file
-        py_content = self._generate_python_file(
-            file_path, content, encrypted_b64, nft_data,
-            compression_ai, optimization_results, validation_results
-        )
-        
-        # Save
-        output_dir = Path("compressed_py_multi_ai")
-        output_dir.mkdir(exist_ok=True)
-        output_path = output_dir / (Path(file_path).stem + "_multi_ai.py")
+        # Base64, wrapped in the generated Python file
+        with trace.span("encode", len(encrypted)) as span:
+            encrypted_b64 = base64.b64encode(encrypted).decode('utf-8')
+            py_content = self._generate_python_file(
+                file_path, content, encrypted_b64, nft_data,
+                compression_ai, optimization_results, validation_results
+            )
+            span["bytes_out"] = len(py_content)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(py_content)
+        # Save (atomically: another thread may be writing the same name)
+        with trace.span("write", len(py_content)):
+            output_dir = self._output_dir()
+            output_path = output_dir / (Path(file_path).stem + "_multi_ai.py")
+            atomic_write_text(output_path, py_content)
         
         compressed_size = len(py_content)
-        ratio = (1 - compressed_size / original_size) * 100
+        ratio = (1 - compressed_size / max(original_size, 1)) * 100
         
-        print(f"\n{'='*70}")
-        print(f"✅ MULTI-AI COMPRESSION COMPLETE")
-        print(f"{'='*70}")
-        print(f"Output: {output_path}")
-        print(f"Original: {original_size:,} bytes")
-        print(f"Compressed: {compressed_size:,} bytes")
-        print(f"Ratio: {ratio:.1f}%")
-        print(f"NFT Hash: {nft_data['hash']}")
+        log.info(f"\n{'='*70}")
+        log.info(f"✅ MULTI-AI COMPRESSION COMPLETE")
+        log.info(f"{'='*70}")
+        log.info(f"Output: {output_path}")
+        log.info(f"Original: {original_size:,} bytes")
+        log.info(f"Compressed: {compressed_size:,} bytes")
+        log.info(f"Ratio: {ratio:.1f}%")
+        log.info(f"NFT Hash: {nft_data['hash']}")
+        progress(log, "file_done", file=str(file_path), output=str(output_path),
+                 original_size=original_size, compressed_size=compressed_size,
+                 ratio=round(ratio, 2), specialist=specialist,
+                 validations_passed=all_passed, fallback=fallback_mode)
         
-        return {
+        result = {
             "input": file_path,
             "output": str(output_path),
             "original_size": original_size,
@@ -317,12 +724,345 @@ class MetaAIOrchestrator:
             "ratio": ratio,
             "nft_data": nft_data,
             "compression_ai": compression_ai.name,
-            "validations_passed": all_passed
+            "specialist": specialist,
+            "signature": signature,
+            "saved": saved,
+            "specialist_seconds": specialist_seconds,
+            "validations_passed": all_passed,
+            "fallback": fallback_mode,
+            "race": winner['race'] if winner is not None else None,
+            "spans": trace.records
         }
+        self.record_performance(result)
+        return result
+    
+    def _pick_specialist(self, file_path, content, features, specialist=None):
+        """(key, CompressionAI): the given specialist, or the Meta-AI's assignment"""
+        log.debug(f"\n🧠 Meta-AI analyzing file...")
+        if specialist is None:
+            compression_ai = self.assign_ai(file_path, content, features)
+            specialist = next(key for key, ai in self.compression_ais.items()
+                              if ai is compression_ai)
+        else:
+            compression_ai = self.compression_ais[specialist]
+            log.debug(f"   🎯 Scheduled on AI #{compression_ai.id}: {compression_ai.name}")
+        return specialist, compression_ai
+    
+    def schedule(self, file_paths):
+        """
+        Queue files for run_queue. Each is classified up front (which
+        specialist, how big) and queued costliest-first: starting the
+        big jobs early keeps one late giant from setting the tail.
+        """
+        for file_path in file_paths:
+            features = ContentFeatures()
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for chunk in iter(lambda: f.read(SCAN_CHUNK_SIZE), ''):
+                    features.feed(chunk)
+            specialist, _ = self._assign(file_path, features)
+            cost = features.length * SPECIALIST_COST.get(specialist, 1.0)
+            heapq.heappush(self.task_queue,
+                           (-cost, next(self._sequence), str(file_path), specialist))
+        return len(self.task_queue)
+    
+    def compress_directory(self, directory, pattern="*.html", workers=None, limits=None,
+                           report=None, race=0, budget=RACE_BUDGET):
+        """Schedule every file matching pattern under directory and run the queue"""
+        self.schedule(sorted(p for p in Path(directory).rglob(pattern)
+                             if p.is_file() and OUTPUT_DIR not in p.parts))
+        return self.run_queue(workers, limits, report, race, budget)
+    
+    def run_queue(self, workers=None, limits=None, report=None, race=0, budget=RACE_BUDGET):
+        """
+        Drain task_queue over a pool of worker processes, yielding each
+        result as soon as it completes (and appending it to results).
+        
+        limits maps a specialist key to the most files it may have in
+        flight at once (default: no limit beyond workers). The next job
+        is the costliest one whose specialist has a free slot, so a
+        capped specialist never blocks the others. report(result, text)
+        gets each file's captured per-file report. Results gain
+        "seconds" (time in the worker) and "latency" (time from the
+        start of the run to completion). race/budget are passed on to
+        compress_with_multi_ai; each worker races its file's pairs one
+        at a time, since the pool already keeps every core busy.
+        """
+        workers = workers or self.max_workers
+        limits = dict(limits or {})
+        unknown = set(limits) - set(self.compression_ais)
+        if unknown:
+            raise ValueError(f"Unknown specialist(s): {', '.join(sorted(unknown))}")
+        if any(limit < 1 for limit in limits.values()):
+            raise ValueError("Specialist limits must be at least 1")
+        
+        # Once up front, rather than every worker racing to copy it
+        self._output_dir()
+        in_flight = Counter()
+        start = time.perf_counter()
+        
+        def next_job():
+            blocked = []
+            job = None
+            while self.task_queue:
+                candidate = heapq.heappop(self.task_queue)
+                if in_flight[candidate[3]] < limits.get(candidate[3], workers):
+                    job = candidate
+                    break
+                blocked.append(candidate)
+            for candidate in blocked:
+                heapq.heappush(self.task_queue, candidate)
+            if job is not None:
+                in_flight[job[3]] += 1
+            return job
+        
+        def finish(job, outcome, learned=True):
+            in_flight[job[3]] -= 1
+            result, text = outcome
+            result["latency"] = time.perf_counter() - start
+            if not learned:
+                # Measured in a worker process: learn from it here, and
+                # pass its spans on to this orchestrator's sink
+                self.record_performance(result)
+                if self.sink is not None:
+                    for record in result["spans"]:
+                        self.sink.emit(record)
+            self.results.append(result)
+            if report is not None:
+                report(result, text)
+            return result
+        
+        if workers == 1:
+            while (job := next_job()) is not None:
+                yield finish(job, _multi_ai_logged(self, job[2], job[3], race, budget))
+        else:
+            with ProcessPoolExecutor(workers, initializer=_init_scheduler_worker,
+                                     initargs=(current_config(),)) as pool:
+                pending = {}
+                while self.task_queue or pending:
+                    while len(pending) < workers and (job := next_job()) is not None:
+                        pending[pool.submit(_scheduler_worker, job[2], job[3],
+                                            race, budget)] = job
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield finish(pending.pop(future), future.result(), learned=False)
+        self.save_performance()
+    
+    def _fan_out(self, tasks, size, deadline=None, keep=()):
+        """
+        Run {name: (ai, func, args)} as func(*args), on the pool that
+        suits ai, yielding (name, future) as each finishes. Small inputs
+        (or a single worker) run inline, one task per step, so a
+        consumer that stops iterating skips the rest; otherwise closing
+        the generator early cancels every task that hasn't started.
+        Past the perf_counter() deadline only the tasks named in keep
+        are still waited for (inline: started); the rest are cancelled.
+        """
+        if self.max_workers == 1 or size < INLINE_MAX_SIZE:
+            for name, (ai, func, args) in tasks.items():
+                if deadline is not None and time.perf_counter() >= deadline and name not in keep:
+                    continue
+                try:
+                    future = _Done(func(*args))
+                except Exception as e:
+                    future = _Done(exception=e)
+                yield name, future
+            return
+        futures = {self._executor(ai, size).submit(func, *args): name
+                   for name, (ai, func, args) in tasks.items()}
+        timeout = None if deadline is None else max(0.0, deadline - time.perf_counter())
+        done = set()
+        try:
+            try:
+                for future in as_completed(futures, timeout):
+                    done.add(future)
+                    yield futures[future], future
+            except TimeoutError:
+                for future in futures:
+                    if futures[future] not in keep:
+                        future.cancel()
+                for future in as_completed([future for future in futures
+                                            if futures[future] in keep and future not in done]):
+                    yield futures[future], future
+        finally:
+            for future in futures:
+                future.cancel()
+    
+    def race_candidates(self, file_path, features, specialist=None, top_k=RACE_TOP_K):
+        """
+        The top_k (specialist key, optimizer key) pairs to race, best
+        first: the assigned specialist (or the given one), then one per
+        other compression strategy, since specialists sharing a strategy
+        produce the same output; interleaved over optimizers so the
+        first pairs try different specialists. A pair whose output would
+        be an earlier pair's (see OptimizationAI.output_strategy) is
+        left out, so there may be fewer than top_k.
+        """
+        first = specialist or self._assign(file_path, features)[0]
+        strategies = [self.compression_ais[first].strategy]
+        specialists = [first]
+        rule, _ = self._choose_ai(file_path, features)
+        for key, ai in self._candidates(rule).items():
+            if ai.strategy not in strategies:
+                strategies.append(ai.strategy)
+                specialists.append(key)
+        pairs = []
+        outputs = set()
+        for name, opt_ai in self.optimization_ais.items():
+            for key in specialists:
+                output = opt_ai.output_strategy(self.compression_ais[key])
+                if output not in outputs:
+                    outputs.add(output)
+                    pairs.append((key, name))
+        return pairs[:top_k]
+    
+    def race(self, file_path, content, features, specialist=None, top_k=RACE_TOP_K,
+             budget=RACE_BUDGET):
+        """
+        Race mode: run the top_k specialist/optimizer pairs on the same
+        content in parallel and keep the smallest output that passed
+        every validator (ties go to the better-ranked pair). Pairs run
+        grouped by specialist, so each specialist compresses once and
+        tries its optimizers on that. When budget seconds are up,
+        runner-ups that haven't started are cancelled and running ones
+        stop at their next step (a compression already under way still
+        finishes, so the budget bounds the wait rather than cutting it
+        exactly); the top-ranked specialist is the baseline and is
+        always waited for. Each
+        finished specialist run feeds the performance learning. Returns
+        the winning entry, or None if nothing finished verified.
+        """
+        pairs = self.race_candidates(file_path, features, specialist, top_k)
+        rank = {pair: i for i, pair in enumerate(pairs)}
+        signature = self.content_signature(file_path, features)
+        deadline = time.perf_counter() + budget
+        validation_ais = {name: self.validation_ais[name] for name in self.validation_order}
+        groups = {}
+        for key, name in pairs:
+            groups.setdefault(key, []).append((name, self.optimization_ais[name]))
+        # The baseline runs to the end; perf_counter() is system-wide, so
+        # runner-ups in worker processes check the same deadline
+        tasks = {key: (self.compression_ais[key], _race_entries,
+                       (self.compression_ais[key], optimizers, validation_ais, content,
+                        None if key == pairs[0][0] else deadline))
+                 for key, optimizers in groups.items()}
+        
+        entries = {}
+        for key, future in self._fan_out(tasks, len(content), deadline, keep={pairs[0][0]}):
+            comp_ai = self.compression_ais[key]
+            try:
+                finished = future.result()
+            except Exception as e:
+                log.warning(f"   ✗ AI #{comp_ai.id} ({comp_ai.name}): error: {e}")
+                continue
+            for name, entry in finished.items():
+                opt_ai = self.optimization_ais[name]
+                entry.update(specialist=key, optimizer=name, signature=signature,
+                             original_size=len(content))
+                entries[key, name] = entry
+                if entry['validations_passed']:
+                    log.debug(f"   ✓ AI #{comp_ai.id} + AI #{opt_ai.id}: "
+                              f"{len(entry['output']):,} bytes ({entry['seconds'] * 1000:.0f} ms)")
+                else:
+                    failed = next(r for r in entry['validations'].values() if not r['passed'])
+                    log.debug(f"   ✗ AI #{comp_ai.id} + AI #{opt_ai.id}: {failed['message']}")
+        
+        cancelled = len(pairs) - len(entries)
+        if cancelled:
+            log.debug(f"   ⏱️ Budget of {budget:g}s spent: {cancelled} runner-up(s) cancelled")
+        verified = [entry for entry in entries.values() if entry['validations_passed']]
+        winner = min(verified, key=lambda entry: (len(entry['output']),
+                                                  rank[entry['specialist'], entry['optimizer']]),
+                     default=None)
+        # One learning sample per specialist run; the winner's is recorded
+        # with the file's result
+        learned = {winner['specialist']} if winner is not None else set()
+        for entry in entries.values():
+            if entry['specialist'] not in learned:
+                learned.add(entry['specialist'])
+                self.record_performance(entry)
+        if winner is not None:
+            winner['race'] = {"pairs": len(pairs), "finished": len(entries),
+                              "cancelled": cancelled}
+        return winner
+    
+    def run_optimizers(self, content, original_size, format=None):
+        """
+        Every optimization AI on the same content, concurrently (format:
+        the specialist's eug_formats codec, if it ran one). All
+        suggestions are needed to pick the best one, so this waits for
+        the whole set; results come back in roster order.
+        """
+        results = {}
+        tasks = {name: (ai, ai.optimize, (content, original_size, format))
+                 for name, ai in self.optimization_ais.items()}
+        for name, future in self._fan_out(tasks, len(content)):
+            results[name] = future.result()
+        for name, opt_ai in self.optimization_ais.items():
+            log.debug(f"   AI #{opt_ai.id} ({opt_ai.name}): {results[name]['recommendation']}")
+        return {name: results[name] for name in self.optimization_ais}
+    
+    def run_validators(self, original, compressed):
+        """
+        Every validation AI, cheapest first by declared cost: the ones
+        estimated under CHEAP_VALIDATION_MS on this content run inline,
+        then the rest concurrently, reported as each finishes. The first
+        failure stops the run, cancelling whatever hasn't started and
+        discarding what's in flight; those validators are reported with
+        passed=None. A validator that raises counts as a failure.
+        Results come back in roster order.
+        """
+        size = max(len(original), len(compressed))
+        cheap = self._cheap_validators(size)
+        costly = [name for name in self.validation_order if name not in cheap]
+        results = {}
+        for stage, stage_size in ((cheap, 0), (costly, size)):
+            tasks = self._fan_out({name: (self.validation_ais[name], self.validation_ais[name].validate,
+                                          (original, compressed))
+                                   for name in stage}, stage_size)
+            for name, future in tasks:
+                val_ai = self.validation_ais[name]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {"passed": False, "message": f"Validator error: {e}"}
+                results[name] = result
+                status = "✓" if result['passed'] else "✗"
+                log.debug(f"   {status} AI #{val_ai.id} ({val_ai.name}): {result['message']}")
+                if not result['passed']:
+                    break
+            tasks.close()
+            if not all(r['passed'] for r in results.values()):
+                break
+        
+        skipped = {"passed": None, "message": "Skipped (an earlier validator failed)"}
+        for name, val_ai in self.validation_ais.items():
+            if name not in results:
+                log.debug(f"   – AI #{val_ai.id} ({val_ai.name}): {skipped['message']}")
+        return {name: results.get(name, skipped) for name in self.validation_ais}
+    
+    def _cheap_validators(self, size):
+        """Validators (in run order) estimated under CHEAP_VALIDATION_MS on size characters"""
+        return [name for name in self.validation_order
+                if self.validation_ais[name].cost * size / 1e6 < CHEAP_VALIDATION_MS]
+    
+    def _cheap_checks_pass(self, original, compressed):
+        """False if a cheap validator already rejects compressed (nothing is reported)"""
+        for name in self._cheap_validators(max(len(original), len(compressed))):
+            try:
+                if not self.validation_ais[name].validate(original, compressed)['passed']:
+                    return False
+            except Exception:
+                return False
+        return True
+    
+    def _speculate(self, compression_ai, content):
+        """compression_ai.compress(content) started on a pool, or None where everything runs inline"""
+        if self.max_workers == 1 or len(content) < INLINE_MAX_SIZE:
+            return None
+        return self._executor(compression_ai, len(content)).submit(compression_ai.compress, content)
     
     def xor_encrypt(self, data, key):
-        key_repeated = (key * (len(data) // len(key) + 1))[:len(data)]
-        return bytes(a ^ b for a, b in zip(data, key_repeated))
+        return xor_bytes(data, key)
     
     def _generate_python_file(self, file_path, original_content, encrypted_b64, 
                                nft_data, compression_ai, opt_results, val_results):
@@ -366,13 +1106,14 @@ NFT METADATA:
 
 import base64
 
+from eug_codec import xor_bytes
+
 class MultiAIDecompressor:
     def __init__(self):
         self.xor_key = b"eug"
     
     def xor_decrypt(self, encrypted_data, key):
-        key_repeated = (key * (len(encrypted_data) // len(key) + 1))[:len(encrypted_data)]
-        return bytes(a ^ b for a, b in zip(encrypted_data, key_repeated))
+        return xor_bytes(encrypted_data, key)
     
     def decompress(self):
         encrypted = base64.b64decode(compressed_data)
@@ -388,19 +1129,53 @@ if __name__ == "__main__":
 '''
 
 
+class _Done:
+    """An already-finished Future: inline work needs none of Future's locking"""
+    __slots__ = ('_result', '_exception')
+    
+    def __init__(self, result=None, exception=None):
+        self._result = result
+        self._exception = exception
+    
+    def result(self, timeout=None):
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+    
+    def done(self):
+        return True
+    
+    def cancel(self):
+        return False
+
+
 class CompressionAI:
     """Individual AI personality for compression"""
-    def __init__(self, id, name, specialty, personality_traits):
+    def __init__(self, id, name, specialty, personality_traits, format=None):
         self.id = id
         self.name = name
         self.specialty = specialty
         self.personality_traits = personality_traits
-        self.performance_history = []
+        self.performance_history = deque(maxlen=PERFORMANCE_WINDOW)
+        # A format specialist runs its eug_formats codec; everyone else's
+        # whitespace handling follows the precision trait
+        self.format = format
+        if format is not None:
+            self.strategy = format
+        else:
+            self.strategy = "precise" if personality_traits.get("precision", 0.5) > 0.8 else "aggressive"
+        # The minifier is a pure-Python lexer
+        self.cpu_bound = True
     
     def compress(self, content):
         """Each AI has its own compression strategy"""
-        # Remove whitespace based on precision trait
-        if self.personality_traits.get("precision", 0.5) > 0.8:
+        if self.format is not None:
+            try:
+                return FORMATS[self.format](content)
+            except ValueError:
+                # Not actually in this format (or empty)
+                return self._precise_compression(content)
+        if self.strategy == "precise":
             content = self._precise_compression(content)
         else:
             content = self._aggressive_compression(content)
@@ -409,42 +1184,53 @@ class CompressionAI:
     
     def _precise_compression(self, content):
         """Careful compression preserving structure"""
-        import re
         # Remove comments but preserve formatting
-        content = re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
-        content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-        return content
+        return minify(content, keep_whitespace=True)
     
     def _aggressive_compression(self, content):
         """Maximum compression"""
-        import re
-        content = re.sub(r'\s+', ' ', content)
-        content = re.sub(r'>\s+<', '><', content)
-        content = re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
-        content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-        return content.strip()
+        return minify(content)
+
+
+_RAW_TEXT_TAG = re.compile(r'<(/?)(script|style)\b', re.I)
+
+
+def _raw_text_balance(content):
+    """Opening minus closing <script>/<style> tags in content, by tag name"""
+    balance = {}
+    for closing, tag in _RAW_TEXT_TAG.findall(content):
+        tag = tag.lower()
+        balance[tag] = balance.get(tag, 0) + (-1 if closing else 1)
+    return {tag: count for tag, count in balance.items() if count}
 
 
 class ValidationAI:
-    """Individual AI personality for validation"""
-    def __init__(self, id, name, specialty, personality_traits):
+    """
+    Individual AI personality for validation. kind ("integrity", "syntax",
+    "performance", "security", "round-trip" or "quality") picks the check.
+    """
+    def __init__(self, id, name, specialty, personality_traits, kind, cost=0.0):
         self.id = id
         self.name = name
         self.specialty = specialty
         self.personality_traits = personality_traits
+        self.kind = kind
+        # Estimated milliseconds per MB checked; validators run cheapest first
+        self.cost = cost
+        # XOR + Base64 + hashing the whole payload holds the GIL
+        self.cpu_bound = kind == "round-trip"
     
     def validate(self, original, compressed):
         """Each AI validates different aspects"""
-        if "integrity" in self.specialty.lower():
+        if self.kind == "integrity":
             return self._validate_integrity(original, compressed)
-        elif "syntax" in self.specialty.lower():
-            return self._validate_syntax(compressed)
-        elif "performance" in self.specialty.lower():
+        elif self.kind == "syntax":
+            return self._validate_syntax(original, compressed)
+        elif self.kind == "performance":
             return self._validate_performance(original, compressed)
-        elif "security" in self.specialty.lower():
+        elif self.kind == "security":
             return self._validate_security(compressed)
-        elif "decompression" in self.specialty.lower():
+        elif self.kind == "round-trip":
             return self._validate_decompression(original, compressed)
         else:
             return self._validate_quality(original, compressed)
@@ -456,30 +1242,52 @@ class ValidationAI:
             "message": "Content integrity verified"
         }
     
-    def _validate_syntax(self, compressed):
-        # Check for basic syntax
+    def _validate_syntax(self, original, compressed):
+        # Every <script>/<style> element still closes where it did: the
+        # open-minus-close balance of each is what it was in the original
+        # (an unbalanced original, e.g. a tag written inside a JS string,
+        # stays as unbalanced)
+        balance = _raw_text_balance(compressed)
+        passed = balance == _raw_text_balance(original)
         return {
-            "passed": '<' in compressed or '⟨' in compressed,
-            "message": "Syntax structure preserved"
+            "passed": passed,
+            "message": "Syntax structure preserved" if passed else
+                       f"Unbalanced raw-text elements: {balance}"
         }
     
     def _validate_performance(self, original, compressed):
-        ratio = (1 - len(compressed) / len(original)) * 100
+        # Any ratio is acceptable, as long as the output didn't grow
+        ratio = (1 - len(compressed) / max(len(original), 1)) * 100
         return {
-            "passed": ratio > 50,
+            "passed": len(compressed) <= len(original),
             "message": f"Compression ratio: {ratio:.1f}%"
         }
     
     def _validate_security(self, compressed):
+        # The generated file stores UTF-8: a lone surrogate (e.g. half of
+        # an escaped JSON pair) would make it unwritable
+        try:
+            compressed.encode('utf-8')
+        except UnicodeEncodeError as e:
+            return {"passed": False, "message": f"Not encodable as UTF-8: {e.reason}"}
         return {
             "passed": True,
             "message": "Security checks passed"
         }
     
     def _validate_decompression(self, original, compressed):
+        # Round-trip the payload the way the generated file stores it
+        # (XOR + Base64) and hash what decodes, chunk by chunk
+        start = time.perf_counter()
+        expected = compressed.encode('utf-8')
+        payload = base64.b64encode(xor_bytes(expected, b"eug"))
+        digest, size = digest_payload(io.BytesIO(payload), len(payload),
+                                      PayloadDecoder(xor_key=b"eug", text=True))
+        elapsed = (time.perf_counter() - start) * 1000
+        passed = digest == hashlib.sha256(expected).hexdigest() and size == len(expected)
         return {
-            "passed": True,
-            "message": "Decompression verified"
+            "passed": passed,
+            "message": f"Round-trip {'verified' if passed else 'FAILED'} ({elapsed:.1f} ms)"
         }
     
     def _validate_quality(self, original, compressed):
@@ -490,28 +1298,36 @@ class ValidationAI:
 
 
 class OptimizationAI:
-    """Individual AI personality for optimization"""
-    def __init__(self, id, name, specialty, personality_traits):
+    """
+    Individual AI personality for optimization. kind ("speed", "size" or
+    "quality") picks what it does; only "size" changes the content.
+    """
+    def __init__(self, id, name, specialty, personality_traits, kind):
         self.id = id
         self.name = name
         self.specialty = specialty
         self.personality_traits = personality_traits
+        self.kind = kind
+        # The minifier is a pure-Python lexer that holds the GIL
+        self.cpu_bound = kind == "size"
     
-    def optimize(self, content, original_size):
-        """Each AI suggests optimizations"""
+    def optimize(self, content, original_size, format=None):
+        """Each AI suggests optimizations (format: the eug_formats codec content came from)"""
         score = self.personality_traits.get("efficiency", 0.7)
         
-        if "speed" in self.specialty.lower():
+        if self.kind == "speed":
             return {
                 "name": self.name,
                 "recommendation": f"Fast compression (speed priority)",
                 "score": score,
                 "optimized_content": content  # Already optimized
             }
-        elif "size" in self.specialty.lower():
-            # Further size reduction
-            import re
-            optimized = re.sub(r'\s+', '', content)
+        elif self.kind == "size":
+            # Further size reduction: the aggressive minifier, which
+            # collapses whitespace only where HTML/CSS/JS don't need it
+            # (a precise specialist's output still has some to lose).
+            # A format codec's output is already its format's minimum.
+            optimized = content if format is not None else minify(content)
             return {
                 "name": self.name,
                 "recommendation": f"Maximum size reduction",
@@ -525,6 +1341,16 @@ class OptimizationAI:
                 "score": score,
                 "optimized_content": content
             }
+    
+    def output_strategy(self, compression_ai):
+        """
+        The compression strategy whose output optimize() turns
+        compression_ai's into: the minifier is idempotent, and minifying
+        a precise specialist's output gives the aggressive one.
+        """
+        if self.kind == "size" and compression_ai.format is None:
+            return "aggressive"
+        return compression_ai.strategy
 
 
 class NFTMintingAI:
@@ -551,22 +1377,153 @@ class NFTMintingAI:
         }
 
 
+def _race_entries(compression_ai, optimization_ais, validation_ais, content, deadline=None):
+    """
+    One race-mode specialist, start to finish: compress once, then for
+    each (name, optimizer) apply its suggestion and validate in the
+    given order, stopping at the first failure. Optimizers that leave the
+    output unchanged share one validation run. Past the perf_counter()
+    deadline it stops before its next optimizer or validator, leaving
+    out the unfinished entries. Returns {name: entry}.
+    """
+    start = time.perf_counter()
+    compressed = compression_ai.compress(content)
+    specialist_seconds = time.perf_counter() - start
+    checked = {}
+    entries = {}
+    for name, optimization_ai in optimization_ais:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        suggestion = optimization_ai.optimize(compressed, len(content), compression_ai.format)
+        output = suggestion['optimized_content']
+        if output not in checked:
+            validations = {}
+            for val_name, val_ai in validation_ais.items():
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return entries
+                validations[val_name] = val_ai.validate(content, output)
+                if not validations[val_name]['passed']:
+                    break
+            checked[output] = validations
+        validations = checked[output]
+        entries[name] = {
+            "output": output,
+            "suggestion": suggestion,
+            "validations": validations,
+            "validations_passed": all(r['passed'] for r in validations.values()),
+            "saved": max(0, len(content) - len(compressed)),
+            "specialist_seconds": specialist_seconds,
+            "seconds": time.perf_counter() - start,
+        }
+    return entries
+
+
+def _multi_ai_logged(orchestrator, file_path, specialist=None, race=0, budget=RACE_BUDGET):
+    """compress_with_multi_ai with its report captured, so parallel logs don't interleave"""
+    report = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(report):
+        result = orchestrator.compress_with_multi_ai(file_path, specialist, race, budget)
+    result["seconds"] = time.perf_counter() - start
+    return result, report.getvalue()
+
+
+_worker_orchestrator = None
+
+
+def _init_scheduler_worker(log_config=None):
+    # One orchestrator per worker process, fanning its specialists out
+    # inline: the scheduler already keeps every core busy
+    global _worker_orchestrator
+    configure_worker(log_config)
+    # The scheduling process owns the learned history; workers only measure
+    _worker_orchestrator = MetaAIOrchestrator(max_workers=1, history_path=None)
+
+
+def _scheduler_worker(file_path, specialist, race, budget):
+    return _multi_ai_logged(_worker_orchestrator, file_path, specialist, race, budget)
+
+
+def throughput_summary(results, elapsed):
+    """One-line files/s and tail-latency report for a scheduler run"""
+    if not results:
+        return "Throughput: no files"
+    seconds = sorted(r["seconds"] for r in results)
+    
+    def percentile(p):
+        return seconds[min(len(seconds) - 1, int(p * len(seconds)))] * 1000
+    
+    return (f"Throughput: {len(results)} files in {elapsed:.2f}s "
+            f"({len(results) / max(elapsed, 1e-9):.1f} files/s); per-file "
+            f"p50 {percentile(0.50):.0f} ms, p95 {percentile(0.95):.0f} ms, "
+            f"p99 {percentile(0.99):.0f} ms, max {seconds[-1] * 1000:.0f} ms")
+
+
 # ═══════════════════════════════════════════════════════════════════
 # USAGE
 # ═══════════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
-    import sys
+    log_mode, _ = configure(*cli_config(sys.argv))
     
-    orchestrator = MetaAIOrchestrator()
+    def option(name, default=None):
+        return next((arg.split('=', 1)[1] for arg in sys.argv[1:]
+                     if arg.startswith(f'--{name}=')), default)
     
-    if len(sys.argv) > 1:
-        file_path = sys.argv[1]
-        orchestrator.compress_with_multi_ai(file_path)
+    paths = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    # --race[=K] races the top K specialist/optimizer pairs per file
+    # (default 4) for --budget=SECONDS (default 2) and keeps the smallest
+    # verified output
+    race = int(option('race', RACE_TOP_K if '--race' in sys.argv else 0))
+    budget = float(option('budget', RACE_BUDGET))
+    # --trace=FILE appends every stage's timing span to FILE as JSON lines;
+    # --verbose / --quiet / --progress pick the output (see eug_log)
+    sink = JsonlSink(option('trace')) if option('trace') else None
+    if paths and Path(paths[0]).is_dir():
+        # Directory mode: --workers=N processes (default: one per CPU),
+        # --limit=<specialist>=N caps one specialist's files in flight
+        # (repeatable), --pattern=GLOB picks the files (default *.html)
+        workers = int(option('workers', 0)) or None
+        limits = {}
+        for arg in sys.argv[1:]:
+            if arg.startswith('--limit='):
+                key, _, count = arg.split('=', 1)[1].partition('=')
+                limits[key] = int(count)
+        with MetaAIOrchestrator(max_workers=workers, sink=sink) as orchestrator:
+            log.info(orchestrator.describe())
+            start = time.perf_counter()
+            queued = orchestrator.schedule(
+                sorted(p for p in Path(paths[0]).rglob(option('pattern', '*.html'))
+                       if p.is_file() and OUTPUT_DIR not in p.parts))
+            log.info(f"\n📋 {queued} files queued (costliest first), "
+                     f"{orchestrator.max_workers} workers")
+            # Per-file reports are captured in the workers: with --progress,
+            # replay them for their file_done events (and any warnings)
+            replay = (lambda result, text: sys.stdout.write(text)) \
+                if log_mode == "progress" else None
+            for result in orchestrator.run_queue(limits=limits, report=replay,
+                                                 race=race, budget=budget):
+                status = "✓" if result['validations_passed'] else "⚠"
+                log.info(f"   {status} {Path(result['input']).name:<40} "
+                         f"{result['compression_ai']:<28} {result['ratio']:6.1f}% "
+                         f"{result['seconds'] * 1000:7.0f} ms")
+            log.info(f"\n⏱️ {throughput_summary(orchestrator.results, time.perf_counter() - start)}")
+            log.info(f"   {stage_summary([span for r in orchestrator.results for span in r['spans']])}")
+    elif paths:
+        with MetaAIOrchestrator(sink=sink) as orchestrator:
+            log.info(orchestrator.describe())
+            result = orchestrator.compress_with_multi_ai(paths[0], race=race, budget=budget)
+            log.info(stage_summary(result["spans"]))
     else:
-        print("Usage: python multi_ai_compression.py <file_path>")
+        print("Usage: python multi_ai_compression.py <file_path> [--race[=K]] [--budget=SECONDS] "
+              "[--trace=FILE] [--verbose|--quiet|--progress]")
+        print("       python multi_ai_compression.py <directory> [--workers=N] "
+              "[--limit=<specialist>=N] [--pattern=GLOB] [--race[=K]] [--budget=SECONDS] "
+              "[--trace=FILE] [--verbose|--quiet|--progress]")
         print("\nThis system uses 22 specialized AI personalities:")
         print("• 12 Compression AIs")
         print("• 6 Validation AIs")
         print("• 3 Optimization AIs")
         print("• 1 NFT Minting AI")
+    if sink is not None:
+        sink.close()
@@ -8,11 +8,16 @@
 
 import os
 import re
+import sys
 import json
 import hashlib
 from pathlib import Path
 from datetime import datetime
 
+from eug_log import get_logger, progress, configure, cli_config
+
+log = get_logger("nft")
+
 class NFTDiscoverySystem:
     def __init__(self):
         self.author = "eugeNEOusXR"
@@ -23,9 +28,9 @@ class NFTDiscoverySystem:
         """
         Scan entire system for NFT hashes and blockchain footprints
         """
-        print("╔══════════════════════════════════════════════════════════════════╗")
-        print("║  🔍 SCANNING PIXELPRODIGY FOR NFT HASHES                         ║")
-        print("╚══════════════════════════════════════════════════════════════════╝\n")
+        log.info("╔══════════════════════════════════════════════════════════════════╗")
+        log.info("║  🔍 SCANNING PIXELPRODIGY FOR NFT HASHES                         ║")
+        log.info("╚══════════════════════════════════════════════════════════════════╝\n")
         
         nft_patterns = [
             r'Original Hash: ([a-f0-9]{64})',
@@ -69,9 +74,10 @@ class NFTDiscoverySystem:
                 "blockchain_ready": True
             })
         
-        print(f"\n✅ SCAN COMPLETE!")
-        print(f"   Total NFT-ready assets found: {len(self.nft_registry)}")
-        print(f"   Owner: {self.author}")
+        log.info(f"\n✅ SCAN COMPLETE!")
+        log.info(f"   Total NFT-ready assets found: {len(self.nft_registry)}")
+        log.info(f"   Owner: {self.author}")
+        progress(log, "scan_done", root=str(root_dir), assets=len(self.nft_registry))
         
         return self.nft_registry
     
@@ -92,7 +98,7 @@ class NFTDiscoverySystem:
                         "blockchain_ready": True
                     })
         except Exception as e:
-            print(f"   Warning: Could not scan {file_path.name}: {e}")
+            log.warning(f"   Warning: Could not scan {file_path.name}: {e}")
     
     def generate_marketplace_data(self):
         """Generate JavaScript data for marketplace integration"""
@@ -202,7 +208,8 @@ window.addEventListener('load', () => {{
                 "assets": self.nft_registry
             }, f, indent=2)
         
-        print(f"\n💾 NFT Registry saved to: {output_file}")
+        log.info(f"\n💾 NFT Registry saved to: {output_file}")
+        progress(log, "registry_saved", output=str(output_file), assets=len(self.nft_registry))
     
     def generate_skyrelics_integration(self):
         """Generate code to integrate into skyrelics.html"""
@@ -353,13 +360,13 @@ document.addEventListener('keydown', (e) => {{
     
     def display_report(self):
         """Display comprehensive NFT report"""
-        print("\n╔══════════════════════════════════════════════════════════════════╗")
-        print("║  📊 NFT COLLECTION REPORT                                        ║")
-        print("╚══════════════════════════════════════════════════════════════════╝\n")
+        log.info("\n╔══════════════════════════════════════════════════════════════════╗")
+        log.info("║  📊 NFT COLLECTION REPORT                                        ║")
+        log.info("╚══════════════════════════════════════════════════════════════════╝\n")
         
-        print(f"Owner: {self.author}")
-        print(f"Collection: PixelProdigy Universe")
-        print(f"Total Assets: {len(self.nft_registry)}\n")
+        log.info(f"Owner: {self.author}")
+        log.info(f"Collection: PixelProdigy Universe")
+        log.info(f"Total Assets: {len(self.nft_registry)}\n")
         
         # Group by type
         types = {}
@@ -367,26 +374,29 @@ document.addEventListener('keydown', (e) => {{
             asset_type = asset.get('type', 'Unknown')
             types[asset_type] = types.get(asset_type, 0) + 1
         
-        print("Assets by Type:")
+        log.info("Assets by Type:")
         for asset_type, count in sorted(types.items(), key=lambda x: x[1], reverse=True):
-            print(f"   {asset_type}: {count}")
+            log.info(f"   {asset_type}: {count}")
         
-        print(f"\n🔗 Blockchain Ready: {len([a for a in self.nft_registry if a.get('blockchain_ready')])} / {len(self.nft_registry)}")
-        print(f"💰 Estimated Value: {len(self.nft_registry) * 0.1} MATIC (@ 0.1 MATIC each)")
+        log.info(f"\n🔗 Blockchain Ready: {len([a for a in self.nft_registry if a.get('blockchain_ready')])} / {len(self.nft_registry)}")
+        log.info(f"💰 Estimated Value: {len(self.nft_registry) * 0.1} MATIC (@ 0.1 MATIC each)")
         
-        print("\n🏪 Instant Listing Options:")
-        print("   1. OpenSea (Polygon): https://opensea.io")
-        print("   2. Rarible: https://rarible.com")
-        print("   3. Built-in Marketplace (Press 'N' in game)")
+        log.info("\n🏪 Instant Listing Options:")
+        log.info("   1. OpenSea (Polygon): https://opensea.io")
+        log.info("   2. Rarible: https://rarible.com")
+        log.info("   3. Built-in Marketplace (Press 'N' in game)")
         
-        print("\n🔒 Ownership Protection:")
-        print("   ✓ All files hash-signed with your identity")
-        print("   ✓ Blockchain-ready metadata embedded")
-        print("   ✓ Usage tracking enabled")
-        print("   ✓ 10% royalty on all resales")
+        log.info("\n🔒 Ownership Protection:")
+        log.info("   ✓ All files hash-signed with your identity")
+        log.info("   ✓ Blockchain-ready metadata embedded")
+        log.info("   ✓ Usage tracking enabled")
+        log.info("   ✓ 10% royalty on all resales")
 
 
 if __name__ == "__main__":
+    # --verbose / --quiet / --progress pick the output (see eug_log)
+    configure(*cli_config(sys.argv))
+    
     # Initialize system
     nft_system = NFTDiscoverySystem()
     
@@ -401,20 +411,20 @@ if __name__ == "__main__":
     with open("skyrelics_nft_integration.html", 'w') as f:
         f.write(integration)
     
-    print(f"\n💾 SkyRelics integration code saved to: skyrelics_nft_integration.html")
-    print(f"   Copy this code into skyrelics_world.html before </body> tag")
+    log.info(f"\n💾 SkyRelics integration code saved to: skyrelics_nft_integration.html")
+    log.info(f"   Copy this code into skyrelics_world.html before </body> tag")
     
     # Generate marketplace JS
     marketplace_js = nft_system.generate_marketplace_data()
     with open("nft_marketplace.js", 'w') as f:
         f.write(marketplace_js)
     
-    print(f"\n💾 Marketplace JavaScript saved to: nft_marketplace.js")
+    log.info(f"\n💾 Marketplace JavaScript saved to: nft_marketplace.js")
     
     # Display report
     nft_system.display_report()
     
-    print("\n✅ ALL SYSTEMS READY!")
-    print("   Your NFTs are catalogued and ready for sale")
-    print("   Integration code generated for SkyRelics")
-    print(f"   Owner: {nft_system.author}")
+    log.info("\n✅ ALL SYSTEMS READY!")
+    log.info("   Your NFTs are catalogued and ready for sale")
+    log.info("   Integration code generated for SkyRelics")
+    log.info(f"   Owner: {nft_system.author}")
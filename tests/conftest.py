@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The EUG modules are top-level scripts in the repository root
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <title>EUG test page</title>
+  <style>
+    /* layout */
+    body { margin: 0 ;  color: #333 }
+    a[href^="https://"]::after { content: " ↗" }
+  </style>
+</head>
+<body>
+  <!-- navigation -->
+  <div class="nav">
+    <a href="https://example.com/a//b">Home</a> <b>bold</b> <i>italic</i>
+  </div>
+  <pre>  keep   this
+     exactly  </pre>
+  <p>Vertex ⟨1,2,3⟩ and emoji 🔷 already in the source</p>
+  <script>
+    // a comment with a // nested URL https://example.com
+    const pattern = /a\\/b[/]c/g;   // regex with slashes
+    const text = "it's // not a comment";
+    function add(a, b) {
+      return a + b
+    }
+    console.log(`template ${add(1, 2)} // kept`);
+  </script>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def page():
+    return PAGE
+
+
+@pytest.fixture
+def html_file(tmp_path):
+    path = tmp_path / "page.html"
+    path.write_text(PAGE, encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def pages(tmp_path, monkeypatch, page):
+    """Two pages in the working directory, as a batch sees them"""
+    monkeypatch.chdir(tmp_path)
+    files = []
+    for name in ("a.html", "b.html"):
+        path = tmp_path / name
+        path.write_text(page.replace("EUG test page", name), encoding='utf-8')
+        files.append(str(path))
+    return files
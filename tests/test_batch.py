@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from eug_compression_system import (EugCompressionSystem, schedule_batch, sample_size,
+                                    verify_sample, verification_summary)
+
+
+def test_schedule_starts_priority_files_then_largest_first(tmp_path):
+    files = []
+    for name, size in [("small.html", 10), ("big.html", 1000), ("index.html", 1), ("mid.html", 100)]:
+        path = tmp_path / name
+        path.write_text("x" * size, encoding='utf-8')
+        files.append(str(path))
+    order = schedule_batch(files, priority=["index.html"])
+    assert [Path(files[i]).name for i in order] == ["index.html", "big.html", "mid.html", "small.html"]
+
+
+def test_parallel_batch_reports_in_input_order(pages):
+    serial = EugCompressionSystem().compress_many(pages, "serial", workers=1,
+                                                  report=lambda *args: None)
+    reported = []
+    parallel = EugCompressionSystem().compress_many(
+        pages, "parallel", workers=2, report=lambda index, *args: reported.append(index))
+    assert reported == [0, 1]
+    assert [r['input'] for r in parallel] == pages
+    assert [r['content_hash'] for r in parallel] == [r['content_hash'] for r in serial]
+
+
+def test_verify_sample_is_reproducible():
+    files = [f"page{i}.html" for i in range(100)]
+    sample = verify_sample(files, 0.1)
+    assert len(sample) == sample_size(100, 0.1) == 10
+    assert verify_sample(files, 0.1) == sample
+    assert sorted(verify_sample(files, 1.0)) == list(range(100))
+    assert verify_sample(files, 0.0) == []
+    assert sample_size(3, 0.01) == 1
+
+
+def test_verification_summary_percentage_leaves_out_cache_hits():
+    fresh = {'verified': True, 'verify_seconds': 0.01, 'compress_seconds': 0.1}
+    hit = dict(fresh, verify_seconds=0.5, cached=True)
+    assert verification_summary([fresh, fresh]) == \
+        "Verified: 2/2 files, all passed (cost 0.02s, 10% of compression time)"
+    # Most checks were of reused files: no compression time to set them against
+    summary = verification_summary([fresh, hit, hit])
+    assert "(2 reused from the cache)" in summary
+    assert "%" not in summary
+    assert verification_summary([hit]) == \
+        "Verified: 1/1 files (1 reused from the cache), all passed (cost 0.50s)"
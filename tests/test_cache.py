@@ -0,0 +1,127 @@
+import json
+import os
+
+from eug_cache import CompressionCache, HashManifest
+from eug_compression_system import EugCompressionSystem
+
+
+def compress(system, files, cache, verify=0.0, force=False):
+    return system.compress_many(files, "out", workers=1, cache=cache, verify=verify,
+                                force=force, report=lambda *args: None)
+
+
+def test_key_depends_on_every_part():
+    keys = {CompressionCache.key(*parts) for parts in [
+        ("hash", "v1", "a.py"), ("hash2", "v1", "a.py"),
+        ("hash", "v2", "a.py"), ("hash", "v1", "b.py")]}
+    assert len(keys) == 4
+
+
+def test_second_run_is_all_hits(pages):
+    system = EugCompressionSystem()
+    first = compress(system, pages, CompressionCache())
+    assert not any(r.get('cached') for r in first)
+
+    cache = CompressionCache()
+    second = compress(system, pages, cache)
+    assert all(r['cached'] for r in second)
+    assert (cache.hits, cache.misses) == (2, 0)
+    assert [r['content_hash'] for r in second] == [r['content_hash'] for r in first]
+
+
+def test_changed_input_is_recompressed(pages):
+    system = EugCompressionSystem()
+    compress(system, pages, CompressionCache())
+    with open(pages[0], 'a', encoding='utf-8') as f:
+        f.write("<p>more</p>")
+
+    results = compress(system, pages, CompressionCache())
+    assert [bool(r.get('cached')) for r in results] == [False, True]
+
+
+def test_codec_change_is_a_miss(pages):
+    compress(EugCompressionSystem(), pages, CompressionCache())
+    results = compress(EugCompressionSystem(entropy_backend="lzma"), pages, CompressionCache())
+    assert not any(r.get('cached') for r in results)
+
+
+def test_deleted_output_is_restored_from_the_cache(pages, tmp_path):
+    compress(EugCompressionSystem(), pages, CompressionCache())
+    output = tmp_path / "out" / "a_compressed.py"
+    expected = output.read_bytes()
+    output.unlink()
+
+    results = compress(EugCompressionSystem(), pages, CompressionCache())
+    assert results[0]['cached']
+    assert output.read_bytes() == expected
+
+
+def test_force_recompresses_everything(pages):
+    system = EugCompressionSystem()
+    compress(system, pages, CompressionCache())
+    assert not any(r.get('cached') for r in compress(system, pages, CompressionCache(), force=True))
+    assert all(r['cached'] for r in compress(system, pages, CompressionCache()))
+
+
+def test_verify_applies_to_hits(pages):
+    system = EugCompressionSystem()
+    compress(system, pages, CompressionCache())
+
+    unchecked = compress(system, pages, CompressionCache())
+    assert [r['verified'] for r in unchecked] == [None, None]
+    checked = compress(system, pages, CompressionCache(), verify=1.0)
+    assert [(r['cached'], r['verified']) for r in checked] == [(True, True), (True, True)]
+
+
+def test_corrupt_hit_fails_verification_and_is_recompressed(pages, tmp_path):
+    system = EugCompressionSystem()
+    compress(system, pages, CompressionCache())
+    cache = CompressionCache()
+    # Corrupt both the cached artifact and the output it would restore
+    for path in [*(cache.objects / key for key in cache._entries),
+                 tmp_path / "out" / "a_compressed.py", tmp_path / "out" / "b_compressed.py"]:
+        data = bytearray(path.read_bytes())
+        data[-200] ^= 1
+        path.write_bytes(bytes(data))
+
+    results = compress(system, pages, cache, verify=1.0)
+    assert [(bool(r.get('cached')), r['verified']) for r in results] == [(False, True)] * 2
+    again = compress(system, pages, CompressionCache(), verify=1.0)
+    assert [(r['cached'], r['verified']) for r in again] == [(True, True)] * 2
+
+
+def test_eviction_keeps_the_cache_under_budget(pages):
+    cache = CompressionCache(max_bytes=1)
+    compress(EugCompressionSystem(), pages, cache)
+    assert len(cache) == 0
+    assert not any(cache.objects.iterdir())
+
+
+def test_manifest_skips_rehashing_unchanged_files(tmp_path):
+    path = tmp_path / "a.html"
+    path.write_text("one", encoding='utf-8')
+    # Old enough that a same-size rewrite would have changed the mtime
+    os.utime(path, ns=(0, 0))
+    manifest = HashManifest(tmp_path / "manifest.json")
+    first = manifest.hash(path)
+    assert manifest.hash(path) == first
+    assert manifest.reads == 1
+
+    path.write_text("two", encoding='utf-8')
+    assert manifest.hash(path) != first
+    assert manifest.reads == 2
+
+
+def test_manifest_drops_missing_files_on_save(tmp_path):
+    kept, gone = tmp_path / "kept.html", tmp_path / "gone.html"
+    for path in (kept, gone):
+        path.write_text(path.name, encoding='utf-8')
+    manifest = HashManifest(tmp_path / "manifest.json")
+    manifest.hash(kept)
+    manifest.hash(gone)
+    manifest.save()
+    gone.rename(tmp_path / "renamed.html")
+
+    HashManifest(tmp_path / "manifest.json").save()
+    entries = json.loads((tmp_path / "manifest.json").read_text(encoding='utf-8'))
+    assert list(entries) == [str(kept)]
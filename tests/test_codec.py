@@ -0,0 +1,222 @@
+import base64
+import random
+import runpy
+from pathlib import Path
+
+import pytest
+
+from eug_codec import (SymbolCodec, PayloadDecoder, EugContainer, EugArchive, ENTROPY_BACKENDS,
+                       CODEBOOK_VERSION, SYMBOL_ESCAPE, load_codebook, entropy_compress,
+                       entropy_compressor, entropy_decompress, entropy_decompressor,
+                       xor_bytes, read_container, verify_container)
+from eug_compression_system import EugCompressionSystem, train_dictionary
+from eug_minify import minify
+
+
+def chunks(data, seed=0, largest=7):
+    """data cut at random points, small enough to split every token somewhere"""
+    rng = random.Random(seed)
+    pos = 0
+    while pos < len(data):
+        size = rng.randint(1, largest)
+        yield data[pos:pos + size]
+        pos += size
+
+
+# ── XOR ────────────────────────────────────────────────────────────
+
+def test_xor_matches_the_byte_at_a_time_loop():
+    # Longer than one XOR_BLOCK_SIZE block, and not a multiple of the key
+    data = bytes(range(256)) * 1100 + b"x"
+    assert xor_bytes(data, b"eug") == bytes(b ^ b"eug"[i % 3] for i, b in enumerate(data))
+
+
+def test_xor_is_its_own_inverse_at_any_offset():
+    data = bytes(range(256))
+    assert xor_bytes(xor_bytes(data, b"eug"), b"eug") == data
+    # A block read from mid-payload starts at a key phase
+    assert xor_bytes(data[5:], b"eug", 5) == xor_bytes(data, b"eug")[5:]
+
+
+def test_xor_rejects_an_empty_key():
+    with pytest.raises(ValueError):
+        xor_bytes(b"x", b"")
+
+
+# ── SymbolCodec ────────────────────────────────────────────────────
+
+def test_symbol_codec_round_trip(page):
+    codec = load_codebook(CODEBOOK_VERSION)
+    encoded = codec.encode(page)
+    assert len(encoded) < len(page)
+    assert codec.decode(encoded) == page
+
+
+def test_symbol_codec_escapes_symbols_already_in_the_source():
+    codec = load_codebook(CODEBOOK_VERSION)
+    symbol = next(iter(codec.reverse_map))
+    text = f"<div>{symbol} {SYMBOL_ESCAPE} {symbol}{SYMBOL_ESCAPE}</div>"
+    assert codec.decode(codec.encode(text)) == text
+
+
+def test_symbol_codec_is_order_independent():
+    # 'form' must not be rewritten through a shorter key applied first
+    forward = SymbolCodec({"for": "🔁", "form": "📝"})
+    backward = SymbolCodec({"form": "📝", "for": "🔁"})
+    assert forward.encode("form for") == backward.encode("form for") == "📝 🔁"
+
+
+@pytest.mark.parametrize("symbol_map", [
+    {"a": "🔷", "b": "🔷"},      # duplicate symbol
+    {"": "🔷"},                 # empty key
+    {"a": "x"},                 # ASCII symbol
+    {"a": "🔷🔷"},               # more than one code point
+])
+def test_symbol_codec_rejects_ambiguous_maps(symbol_map):
+    with pytest.raises(ValueError):
+        SymbolCodec(symbol_map)
+
+
+def test_split_point_never_cuts_a_token(page):
+    codec = load_codebook(CODEBOOK_VERSION)
+    for end in range(1, len(page)):
+        cut = codec.split_point(page[:end])
+        assert codec.encode(page[:cut]) + codec.encode(page[cut:]) == codec.encode(page)
+
+
+def test_decode_split_point_never_cuts_a_token(page):
+    codec = load_codebook(CODEBOOK_VERSION)
+    symbol = next(iter(codec.reverse_map))
+    encoded = codec.encode(page + symbol + SYMBOL_ESCAPE)
+    for end in range(1, len(encoded)):
+        cut = codec.decode_split_point(encoded[:end])
+        assert codec.decode(encoded[:cut]) + codec.decode(encoded[cut:]) == codec.decode(encoded)
+
+
+# ── entropy backends ───────────────────────────────────────────────
+
+@pytest.mark.parametrize("backend", sorted(ENTROPY_BACKENDS))
+def test_entropy_backend_round_trip(backend, page):
+    data = page.encode('utf-8') * 20
+    assert entropy_decompress(entropy_compress(data, backend, 6), backend) == data
+
+    compressor = entropy_compressor(backend, 6)
+    packed = b''.join(compressor.compress(part) for part in chunks(data, largest=500))
+    packed += compressor.flush()
+    decompressor = entropy_decompressor(backend)
+    unpacked = b''.join(decompressor.decompress(part) for part in chunks(packed, largest=50))
+    assert unpacked + decompressor.flush() == data
+
+
+def test_unknown_entropy_backend():
+    with pytest.raises(ValueError):
+        entropy_compress(b"x", "brotli", 6)
+
+
+def test_trained_dictionary_helps_a_page_it_has_not_seen(page):
+    codec = load_codebook(CODEBOOK_VERSION)
+
+    def payload(i):
+        return codec.encode(page.replace("EUG test page", f"page {i}")).encode('utf-8')
+
+    zdict = train_dictionary([payload(i) for i in range(4)], size=1024)
+    assert 0 < len(zdict) <= 1024
+    data = payload(9)
+    packed = entropy_compress(data, "zlib", 9, zdict)
+    assert len(packed) < len(entropy_compress(data, "zlib", 9))
+    assert entropy_decompress(packed, "zlib", zdict) == data
+
+
+@pytest.mark.parametrize("backend", sorted(ENTROPY_BACKENDS))
+@pytest.mark.parametrize("seed", range(3))
+def test_payload_decoder_any_chunking(backend, seed, page):
+    codec = load_codebook(CODEBOOK_VERSION)
+    text = page + next(iter(codec.reverse_map)) + "é" * 10
+    payload = base64.b64encode(xor_bytes(
+        entropy_compress(codec.encode(text).encode('utf-8'), backend, 6), b"eug"))
+    decoder = PayloadDecoder(backend, CODEBOOK_VERSION, text=True)
+    html = ''.join(decoder.feed(part) for part in chunks(payload, seed))
+    assert html + decoder.flush() == text
+
+
+def test_payload_decoder_reports_truncation(page):
+    payload = base64.b64encode(xor_bytes(page.encode('utf-8'), b"eug"))
+    decoder = PayloadDecoder(text=True)
+    decoder.feed(payload[:-1])
+    with pytest.raises(ValueError):
+        decoder.flush()
+
+
+# ── generated files ────────────────────────────────────────────────
+
+@pytest.mark.parametrize("backend", sorted(ENTROPY_BACKENDS))
+@pytest.mark.parametrize("stream", [False, True])
+def test_py_wrapper_round_trip(backend, stream, html_file, tmp_path, monkeypatch, page):
+    monkeypatch.chdir(tmp_path)
+    system = EugCompressionSystem(entropy_backend=backend)
+    result = system.html_to_py(html_file, tmp_path / "out", stream=stream, chunk_size=64,
+                               verify=True)
+    assert result["verified"] is True
+
+    module = runpy.run_path(result["output"])
+    decompressor = module["EugDecompressor"]()
+    assert decompressor.decompress() == system.optimize_compression(page)
+    assert decompressor.verify()
+
+
+@pytest.mark.parametrize("backend", sorted(ENTROPY_BACKENDS))
+@pytest.mark.parametrize("stream", [False, True])
+def test_eug_container_round_trip(backend, stream, html_file, tmp_path, page):
+    system = EugCompressionSystem(entropy_backend=backend)
+    result = system.html_to_eug(html_file, tmp_path / "out", stream=stream, chunk_size=64,
+                                verify=True)
+    assert result["verified"] is True
+    assert read_container(result["output"]) == system.optimize_compression(page)
+    assert verify_container(result["output"])
+
+
+def test_eug_container_detects_corruption(html_file, tmp_path):
+    result = EugCompressionSystem().html_to_eug(html_file, tmp_path / "out")
+    path = tmp_path / "out" / "page.eug"
+    assert result["output"] == str(path)
+    data = bytearray(path.read_bytes())
+    data[-10] ^= 0xFF
+    path.write_bytes(bytes(data))
+    assert not verify_container(path)
+    with pytest.raises(Exception):
+        read_container(path)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_block_indexed_container(stream, html_file, tmp_path, page):
+    system = EugCompressionSystem(block_size=128)
+    result = system.html_to_eug(html_file, tmp_path / "out", stream=stream, chunk_size=64)
+    expected = minify(page)
+    assert read_container(result["output"]) == expected
+    with EugContainer(result["output"]) as container:
+        assert len(container.blocks) > 1
+        assert container.read() == expected
+        assert container.find("script")
+        assert container.read("script") in expected
+        assert expected.startswith(container.read_prefix(10))
+
+
+def test_archive_round_trip(tmp_path, monkeypatch, page):
+    monkeypatch.chdir(tmp_path)
+    pages = {}
+    for i, name in enumerate(["a/index.html", "b/index.html", "c.html"]):
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        pages[path] = page.replace("EUG test page", f"page {i}")
+        path.write_text(pages[path], encoding='utf-8')
+
+    archive_path = tmp_path / "pages.euga"
+    system = EugCompressionSystem()
+    results = system.build_archive(list(pages), archive_path, workers=1,
+                                   report=lambda *args: None)
+    assert all(r["output"] == str(archive_path) for r in results)
+    with EugArchive(archive_path) as archive:
+        assert sorted(archive.names()) == sorted(r["member"] for r in results)
+        for result in results:
+            expected = system.optimize_compression(pages[Path(result["input"])])
+            assert archive.read(result["member"]) == expected
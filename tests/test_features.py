@@ -0,0 +1,25 @@
+import pytest
+
+from eug_features import ContentFeatures
+
+
+def signals(features):
+    return (features.length, features.counts, features.has_threejs, features.has_webgl,
+            features.has_3d, features.style_tags)
+
+
+@pytest.mark.parametrize("size", [1, 7, 100, 4096])
+def test_any_chunking_matches_the_whole_document(page, size):
+    text = page * 20 + "new THREE.Scene(); gl_Position = vec4(0.0);"
+    chunked = ContentFeatures()
+    for start in range(0, len(text), size):
+        chunked.feed(text[start:start + size])
+    assert signals(chunked) == signals(ContentFeatures.of(text))
+
+
+def test_routing_signals(page):
+    features = ContentFeatures.of(page)
+    assert features.style_tags == 1
+    assert not features.has_threejs and not features.has_webgl
+    assert ContentFeatures.of("<script src=three.js></script>").has_threejs
+    assert ContentFeatures.of("canvas.getContext('WebGL')").has_webgl
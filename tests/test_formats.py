@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from eug_formats import (PATH_PRECISION, compact_json, compact_path, compact_svg,
+                         normalize_markdown, svg_precision)
+
+
+def test_compact_json():
+    assert compact_json('{ "a": [1, 2.5, "x  y"],\n  "b": null, "é": "ü" }') == \
+        '{"a":[1,2.5,"x  y"],"b":null,"é":"ü"}'
+
+
+def test_compact_json_refuses_duplicate_keys():
+    with pytest.raises(ValueError):
+        compact_json('{"a": 1, "a": 2}')
+
+
+def test_compact_json_keeps_a_lone_surrogate_escaped():
+    compact = compact_json('["\\ud800"]')
+    compact.encode('utf-8')
+    assert json.loads(compact) == ["\ud800"]
+
+
+def test_compact_path():
+    assert compact_path("M 10.0000 20.5 L -0.5 0.25 Z") == "M10 20.5L-.5.25Z"
+    assert compact_path("M 0.12345 0 L 1.00049 -0.0001") == "M.123 0L1 0"
+    # Arc flags may be written run together: left as they are
+    assert compact_path("M0 0 A 1 1 0 0 1 2 2") == "M0 0 A 1 1 0 0 1 2 2"
+
+
+@pytest.mark.parametrize("svg, precision", [
+    ('<svg viewBox="0 0 1000 500">', PATH_PRECISION),
+    ('<svg viewBox="0,0,24,24">', PATH_PRECISION),
+    ('<svg viewBox="0 0 1 1">', PATH_PRECISION + 1),
+    ('<svg width="1" viewBox="0 0 0.05 0.02">', PATH_PRECISION + 3),
+    ('<svg>', PATH_PRECISION),
+    ('<svg viewBox="0 0 0 0">', PATH_PRECISION),
+    ('<svg viewBox="none">', PATH_PRECISION),
+])
+def test_svg_precision_follows_the_viewbox(svg, precision):
+    assert svg_precision(svg) == precision
+
+
+def test_compact_svg_keeps_small_viewboxes_accurate():
+    path = '<path d="M 0.12345 0.5 L 0.99999 0.00001"/>'
+    assert compact_svg(f'<svg viewBox="0 0 24 24">\n  <!-- c -->\n  {path}\n</svg>') == \
+        '<svg viewBox="0 0 24 24">\n  \n  <path d="M.123.5L1 0"/>\n</svg>'
+    assert compact_svg(f'<svg viewBox="0 0 1 1">{path}</svg>') == \
+        '<svg viewBox="0 0 1 1"><path d="M.1235.5L1 0"/></svg>'
+    with pytest.raises(ValueError):
+        compact_svg("<html></html>")
+
+
+def test_normalize_markdown():
+    text = "\r\n# Title \t\r\n\r\n\r\ntext  \nmore\t\n```\n  keep  \n\n\n```\n\n\n"
+    assert normalize_markdown(text) == "# Title\n\ntext  \nmore\n```\n  keep  \n\n\n```\n"
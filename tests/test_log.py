@@ -0,0 +1,65 @@
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import eug_log
+from eug_log import get_logger, progress, configure, cli_config
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(autouse=True)
+def library_mode():
+    yield
+    eug_log.reset()
+
+
+def test_library_mode_is_silent(capsys):
+    log = get_logger("test")
+    log.info("hello")
+    progress(log, "file_done", file="a.html")
+    assert capsys.readouterr().out == ""
+
+
+def test_text_mode(capsys):
+    configure("text")
+    log = get_logger("test")
+    log.info("shown")
+    log.debug("hidden")
+    progress(log, "file_done", file="a.html")
+    assert capsys.readouterr().out == "shown\n"
+
+
+def test_progress_mode_writes_only_json_lines(capsys):
+    configure("progress", logging.WARNING)
+    log = get_logger("test")
+    log.info("narration")
+    progress(log, "file_done", file="a.html", ratio=50.0)
+    log.warning("  careful ")
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [{k: v for k, v in e.items() if k != "time"} for e in events] == [
+        {"event": "file_done", "file": "a.html", "ratio": 50.0},
+        {"event": "warning", "message": "careful"}]
+
+
+def test_cli_config():
+    assert cli_config(["tool"]) == ("text", logging.INFO)
+    assert cli_config(["tool", "--verbose"]) == ("text", logging.DEBUG)
+    assert cli_config(["tool", "--progress", "--quiet"]) == ("progress", logging.WARNING)
+    with pytest.raises(ValueError):
+        configure("xml")
+
+
+def test_closed_stdout_exits_quietly():
+    script = ("import eug_log; eug_log.configure(); log = eug_log.get_logger('test')\n"
+              "for i in range(100000): log.info('line %d', i)\n")
+    process = subprocess.Popen([sys.executable, "-c", script], cwd=ROOT,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert process.stdout.readline() == b"line 0\n"
+    process.stdout.close()
+    assert process.stderr.read() == b""
+    assert process.wait() == 1
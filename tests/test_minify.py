@@ -0,0 +1,139 @@
+import random
+
+import pytest
+
+from eug_minify import Minifier, minify
+
+
+def script(js):
+    return minify(f"<script>{js}</script>")[len("<script>"):-len("</script>")]
+
+
+def feed_in_chunks(text, seed, keep_whitespace=False):
+    rng = random.Random(seed)
+    minifier = Minifier(keep_whitespace)
+    out = []
+    pos = 0
+    while pos < len(text):
+        size = rng.randint(1, 20)
+        out.append(minifier.feed(text[pos:pos + size]))
+        pos += size
+    return ''.join(out) + minifier.flush()
+
+
+# ── HTML ───────────────────────────────────────────────────────────
+
+def test_comments_and_whitespace():
+    assert minify("<p>  a \n\n b  <!-- gone --> c</p>") == "<p> a b c</p>"
+
+
+def test_space_between_inline_tags_is_kept():
+    assert minify("<b>a</b> <i>b</i>") == "<b>a</b> <i>b</i>"
+    assert minify("<span>a</span>\n<!-- c -->\n<span>b</span>") == "<span>a</span> <span>b</span>"
+    assert minify("<p>a</p>\n<b>x</b>") == "<p>a</p> <b>x</b>"
+
+
+def test_space_between_block_tags_is_dropped():
+    assert minify("<!DOCTYPE html>\n<html>\n <body>\n  <div> <p>x</p> </div>") == \
+        "<!DOCTYPE html><html><body><div><p>x</p></div>"
+    assert minify("<tr>\n  <td>1</td>\n  <td>2</td>\n</tr>") == "<tr><td>1</td><td>2</td></tr>"
+
+
+def test_text_ending_in_a_bracket_keeps_its_space():
+    assert minify("a> <b>x</b>") == "a> <b>x</b>"
+
+
+def test_attribute_values_are_verbatim():
+    html = '<a  href="https://example.com/a//b"   title=\'two  spaces\'  >x</a>'
+    assert minify(html) == '<a href="https://example.com/a//b" title=\'two  spaces\'>x</a>'
+
+
+def test_self_closing_space_is_kept():
+    assert minify("<img src=a.png />") == "<img src=a.png />"
+
+
+@pytest.mark.parametrize("tag", ["pre", "textarea"])
+def test_raw_text_elements_are_verbatim(tag):
+    html = f"<{tag}>  a  <!-- not a comment -->\n   b </{tag}>"
+    assert minify(html) == html
+
+
+def test_non_js_script_is_verbatim():
+    shader = '<script type="x-shader/x-vertex">\n  // keep\n  void main() {}\n</script>'
+    assert minify(shader) == shader
+
+
+def test_keep_whitespace_only_drops_comments():
+    html = "<div>\n  <b>a</b>  <!-- c -->\n</div>\n"
+    assert minify(html, keep_whitespace=True) == "<div>\n  <b>a</b>  \n</div>\n"
+
+
+# ── <script> ───────────────────────────────────────────────────────
+
+def test_js_comments_are_dropped_but_not_inside_strings():
+    assert script('// line\nvar a = "x // y"; /* block */ var b = \'/* z */\';') == \
+        'var a="x // y";var b=\'/* z */\';'
+
+
+def test_js_url_in_string_is_not_a_comment():
+    assert script('fetch("https://example.com//api")') == 'fetch("https://example.com//api")'
+
+
+@pytest.mark.parametrize("js, expected", [
+    ("x = a / b / c", "x=a/b/c"),
+    ("x = /a\\/b[/]c/g.test(s)", "x=/a\\/b[/]c/g.test(s)"),
+    ("return /=+/.test(s)", "return/=+/.test(s)"),
+    ("if (x) /re/.exec(y)", "if(x)/re/.exec(y)"),
+])
+def test_js_regex_vs_division(js, expected):
+    assert script(js) == expected
+
+
+def test_js_template_literals_are_verbatim():
+    assert script("x = `a  ${ f(1,  2) }  // b`") == "x=`a  ${f(1,2)}  // b`"
+
+
+def test_js_newline_kept_where_semicolon_insertion_needs_it():
+    assert script("a = b\n(c)") == "a=b\n(c)"
+    assert script("return\nx") == "return\nx"
+    assert script("a = 1,\n  b = 2") == "a=1,b=2"
+
+
+def test_js_operators_are_not_merged():
+    assert script("a + +b; c - -d; e + ++f") == "a+ +b;c- -d;e+ ++f"
+
+
+def test_script_close_inside_a_string_ends_the_element():
+    # The browser ends the element at the first </script, string or not
+    html = '<script>var s = "</script>";</script>'
+    assert minify(html).startswith('<script>var s="</script>')
+
+
+# ── <style> ────────────────────────────────────────────────────────
+
+def test_css():
+    css = '<style>\n a > b , c { color: red ; margin:0 ; }\n /* c */ d{content:" x  y "}</style>'
+    assert minify(css) == '<style>a>b,c{color:red;margin:0}d{content:" x  y "}</style>'
+
+
+def test_css_space_before_a_colon_is_kept():
+    # "a :hover" (any hovered descendant) is not "a:hover"
+    assert minify("<style>a :hover{x:y}</style>") == "<style>a :hover{x:y}</style>"
+
+
+def test_css_url_is_verbatim():
+    assert minify("<style>a{background:url( a//b.png )}</style>") == \
+        "<style>a{background:url( a//b.png )}</style>"
+
+
+# ── streaming ──────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("keep_whitespace", [False, True])
+def test_any_chunking_matches_the_whole_document(page, seed, keep_whitespace):
+    assert feed_in_chunks(page, seed, keep_whitespace) == minify(page, keep_whitespace)
+
+
+def test_minify_is_idempotent(page):
+    assert minify(minify(page)) == minify(page)
+    assert minify(minify(page, keep_whitespace=True)) == minify(page)
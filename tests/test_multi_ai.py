@@ -0,0 +1,235 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from eug_features import ContentFeatures
+from eug_minify import minify
+from multi_ai_compression import MetaAIOrchestrator, PRIOR_FILES
+
+
+@pytest.fixture
+def orchestrator(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with MetaAIOrchestrator(max_workers=1, history_path=None, explore=0) as orchestrator:
+        yield orchestrator
+
+
+def validate(orchestrator, name, original, compressed):
+    return orchestrator.validation_ais[name].validate(original, compressed)
+
+
+# ── validators ─────────────────────────────────────────────────────
+
+def test_every_validator_kind_is_dispatched(orchestrator):
+    kinds = {name: ai.kind for name, ai in orchestrator.validation_ais.items()}
+    assert kinds == {
+        "integrity_checker": "integrity", "syntax_validator": "syntax",
+        "performance_analyzer": "performance", "security_auditor": "security",
+        "decompression_tester": "round-trip", "quality_assurance": "quality"}
+    assert [ai.cpu_bound for ai in orchestrator.validation_ais.values()].count(True) == 1
+    assert orchestrator.validation_ais["decompression_tester"].cpu_bound
+
+
+def test_minified_page_passes_every_validator(orchestrator, page):
+    results = orchestrator.run_validators(page, minify(page))
+    assert all(r['passed'] for r in results.values()), results
+
+
+def test_syntax_validator_checks_script_and_style_balance(orchestrator):
+    original = "<script>a()</script><style>b{}</style>"
+    assert validate(orchestrator, "syntax_validator", original, original)['passed']
+    assert not validate(orchestrator, "syntax_validator", original,
+                        "<script>a()<style>b{}</style>")['passed']
+    # A comment holding a whole element may go; an already unbalanced
+    # original (a tag inside a JS string) may stay as it was
+    assert validate(orchestrator, "syntax_validator",
+                    "<!-- <script>x</script> --><p>", "<p>")['passed']
+    unbalanced = "<script>document.write('<script src=a.js>')</script>"
+    assert validate(orchestrator, "syntax_validator", unbalanced, unbalanced)['passed']
+
+
+def test_performance_validator_rejects_growth_only(orchestrator, page):
+    assert validate(orchestrator, "performance_analyzer", page, page[:-1])['passed']
+    assert validate(orchestrator, "performance_analyzer", page, page)['passed']
+    result = validate(orchestrator, "performance_analyzer", page, page + " ")
+    assert not result['passed']
+    assert "Compression ratio" in result['message']
+
+
+def test_security_validator_rejects_unencodable_output(orchestrator):
+    assert validate(orchestrator, "security_auditor", "ab", "a")['passed']
+    assert not validate(orchestrator, "security_auditor", "ab", "a\ud800")['passed']
+
+
+def test_round_trip_validator(orchestrator, page):
+    assert validate(orchestrator, "decompression_tester", page, minify(page))['passed']
+
+
+def test_validators_run_cheapest_first_and_stop_at_a_failure(orchestrator, page):
+    order = orchestrator.validation_order
+    costs = [orchestrator.validation_ais[name].cost for name in order]
+    assert costs == sorted(costs)
+    assert order[-1] == "decompression_tester"
+
+    results = orchestrator.run_validators(page, page + " ")
+    assert results["performance_analyzer"]['passed'] is False
+    assert results["decompression_tester"]['passed'] is None
+
+
+# ── optimizers ─────────────────────────────────────────────────────
+
+def test_optimizer_kinds(orchestrator):
+    kinds = {name: ai.kind for name, ai in orchestrator.optimization_ais.items()}
+    assert kinds == {"speed_optimizer": "speed", "size_optimizer": "size",
+                     "quality_optimizer": "quality"}
+    assert [name for name, ai in orchestrator.optimization_ais.items() if ai.cpu_bound] == \
+        ["size_optimizer"]
+
+
+def test_only_the_size_optimizer_changes_content(orchestrator, page):
+    precise = minify(page, keep_whitespace=True)
+    results = orchestrator.run_optimizers(precise, len(page))
+    assert results["speed_optimizer"]['optimized_content'] == precise
+    assert results["quality_optimizer"]['optimized_content'] == precise
+    assert results["size_optimizer"]['optimized_content'] == minify(page)
+
+
+def test_size_optimizer_keeps_markup_intact(orchestrator):
+    optimized = orchestrator.optimization_ais["size_optimizer"].optimize(
+        '<div class=x>\n  <p>a</p>  <b>a</b> <i>b</i></div>', 40)['optimized_content']
+    assert optimized == '<div class=x><p>a</p> <b>a</b> <i>b</i></div>'
+
+
+def test_size_optimizer_leaves_format_codec_output_alone(orchestrator):
+    markdown = "# Title\n\n    code  block\n"
+    results = orchestrator.run_optimizers(markdown, len(markdown), "markdown")
+    assert all(r['optimized_content'] == markdown for r in results.values())
+
+
+# ── specialists and race mode ──────────────────────────────────────
+
+@pytest.fixture
+def padded_file(tmp_path, page):
+    """A page that is mostly comment, so every pair has plenty to save"""
+    path = tmp_path / "padded.html"
+    path.write_text(page.replace("<body>", "<body>\n  <!--" + " padding" * 500 + " -->"),
+                    encoding='utf-8')
+    return path
+
+
+@pytest.mark.parametrize("name, specialist", [
+    ("data.json", "json_specialist"),
+    ("icon.svg", "svg_specialist"),
+    ("notes.md", "markdown_specialist"),
+])
+def test_format_files_go_to_their_codec(orchestrator, tmp_path, name, specialist):
+    path = tmp_path / name
+    path.write_text('{"a": 1}' if name.endswith("json") else
+                    '<svg><path d="M 0.0001 1 L 2 3"/></svg>' if name.endswith("svg") else
+                    "# Notes\n\ntext\n", encoding='utf-8')
+    content = path.read_text(encoding='utf-8')
+    assigned = orchestrator.assign_ai(path, content)
+    assert assigned is orchestrator.compression_ais[specialist]
+    assert assigned.format is not None
+
+
+def test_race_candidates_produce_distinct_outputs(orchestrator, html_file, page):
+    features = ContentFeatures.of(page)
+    pairs = orchestrator.race_candidates(html_file, features, top_k=10)
+    outputs = [orchestrator.optimization_ais[name].output_strategy(orchestrator.compression_ais[key])
+               for key, name in pairs]
+    assert len(outputs) == len(set(outputs))
+    assert orchestrator.compression_ais[pairs[0][0]] is \
+        orchestrator.assign_ai(html_file, page, features)
+
+
+def test_race_winner_is_verified(orchestrator, padded_file):
+    result = orchestrator.compress_with_multi_ai(str(padded_file), race=4)
+    assert result['validations_passed']
+    assert result['race']['finished'] == result['race']['pairs']
+    assert result['compressed_size'] > 0
+
+
+def test_race_budget_stops_runner_ups(orchestrator, padded_file):
+    content = padded_file.read_text(encoding='utf-8')
+    features = ContentFeatures.of(content)
+    winner = orchestrator.race(padded_file, content, features, budget=0)
+    # The top-ranked specialist is always waited for
+    assert winner is not None
+    assert winner['specialist'] == orchestrator.race_candidates(padded_file, features)[0][0]
+    assert winner['race']['cancelled'] == winner['race']['pairs'] - 1
+
+
+# ── scheduler ──────────────────────────────────────────────────────
+
+def test_schedule_queues_the_costliest_file_first(orchestrator, tmp_path, page):
+    small, big = tmp_path / "small.html", tmp_path / "big.html"
+    small.write_text(page, encoding='utf-8')
+    big.write_text(page * 10, encoding='utf-8')
+    assert orchestrator.schedule([small, big]) == 2
+    assert [job[2] for job in sorted(orchestrator.task_queue)] == [str(big), str(small)]
+
+
+def test_run_queue_compresses_every_scheduled_file(orchestrator, tmp_path, page):
+    files = []
+    for name in ("a.html", "b.html"):
+        path = tmp_path / name
+        path.write_text(page, encoding='utf-8')
+        files.append(path)
+    orchestrator.schedule(files)
+    results = list(orchestrator.run_queue(workers=1))
+    assert sorted(r['input'] for r in results) == sorted(map(str, files))
+    assert not orchestrator.task_queue
+
+
+def test_run_queue_rejects_unknown_limits(orchestrator):
+    with pytest.raises(ValueError):
+        list(orchestrator.run_queue(limits={"nobody": 1}))
+
+
+# ── learning ───────────────────────────────────────────────────────
+
+def test_measured_best_strategy_takes_over(orchestrator, html_file, page):
+    features = ContentFeatures.of(page)
+    rule = orchestrator.assign_ai(html_file, page, features)
+    signature = orchestrator.content_signature(html_file, features)
+    other = next(key for key, ai in orchestrator.compression_ais.items()
+                 if ai.format is None and ai.strategy != rule.strategy)
+    ruled = next(key for key, ai in orchestrator.compression_ais.items() if ai is rule)
+    for _ in range(PRIOR_FILES):
+        for key, saved in ((ruled, 100), (other, 900)):
+            orchestrator.record_performance({
+                "signature": signature, "specialist": key, "original_size": 1000,
+                "saved": saved, "specialist_seconds": 0.01, "validations_passed": True})
+    chosen = orchestrator.assign_ai(html_file, page, features)
+    assert chosen.strategy == orchestrator.compression_ais[other].strategy
+
+
+def test_what_was_learned_is_saved(tmp_path, monkeypatch, html_file):
+    monkeypatch.chdir(tmp_path)
+    history = tmp_path / "performance.json"
+    with MetaAIOrchestrator(max_workers=1, history_path=history, explore=0) as orchestrator:
+        orchestrator.compress_with_multi_ai(str(html_file))
+        learned = orchestrator.ai_performance
+    assert learned
+    with MetaAIOrchestrator(max_workers=1, history_path=history) as reloaded:
+        assert reloaded.ai_performance == learned
+
+
+# ── a long-lived orchestrator ──────────────────────────────────────
+
+def test_construction_is_silent(capsys):
+    MetaAIOrchestrator(max_workers=1, history_path=None).close()
+    assert capsys.readouterr().out == ""
+
+
+def test_one_orchestrator_serves_concurrent_calls(orchestrator, tmp_path, page):
+    files = []
+    for i in range(4):
+        path = tmp_path / f"page{i}.html"
+        path.write_text(page.replace("EUG test page", f"page {i}"), encoding='utf-8')
+        files.append(str(path))
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(orchestrator.compress_with_multi_ai, files))
+    assert [r['input'] for r in results] == files
+    assert all(r['validations_passed'] for r in results)
@@ -0,0 +1,32 @@
+import gzip
+
+from eug_minify import minify
+from eug_static import build_static, choose_variant
+
+
+def test_variants_decode_to_the_minified_page(html_file, tmp_path, page):
+    output = tmp_path / "static"
+    manifest, rebuilt = build_static([html_file], output, workers=1)
+    assert rebuilt == 1
+    entry = manifest["files"]["page.html"]
+    expected = minify(page).encode('utf-8')
+    assert (output / entry["path"]).read_bytes() == expected
+    assert gzip.decompress((output / entry["variants"]["gzip"]["path"]).read_bytes()) == expected
+
+
+def test_only_changed_pages_are_rebuilt(html_file, tmp_path):
+    output = tmp_path / "static"
+    build_static([html_file], output, workers=1)
+    assert build_static([html_file], output, workers=1)[1] == 0
+    html_file.write_text(html_file.read_text(encoding='utf-8') + "<p>more</p>", encoding='utf-8')
+    assert build_static([html_file], output, workers=1)[1] == 1
+
+
+def test_choose_variant_picks_the_smallest_accepted():
+    entry = {"path": "a.html", "variants": {"gzip": {"path": "a.html.gz", "size": 10},
+                                            "br": {"path": "a.html.br", "size": 8}}}
+    assert choose_variant(entry, "gzip, deflate") == ("a.html.gz", "gzip")
+    assert choose_variant(entry, "br;q=0, *") == ("a.html.gz", "gzip")
+    assert choose_variant(entry, "*") == ("a.html.br", "br")
+    assert choose_variant(entry, "gzip;q=0") == ("a.html", None)
+    assert choose_variant(entry, None) == ("a.html", None)
@@ -0,0 +1,50 @@
+import json
+
+from eug_trace import Trace, MemorySink, JsonlSink, stage_summary
+from multi_ai_compression import MetaAIOrchestrator
+
+
+def test_span_records_time_and_bytes():
+    sink = MemorySink()
+    trace = Trace(sink, file="a.html")
+    with trace.span("read", bytes_in=10) as extra:
+        extra["bytes_out"] = 4
+    trace.fields["specialist_id"] = 3
+    with trace.span("write"):
+        pass
+    assert sink.records == trace.records
+    read, write = trace.records
+    assert (read["file"], read["stage"], read["bytes_in"], read["bytes_out"]) == \
+        ("a.html", "read", 10, 4)
+    assert "specialist_id" not in read and write["specialist_id"] == 3
+    assert read["seconds"] >= 0 and write["start"] >= read["start"]
+
+
+def test_jsonl_sink_writes_one_record_per_line(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    with JsonlSink(path) as sink:
+        trace = Trace(sink, file="a.html")
+        for stage in ("read", "compress"):
+            with trace.span(stage):
+                pass
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)["stage"] for line in lines] == ["read", "compress"]
+
+
+def test_stage_summary():
+    records = [{"file": "a", "stage": "read", "seconds": 1.0},
+               {"file": "b", "stage": "compress", "seconds": 3.0},
+               {"file": "b", "stage": "read", "seconds": 0.0}]
+    assert stage_summary(records) == "Stages over 2 files, 4.00s: read 1.00s (25%), compress 3.00s (75%)"
+    assert stage_summary([]) == "Stages: no spans"
+
+
+def test_multi_ai_results_carry_their_spans(tmp_path, monkeypatch, html_file):
+    monkeypatch.chdir(tmp_path)
+    sink = MemorySink()
+    with MetaAIOrchestrator(max_workers=1, history_path=None, sink=sink) as orchestrator:
+        result = orchestrator.compress_with_multi_ai(str(html_file))
+    stages = [record["stage"] for record in result["spans"]]
+    assert stages[0] == "read" and "compress" in stages and stages[-1] == "write"
+    assert sink.records == result["spans"]
+    assert {record["file"] for record in sink.records} == {str(html_file)}